@@ -0,0 +1,85 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Compares the number of fitness evaluations needed to guess a word with the different survivor
+strategies of the engine.
+
+Usage:
+    python -m benchmarks.elitism [runs]
+"""
+import statistics
+import string
+import sys
+from random import Random
+from typing import Callable, List, Optional
+
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.operations.replacement import comma_selection, plus_selection
+
+TARGET = "genyal"
+POPULATION_SIZE = 32
+MAX_GENERATIONS = 1000
+
+
+def generational(engine: GenyalEngine) -> None:
+    pass
+
+
+def elitism(engine: GenyalEngine) -> None:
+    engine.elitism = 2
+
+
+def plus(engine: GenyalEngine) -> None:
+    engine.survivor_selection = plus_selection
+
+
+def comma(engine: GenyalEngine) -> None:
+    engine.survivor_selection = comma_selection
+    engine.offspring_size = 2 * POPULATION_SIZE
+
+
+STRATEGIES = {"generational": generational, "elitism (2)": elitism, "(mu + lambda)": plus,
+              "(mu, lambda)": comma}
+
+
+def evaluations_to_target(configure: Callable[[GenyalEngine], None], seed: int) -> Optional[int]:
+    """
+    The number of evaluations needed to find the target word with a given configuration, or None
+    if it wasn't found in MAX_GENERATIONS generations.
+    """
+    evaluations = 0
+
+    def fitness(genes: List[str]) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        return sum(gene == expected for gene, expected in zip(genes, TARGET))
+
+    def finished(engine: GenyalEngine) -> bool:
+        return "".join(engine.fittest.genes) == TARGET or engine.generation >= MAX_GENERATIONS
+
+    random_generator = Random(seed)
+    engine = GenyalEngine(random_generator, fitness, terminating_function=finished)
+    configure(engine)
+    factory = GeneFactory(lambda: random_generator.choice(string.ascii_lowercase))
+    engine.create_population(POPULATION_SIZE, len(TARGET), factory, 0.8)
+    engine.evolve()
+    return evaluations if "".join(engine.fittest.genes) == TARGET else None
+
+
+def main(runs: int = 50) -> None:
+    print(f"{'strategy':<16}{'solved':>10}{'mean':>10}{'median':>10}")
+    for name, configure in STRATEGIES.items():
+        results = [evaluations_to_target(configure, seed) for seed in range(0, runs)]
+        solved = [result for result in results if result is not None]
+        mean = f"{statistics.mean(solved):.0f}" if solved else "-"
+        median = f"{statistics.median(solved):.0f}" if solved else "-"
+        print(f"{name:<16}{f'{len(solved)}/{runs}':>10}{mean:>10}{median:>10}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,185 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Benchmark suite for the engine and the genetic operators.
+
+Runs the standard workloads (see: benchmarks.workloads) over a sweep of population sizes, genome
+lengths and evaluation backends, and micro-benchmarks the crossover, mutation and selection
+operators.
+Results can be saved as a JSON baseline and later runs compared against it.
+
+Usage:
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json --tolerance 0.1
+"""
+import argparse
+import json
+import sys
+import time
+from random import Random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.workloads import WORKLOADS, numpy
+from genyal.evaluation import Evaluator, ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from genyal.operations.crossover import single_point_crossover
+from genyal.operations.evolution import tournament_selection
+from genyal.operations.mutation import simple_mutation, sparse_mutation
+
+# "array" evolves gene pools with batch fitness functions on the calling thread.
+BACKENDS: Dict[str, Callable[[], Evaluator]] = {
+    "serial": SerialEvaluator, "threads": lambda: ThreadPoolEvaluator(4),
+    "processes": lambda: ProcessPoolEvaluator(4), "array": SerialEvaluator}
+
+Result = Dict[str, Any]
+
+
+def run_workload(name: str, population_size: int, genome_length: int, backend: str,
+                 generations: int, repeat: int, seed: int = 0) -> Optional[Result]:
+    """
+    Evolves a workload for a number of generations, keeping the fastest of repeat runs.
+    Returns None if the workload doesn't support the backend.
+    """
+    best_seconds, evaluations = None, 0
+    for _ in range(0, repeat):
+        with BACKENDS[backend]() as evaluator:
+            engine = WORKLOADS[name](population_size, genome_length, evaluator, seed,
+                                     backend == "array")
+            if engine is None:
+                return None
+            initial_evaluations = engine.evaluations
+            start = time.perf_counter()
+            engine.evolve(generations)
+            seconds = time.perf_counter() - start
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds, evaluations = seconds, engine.evaluations - initial_evaluations
+    return {"benchmark": "workload", "workload": name, "backend": backend,
+            "population_size": population_size, "genome_length": genome_length,
+            "generations": generations, "seconds": best_seconds,
+            "generations_per_second": generations / best_seconds,
+            "evaluations_per_second": evaluations / best_seconds}
+
+
+def run_operator(name: str, genome_length: int, calls: int, repeat: int) -> Result:
+    """Measures the number of calls per second of a genetic operator."""
+    random_generator = Random(0)
+    population = Individual.create(64, genome_length, GeneFactory(random_generator.random), 0.5)
+    for individual in population:
+        individual.fitness = random_generator.random()
+        individual.random_generator = random_generator
+    operations = {
+        "single_point_crossover": lambda idx: single_point_crossover(
+            population[idx % 64], population[(idx + 1) % 64]),
+        "simple_mutation": lambda idx: simple_mutation(population[idx % 64]),
+        "sparse_mutation": lambda idx: sparse_mutation(population[idx % 64]),
+        "tournament_selection": lambda _: tournament_selection(population, random_generator)}
+    operation = operations[name]
+    best_seconds = None
+    for _ in range(0, repeat):
+        start = time.perf_counter()
+        for idx in range(0, calls):
+            operation(idx)
+        seconds = time.perf_counter() - start
+        best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+    return {"benchmark": "operator", "operator": name, "genome_length": genome_length,
+            "calls": calls, "seconds": best_seconds, "calls_per_second": calls / best_seconds}
+
+
+OPERATORS = ("single_point_crossover", "simple_mutation", "sparse_mutation",
+             "tournament_selection")
+# The throughput measures of each kind of benchmark, used to compare against a baseline.
+METRICS = {"workload": ("generations_per_second", "evaluations_per_second"),
+           "operator": ("calls_per_second",)}
+
+
+def key(result: Result) -> Tuple:
+    """The configuration of a benchmark, which identifies it on a baseline."""
+    return tuple((name, value) for name, value in sorted(result.items())
+                 if not isinstance(value, float))
+
+
+def compare(results: Sequence[Result], baseline: Sequence[Result],
+            tolerance: float) -> List[Tuple[Result, str, float]]:
+    """
+    Compares the throughput of each result against the baseline.
+    Returns the (result, metric, ratio) of every measure slower than the baseline by more than the
+    tolerance (e.g. 0.1 for 10%).
+    """
+    reference = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        expected = reference.get(key(result))
+        if expected is None:
+            continue
+        for metric in METRICS[result["benchmark"]]:
+            ratio = result[metric] / expected[metric] if expected[metric] else float("inf")
+            if ratio < 1 - tolerance:
+                regressions.append((result, metric, ratio))
+    return regressions
+
+
+def describe(result: Result) -> str:
+    """A one-line description of a result."""
+    if result["benchmark"] == "operator":
+        return (f"{result['operator']:<24} n={result['genome_length']:<6}"
+                f"{result['calls_per_second']:>14,.0f} calls/s")
+    return (f"{result['workload']:<10}{result['backend']:<10}"
+            f"pop={result['population_size']:<6}n={result['genome_length']:<6}"
+            f"{result['generations_per_second']:>10,.1f} gen/s"
+            f"{result['evaluations_per_second']:>14,.0f} eval/s")
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=WORKLOADS)
+    parser.add_argument("--backends", nargs="+", default=["serial", "threads", "array"],
+                        choices=BACKENDS)
+    parser.add_argument("--population-sizes", nargs="+", type=int, default=[32, 256])
+    parser.add_argument("--genome-lengths", nargs="+", type=int, default=[16, 128])
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--operators", nargs="*", default=list(OPERATORS), choices=OPERATORS)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="File where the results are saved as JSON.")
+    parser.add_argument("--baseline", help="JSON file with the results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Allowed slowdown relative to the baseline (default: 0.1).")
+    options = parser.parse_args(arguments)
+
+    backends = [backend for backend in options.backends if backend != "array" or numpy is not None]
+    results = []
+    for name in options.workloads:
+        for backend in backends:
+            for population_size in options.population_sizes:
+                for genome_length in options.genome_lengths:
+                    result = run_workload(name, population_size, genome_length, backend,
+                                          options.generations, options.repeat)
+                    if result is not None:
+                        print(describe(result), flush=True)
+                        results.append(result)
+    for name in options.operators:
+        for genome_length in options.genome_lengths:
+            result = run_operator(name, genome_length, options.calls, options.repeat)
+            print(describe(result), flush=True)
+            results.append(result)
+
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if options.baseline:
+        with open(options.baseline) as file:
+            regressions = compare(results, json.load(file), options.tolerance)
+        for result, metric, ratio in regressions:
+            print(f"REGRESSION {describe(result)}: {metric} at {ratio:.0%} of the baseline")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Standard workloads used by the benchmark suite.
+
+Each workload is a function that receives the size of the population, the length of the genomes,
+the evaluator and a seed, and returns an engine with an initial population.
+Fitness functions are defined at the top level so they can be sent to worker processes.
+"""
+import math
+import string
+from random import Random
+from typing import Callable, Dict, List, Optional, Sequence
+
+from genyal.engine import GenyalEngine
+from genyal.evaluation import Evaluator, batch_fitness
+from genyal.genotype import GeneFactory
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+Workload = Callable[[int, int, Evaluator, int, bool], GenyalEngine]
+
+
+# region : Fitness functions
+def onemax_fitness(genes: Sequence[int]) -> float:
+    return sum(genes)
+
+
+def word_fitness(genes: Sequence[str], target: str) -> float:
+    return sum(gene == expected for gene, expected in zip(genes, target))
+
+
+def sphere_fitness(genes: Sequence[float]) -> float:
+    return -sum(gene * gene for gene in genes)
+
+
+def rastrigin_fitness(genes: Sequence[float]) -> float:
+    return -(10 * len(genes)
+             + sum(gene * gene - 10 * math.cos(2 * math.pi * gene) for gene in genes))
+
+
+def tour_fitness(tour: Sequence[int], distances: List[List[float]]) -> float:
+    return -sum(distances[tour[idx - 1]][tour[idx]] for idx in range(0, len(tour)))
+
+
+@batch_fitness(as_array=True)
+def onemax_batch_fitness(genomes):
+    return genomes.sum(axis=1)
+
+
+@batch_fitness(as_array=True)
+def word_batch_fitness(genomes, target: str):
+    return (genomes == numpy.array(list(target))).sum(axis=1)
+
+
+@batch_fitness(as_array=True)
+def sphere_batch_fitness(genomes):
+    return -(genomes * genomes).sum(axis=1)
+
+
+@batch_fitness(as_array=True)
+def rastrigin_batch_fitness(genomes):
+    return -(10 * genomes.shape[1]
+             + (genomes * genomes - 10 * numpy.cos(2 * numpy.pi * genomes)).sum(axis=1))
+
+
+# endregion
+
+
+# region : Permutation operators
+def order_crossover(individual, partner):
+    """
+    The order crossover (OX1) for permutations: the child keeps a random slice of the individual
+    and the rest of the positions are filled with the missing genes in the order of the partner.
+    """
+    random_generator = individual.random_generator
+    start, end = sorted(random_generator.sample(range(0, len(individual) + 1), 2))
+    kept = individual[start:end]
+    missing = set(kept)
+    rest = [gene for gene in partner if gene not in missing]
+    return individual.offspring(rest[:start] + kept + rest[start:])
+
+
+def swap_mutation(individual):
+    """Swaps two random genes of a permutation with a probability equal to the mutation rate."""
+    genes = list(individual)
+    random_generator = individual.random_generator
+    if random_generator.random() < individual.mutation_rate:
+        first, second = random_generator.sample(range(0, len(genes)), 2)
+        genes[first], genes[second] = genes[second], genes[first]
+    return individual.offspring(genes)
+
+
+def permutation_factory(length: int, random_generator: Random) -> GeneFactory[int]:
+    """A factory whose consecutive groups of length genes are random permutations."""
+    genes: List[int] = []
+
+    def next_gene() -> int:
+        if not genes:
+            genes.extend(random_generator.sample(range(0, length), length))
+        return genes.pop()
+
+    return GeneFactory(next_gene)
+
+
+# endregion
+
+
+# region : Workloads
+def onemax(population_size: int, genome_length: int, evaluator: Evaluator, seed: int,
+           array: bool = False) -> GenyalEngine:
+    """Maximize the number of ones of a bit string."""
+    random_generator = Random(seed)
+    engine = GenyalEngine(random_generator, onemax_batch_fitness if array else onemax_fitness,
+                          evaluator=evaluator)
+    engine.create_population(population_size, genome_length,
+                             GeneFactory(lambda: random_generator.randint(0, 1)), 0.9,
+                             dtype=numpy.int8 if array else None)
+    return engine
+
+
+def word(population_size: int, genome_length: int, evaluator: Evaluator, seed: int,
+         array: bool = False) -> GenyalEngine:
+    """Guess a random word (like the example of the README)."""
+    random_generator = Random(seed)
+    target = "".join(random_generator.choice(string.ascii_lowercase)
+                     for _ in range(0, genome_length))
+    engine = GenyalEngine(random_generator, word_batch_fitness if array else word_fitness,
+                          evaluator=evaluator)
+    engine.fitness_function_args = (target,)
+    engine.create_population(population_size, genome_length,
+                             GeneFactory(lambda: random_generator.choice(string.ascii_lowercase)),
+                             0.9, dtype="<U1" if array else None)
+    return engine
+
+
+def sphere(population_size: int, genome_length: int, evaluator: Evaluator, seed: int,
+           array: bool = False) -> GenyalEngine:
+    """Minimize the sum of squares of a vector of floats."""
+    return _real_valued(sphere_batch_fitness if array else sphere_fitness, population_size,
+                        genome_length, evaluator, seed, array)
+
+
+def rastrigin(population_size: int, genome_length: int, evaluator: Evaluator, seed: int,
+              array: bool = False) -> GenyalEngine:
+    """Minimize the (multimodal) Rastrigin function over a vector of floats."""
+    return _real_valued(rastrigin_batch_fitness if array else rastrigin_fitness, population_size,
+                        genome_length, evaluator, seed, array)
+
+
+def tsp(population_size: int, genome_length: int, evaluator: Evaluator, seed: int,
+        array: bool = False) -> Optional[GenyalEngine]:
+    """
+    Find the shortest tour through random cities on the unit square (genome_length cities).
+    Permutations aren't supported by gene pools, so there's no array version of this workload.
+    """
+    if array:
+        return None
+    random_generator = Random(seed)
+    cities = [(random_generator.random(), random_generator.random())
+              for _ in range(0, genome_length)]
+    distances = [[math.dist(origin, destination) for destination in cities] for origin in cities]
+    engine = GenyalEngine(random_generator, tour_fitness, evaluator=evaluator)
+    engine.fitness_function_args = (distances,)
+    engine.create_population(population_size, genome_length,
+                             permutation_factory(genome_length, random_generator), 0.5)
+    for individual in engine.population:
+        individual.crossover_strategy = order_crossover
+        individual.mutation_strategy = swap_mutation
+    return engine
+
+
+def _real_valued(fitness_function, population_size: int, genome_length: int,
+                 evaluator: Evaluator, seed: int, array: bool) -> GenyalEngine:
+    random_generator = Random(seed)
+    engine = GenyalEngine(random_generator, fitness_function, evaluator=evaluator)
+    engine.create_population(population_size, genome_length,
+                             GeneFactory(lambda: random_generator.uniform(-5.12, 5.12)), 0.9,
+                             dtype=numpy.float64 if array else None)
+    return engine
+
+
+WORKLOADS: Dict[str, Workload] = {"onemax": onemax, "word": word, "sphere": sphere,
+                                  "rastrigin": rastrigin, "tsp": tsp}
+# endregion
@@ -0,0 +1,172 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from genyal.core import GeneticsError
+from genyal.individuals import Individual
+
+
+class FitnessCache:
+    """
+    A memo of the fitness of the genomes that have already been evaluated.
+
+    Entries are keyed by the gene sequence together with the fitness function arguments, so two
+    individuals with the same genes are never scored twice while they remain in the cache.
+    When the cache is full the least recently used entry is discarded.
+    """
+    __entries: 'OrderedDict[Hashable, float]'
+    __hits: int
+    __max_size: Optional[int]
+    __misses: int
+
+    def __init__(self, max_size: Optional[int] = 65536):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size:
+                The maximum number of genomes kept in the cache.
+                If None, the cache grows without bounds.
+        """
+        if max_size is not None and max_size <= 0:
+            raise GeneticsError(f"The size of the cache should be positive. Got: {max_size}.")
+        self.__entries = OrderedDict()
+        self.__max_size = max_size
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def key(genes: Sequence[Any], args: Tuple = ()) -> Optional[Hashable]:
+        """
+        Returns the key of a genome, or None if the genes or arguments can't be hashed.
+        """
+        key = (tuple(genes), args)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Optional[Hashable]) -> Optional[float]:
+        """Returns the fitness stored for a key (or None if it's not in the cache)."""
+        fitness = self.__entries.get(key) if key is not None else None
+        if fitness is None:
+            self.__misses += 1
+        else:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+        return fitness
+
+    def put(self, key: Optional[Hashable], fitness: float) -> None:
+        """Stores the fitness of a key, evicting the least recently used entry if needed."""
+        if key is None or fitness is None:
+            return
+        self.__entries[key] = fitness
+        self.__entries.move_to_end(key)
+        if self.__max_size is not None and len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def evaluate(self, individuals: Sequence[Individual],
+                 evaluate: Callable[[List[Individual]], None], args: Tuple = ()) -> None:
+        """
+        Computes the fitness of the unevaluated individuals, taking it from the cache when possible.
+
+        Individuals sharing the same genes within the sequence are evaluated only once.
+
+        Args:
+            individuals:
+                The individuals to evaluate.
+            evaluate:
+                A function that computes the fitness of a list of individuals (e.g. an evaluator
+                bound to the fitness function).
+            args:
+                The arguments of the fitness function, which are part of the cache keys.
+        """
+        pending, uncacheable = self.__lookup(individuals, args)
+        evaluate([group[0] for group in pending.values()] + uncacheable)
+        self.__store(pending)
+
+    async def evaluate_async(self, individuals: Sequence[Individual],
+                             evaluate: Callable[[List[Individual]], Awaitable[None]],
+                             args: Tuple = ()) -> None:
+        """
+        Asynchronous version of evaluate, where the function that computes the fitness of the
+        individuals missing from the cache is a coroutine function.
+        """
+        pending, uncacheable = self.__lookup(individuals, args)
+        await evaluate([group[0] for group in pending.values()] + uncacheable)
+        self.__store(pending)
+
+    def __lookup(self, individuals: Sequence[Individual], args: Tuple) \
+            -> Tuple[Dict[Hashable, List[Individual]], List[Individual]]:
+        """
+        Takes the fitness of the unevaluated individuals from the cache when possible.
+        Returns the individuals that still need to be evaluated, grouped by key, and the ones that
+        can't be cached.
+        """
+        pending: Dict[Hashable, List[Individual]] = {}
+        uncacheable = []
+        for individual in individuals:
+            if individual.fitness is not None:
+                continue
+            key = self.key(individual.genes, args)
+            if key in pending:
+                self.__hits += 1
+                pending[key].append(individual)
+                continue
+            fitness = self.get(key)
+            if fitness is not None:
+                individual.fitness = fitness
+            elif key is None:
+                uncacheable.append(individual)
+            else:
+                pending[key] = [individual]
+        return pending, uncacheable
+
+    def __store(self, pending: Dict[Hashable, List[Individual]]) -> None:
+        """Stores the fitness of the evaluated groups and shares it with the rest of each group."""
+        for key, group in pending.items():
+            fitness = group[0].fitness
+            self.put(key, fitness)
+            for individual in group[1:]:
+                individual.fitness = fitness
+
+    def clear(self) -> None:
+        """Removes every entry of the cache and resets its counters."""
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """The maximum number of genomes kept in the cache."""
+        return self.__max_size
+
+    @property
+    def hits(self) -> int:
+        """The number of times a fitness was taken from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The number of times a genome wasn't found in the cache."""
+        return self.__misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the lookups that were found in the cache."""
+        lookups = self.__hits + self.__misses
+        return self.__hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        """The number of genomes currently in the cache."""
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
@@ -0,0 +1,153 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from genyal.core import GeneticsError
+
+# Identifies the files written by write_checkpoint, followed by the version of the format.
+MAGIC = b"GENYAL\x00CKPT"
+VERSION = 1
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def write_checkpoint(path: PathLike, state: Dict[str, Any]) -> None:
+    """
+    Writes the state of an engine to a binary file, atomically.
+
+    The state is first written to a temporary file on the same directory, which then replaces the
+    checkpoint, so a process killed in the middle of a write never leaves a corrupt checkpoint.
+    Gene and fitness arrays are written as raw buffers (pickle protocol 5), so the cost of a
+    checkpoint is about the cost of copying the population once.
+
+    Args:
+        path:
+            the file where the checkpoint is written.
+        state:
+            the state of the engine (see: GenyalEngine.save_checkpoint).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(MAGIC)
+            file.write(bytes((VERSION,)))
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def read_checkpoint(path: PathLike) -> Dict[str, Any]:
+    """
+    Reads the state of an engine written by write_checkpoint.
+    Checkpoints are unpickled, so they should only be read from trusted sources.
+    """
+    with open(path, "rb") as file:
+        header = file.read(len(MAGIC) + 1)
+        if header[:len(MAGIC)] != MAGIC:
+            raise CheckpointError(f"{path} is not a checkpoint.")
+        if header[len(MAGIC):] != bytes((VERSION,)):
+            raise CheckpointError(f"{path} was written with an unsupported checkpoint version.")
+        return pickle.load(file)
+
+
+def read_genomes(path: PathLike) -> List[Sequence[Any]]:
+    """
+    Reads the genes of the population saved on a checkpoint, fittest first, so they can seed the
+    population of a new run (see: GenyalEngine.create_population).
+    """
+    state = read_checkpoint(path)
+    genes, fitness = state["genes"], [float(value) for value in state["fitness"]]
+    # Unevaluated members (NaN fitness) go last.
+    order = sorted(range(0, len(fitness)),
+                   key=lambda idx: -fitness[idx] if fitness[idx] == fitness[idx] else math.inf)
+    return [genes[idx].tolist() if hasattr(genes[idx], "tolist") else genes[idx]
+            for idx in order]
+
+
+class Checkpointer:
+    """
+    Decides when an engine should write a checkpoint.
+
+    The engine calls the checkpointer after every generation (see: GenyalEngine.checkpointer) and
+    a checkpoint is written on every generation that is a multiple of the given number of
+    generations, or once the given number of seconds have passed since the last checkpoint.
+    """
+    __clock: Callable[[], float]
+    __generations: Optional[int]
+    __last_time: float
+    __path: PathLike
+    __seconds: Optional[float]
+    __write_time: float
+
+    def __init__(self, path: PathLike, generations: Optional[int] = None,
+                 seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes the checkpointer.
+
+        Args:
+            path:
+                the file where the checkpoints are written (each one replaces the previous one).
+            generations:
+                the number of generations between two checkpoints.
+            seconds:
+                the number of seconds between two checkpoints.
+            clock:
+                the function used to measure the time.
+        """
+        if generations is None and seconds is None:
+            raise GeneticsError("A checkpoint interval (in generations or seconds) is needed.")
+        if generations is not None and generations < 1:
+            raise GeneticsError(f"The checkpoint interval should be positive. Got: {generations}.")
+        self.__path = path
+        self.__generations = generations
+        self.__seconds = seconds
+        self.__clock = clock
+        self.__last_time = clock()
+        self.__write_time = 0.0
+
+    def __call__(self, engine) -> bool:
+        """Writes a checkpoint of the engine if it's due. Returns True if one was written."""
+        due_by_generations = self.__generations is not None and \
+            engine.generation % self.__generations == 0
+        due_by_time = self.__seconds is not None and \
+            self.__clock() - self.__last_time >= self.__seconds
+        if not (due_by_generations or due_by_time):
+            return False
+        start = self.__clock()
+        engine.save_checkpoint(self.__path)
+        self.__last_time = self.__clock()
+        self.__write_time = self.__last_time - start
+        return True
+
+    @property
+    def path(self) -> PathLike:
+        """The file where the checkpoints are written."""
+        return self.__path
+
+    @property
+    def write_time(self) -> float:
+        """The number of seconds it took to write the last checkpoint."""
+        return self.__write_time
+
+
+class CheckpointError(GeneticsError):
+    """If a checkpoint can't be read"""
+
+    def __init__(self, cause: str):
+        super(CheckpointError, self).__init__(cause)
@@ -13,6 +13,7 @@ DNA = TypeVar("DNA")
 
 class GenyalCore:
     """Base for the elements involved in a genetic algorithm's population."""
+    __slots__ = ("_random_generator",)
     _random_generator: Random
 
     def __init__(self, random_generator: Random):
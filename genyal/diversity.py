@@ -0,0 +1,117 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+from collections import Counter
+from random import Random
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# A population's genomes: a sequence of gene sequences (e.g. individuals) or a 2-D numpy array.
+Genomes = Sequence[Sequence[Any]]
+
+
+class Diversity(NamedTuple):
+    """
+    The genotypic diversity of a population, as computed by the diversity function.
+
+    Attributes:
+        unique_genomes:
+            The number of distinct genomes.
+        mean_hamming_distance:
+            The mean number of loci where two (different) members of the population differ.
+        mean_entropy:
+            The mean of the entropies of the loci.
+        locus_entropy:
+            The Shannon entropy (in bits) of the genes found at each locus; 0 means that every
+            member has the same gene there.
+    """
+    unique_genomes: int
+    mean_hamming_distance: float
+    mean_entropy: float
+    locus_entropy: List[float]
+
+
+def diversity(genomes: Genomes) -> Diversity:
+    """
+    Measures the diversity of a population in O(N L) for N genomes of L genes (O(N L log N) for
+    numpy arrays, which are sorted column by column).
+
+    Every metric is derived from the number of times each gene appears at each locus, so the mean
+    Hamming distance is exact without comparing every pair of genomes: at a locus where the genes
+    appear c_1, ..., c_k times, the number of pairs that differ is (N^2 - sum(c_i^2)) / 2.
+    Genes must be hashable (or stored in a numpy array).
+    """
+    size = len(genomes)
+    if size == 0:
+        return Diversity(0, math.nan, math.nan, [])
+    if numpy is not None and isinstance(genomes, numpy.ndarray):
+        entropies, squared_counts = _array_locus_counts(genomes)
+        unique = len({row.tobytes() for row in numpy.ascontiguousarray(genomes)}) \
+            if genomes.dtype != object else len(set(map(tuple, genomes.tolist())))
+    else:
+        entropies, squared_counts = [], []
+        for column in zip(*genomes):
+            counts = Counter(column).values()
+            entropies.append(-sum(count / size * math.log2(count / size) for count in counts))
+            squared_counts.append(sum(count * count for count in counts))
+        unique = len(set(map(tuple, genomes)))
+    pairs = size * (size - 1)
+    hamming = sum(size * size - squares for squares in squared_counts) / pairs if pairs else 0.0
+    mean_entropy = sum(entropies) / len(entropies) if entropies else math.nan
+    return Diversity(unique, hamming, mean_entropy, list(entropies))
+
+
+def _array_locus_counts(genomes):
+    """
+    Returns the entropy and the sum of the squared gene counts of each column of a 2-D array.
+    The columns are sorted, so equal genes form runs whose lengths are the counts.
+    """
+    size, loci = genomes.shape
+    if loci == 0:
+        return [], []
+    ordered = numpy.sort(genomes, axis=0)
+    boundaries = numpy.ones((size + 1, loci), dtype=bool)
+    boundaries[1:size] = ordered[1:] != ordered[:-1]
+    # Positions of the boundaries on the column-major layout, so each column is contiguous.
+    positions = numpy.flatnonzero(boundaries.T)
+    columns = positions // (size + 1)
+    same_column = columns[:-1] == columns[1:]
+    counts = numpy.diff(positions)[same_column]
+    columns = columns[:-1][same_column]
+    frequencies = counts / size
+    entropies = numpy.bincount(columns, weights=-frequencies * numpy.log2(frequencies),
+                               minlength=loci)
+    squared_counts = numpy.bincount(columns, weights=counts * counts.astype(float),
+                                    minlength=loci)
+    # Adding 0.0 turns the -0.0 entropy of constant columns into 0.0.
+    return (entropies + 0.0).tolist(), squared_counts.tolist()
+
+
+def sampled_hamming_distance(genomes: Genomes, pairs: int = 1000,
+                             random_generator: Optional[Random] = None) -> float:
+    """
+    Estimates the mean Hamming distance of a population from a number of random pairs of
+    (different) members, in O(pairs L).
+    Unlike diversity, it only compares genes for equality, so they don't need to be hashable.
+    """
+    size = len(genomes)
+    if size < 2 or pairs <= 0:
+        return 0.0 if size >= 2 else math.nan
+    random_generator = Random() if random_generator is None else random_generator
+    total = 0
+    for _ in range(0, pairs):
+        first, second = random_generator.sample(range(0, size), 2)
+        if numpy is not None and isinstance(genomes, numpy.ndarray):
+            total += int(numpy.count_nonzero(genomes[first] != genomes[second]))
+        else:
+            total += sum(a != b for a, b in zip(genomes[first], genomes[second]))
+    return total / pairs
@@ -5,13 +5,39 @@ Creative Commons Attribution 4.0 International License.
 You should have received a copy of the license along with this
 work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 """
+import asyncio
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from copy import copy
 from random import Random
-from typing import Any, Callable, List, Optional, Tuple
+from typing import (Any, AsyncIterator, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    Optional, Sequence, Tuple, Union)
 
-from genyal.core import GenyalCore
+from genyal.cache import FitnessCache
+from genyal.checkpoint import (Checkpointer, PathLike, read_checkpoint, read_genomes,
+                               write_checkpoint)
+from genyal.core import GeneticsError, GenyalCore
+from genyal.diversity import Diversity, diversity
+from genyal.evaluation import AsyncEvaluator, Evaluator, SerialEvaluator
 from genyal.genotype import GeneFactory
-from genyal.individuals import Individual
-from genyal.operations.evolution import default_terminating_function, tournament_selection
+from genyal.individuals import Individual, fitness_key
+from genyal.instrumentation import Instrumentation
+from genyal.multiobjective import MultiObjective
+from genyal.operations.crossover import batch_single_point_crossover, single_point_crossover
+from genyal.operations.evolution import (batch_tournament_selection, default_terminating_function,
+                                         tournament_selection)
+from genyal.operations.mutation import IN_PLACE_MUTATIONS, batch_simple_mutation, simple_mutation
+from genyal.operations.replacement import insert_sorted, replace_worst, worst_heap
+from genyal.population import GenePool
+from genyal.ranking import best_index, ranking_order, top_indices
+from genyal.summary import GenerationSummary, fitness_statistics
+from genyal.surrogate import Screening, Surrogate
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class GenyalEngine(GenyalCore):
@@ -21,35 +47,72 @@ class GenyalEngine(GenyalCore):
     """
     __fitness_function_args: Tuple
     __factory_generator_args: Tuple
+    __batch_crossover_strategy: Optional[Callable[..., Any]]
+    __batch_mutation_strategy: Callable[..., Any]
+    __batch_selection_strategy: Optional[Callable[..., List[int]]]
+    __checkpointer: Optional[Checkpointer]
+    __copy_parents: bool
     __crossover_args: Tuple
+    __diversity: Optional[Diversity]
+    __elitism: int
+    __evaluations: int
+    __evaluator: Evaluator
+    __fitness_cache: Optional[FitnessCache]
     __fitness_function: Callable[[List[Any]], float]
+    __fitness_statistics: Optional[Tuple[float, float, float]]
+    __fitness_values: Sequence[float]
     __fittest: Optional[Individual]
+    __gene_pool: Optional[GenePool]
     __generations: int
+    __instrumentation: Optional[Instrumentation]
+    __multi_objective: Optional[MultiObjective]
     __mutation_args: List[Any]
+    __offspring_size: Optional[int]
     __population: List[Individual]
     __selection_args: List[Any]
     __selection_strategy: Callable[..., Individual]
+    __sort_population: bool
+    __steady_state_size: Optional[int]
+    __surrogate: Optional[Surrogate]
+    __survivor_selection: Optional[Callable[..., List[Individual]]]
+    __worst_heap: Optional[List[Tuple[float, int]]]
     __terminating_function: Callable[..., bool]
 
-    def __init__(self, random_generator: Random = Random(),
+    def __init__(self, random_generator: Optional[Random] = None,
                  fitness_function: Callable[..., float] = lambda _: 0,
                  selection_strategy=tournament_selection,
-                 terminating_function=default_terminating_function):
+                 terminating_function=default_terminating_function,
+                 evaluator: Evaluator = SerialEvaluator(),
+                 fitness_cache: Optional[FitnessCache] = None):
         """
         Initializes the values of the engine.
 
         Args:
             random_generator:
                 The random number generator used by the engine.
+                If none given, the engine creates its own (see also: genyal.streams.RandomStreams
+                to derive reproducible generators for several engines from a single seed).
             fitness_function:
                 The function to calculate the fitness of the population's individuals.
                 If none given, the default function returns 0 for any individual.
+                A batch fitness function (see: genyal.evaluation.BatchFitness) can be given to
+                compute the fitness of each generation with a single call.
             selection_strategy:
                 The strategy to select the individuals that will participate in the crossover.
             terminating_function:
                 The function that will decide when to stop the evolution.
+                See genyal.operations.termination for composable criteria (stagnation, target
+                fitness, budgets and the collapse of the fitness spread or the diversity).
+            evaluator:
+                The strategy used to compute the fitness of each generation (see:
+                genyal.evaluation).
+                Defaults to evaluating the individuals one at a time.
+            fitness_cache:
+                An optional cache to avoid computing the fitness of the same genes more than once
+                (see: genyal.cache.FitnessCache).
         """
-        super(GenyalEngine, self).__init__(random_generator)
+        super(GenyalEngine, self).__init__(Random() if random_generator is None
+                                           else random_generator)
         self.__population = []
         self.__fitness_function = fitness_function
         self.__fitness_function_args = ()
@@ -61,12 +124,35 @@ class GenyalEngine(GenyalCore):
         self.__terminating_function = terminating_function
         self.__generations = 0
         self.__factory_generator_args = ()
+        self.__evaluator = evaluator
+        self.__fitness_cache = fitness_cache
+        self.__gene_pool = None
+        self.__batch_selection_strategy = None
+        self.__copy_parents = False
+        self.__sort_population = True
+        self.__fitness_values = []
+        self.__fitness_statistics = None
+        self.__diversity = None
+        self.__batch_crossover_strategy = batch_single_point_crossover
+        self.__batch_mutation_strategy = batch_simple_mutation
+        self.__steady_state_size = None
+        self.__worst_heap = None
+        self.__elitism = 0
+        self.__survivor_selection = None
+        self.__offspring_size = None
+        self.__checkpointer = None
+        self.__evaluations = 0
+        self.__multi_objective = None
+        self.__surrogate = None
+        self.__instrumentation = None
 
     def create_population(self, population_size: int, individual_size: int,
-                          gene_factory: GeneFactory, mutation_rate=0.01):
+                          gene_factory: GeneFactory, mutation_rate=0.01, dtype=None,
+                          seeds: Union[PathLike, Iterable[Sequence], None] = None):
         """
         Creates a new population for the engine.
-        The new population is then sorted according to the individual's fitness
+        The new population is then sorted according to the individual's fitness (unless
+        sort_population is disabled).
 
         Args:
             mutation_rate:
@@ -76,63 +162,736 @@ class GenyalEngine(GenyalCore):
                 The number of genes of each member.
             gene_factory:
                 The factory to create the genes of each individual
+            dtype:
+                If given, the genes of the population are stored in a numpy array of this data
+                type (see: genyal.population.GenePool).
+                Otherwise, each individual keeps its genes in a list.
+            seeds:
+                Genomes (e.g. produced by a heuristic) used as the first members of the
+                population, or the path of a checkpoint whose fittest members are used instead
+                (see: genyal.checkpoint.read_genomes).
+                The rest of the population is generated by the gene factory.
+        """
+        self.__replace_population(
+            self.__initial_population(population_size, individual_size, gene_factory,
+                                      mutation_rate, dtype, seeds))
+
+    async def create_population_async(self, population_size: int, individual_size: int,
+                                      gene_factory: GeneFactory, mutation_rate=0.01,
+                                      dtype=None,
+                                      seeds: Union[PathLike, Iterable[Sequence], None] = None) \
+            -> None:
+        """
+        Asynchronous version of create_population, which evaluates the new population without
+        blocking the event loop (see: evolve_async).
         """
-        self.__population = Individual.create(population_size, individual_size, gene_factory,
-                                              mutation_rate, *self.__factory_generator_args)
-        for member in self.__population:
-            member.compute_fitness_using(self.__fitness_function, *self.__fitness_function_args)
-        self.__population.sort()
-        self.__fittest = self.__population[-1]
+        population = self.__initial_population(population_size, individual_size, gene_factory,
+                                               mutation_rate, dtype, seeds)
+        await self.__evaluate_async(population)
+        self.__install_population(population)
+
+    def __initial_population(self, population_size: int, individual_size: int,
+                             gene_factory: GeneFactory, mutation_rate: float, dtype: Any,
+                             seeds: Union[PathLike, Iterable[Sequence], None]) -> List[Individual]:
+        """Creates the (unevaluated) members of a new population."""
+        if isinstance(seeds, (str, os.PathLike)):
+            seeds = read_genomes(seeds)
+        if dtype is None:
+            self.__gene_pool = None
+            return Individual.create(population_size, individual_size, gene_factory,
+                                     mutation_rate, *self.__factory_generator_args, seeds=seeds,
+                                     random_generator=self._random_generator)
+        self.__gene_pool = GenePool.create(population_size, individual_size, gene_factory, dtype,
+                                           mutation_rate, seeds, self._random_generator)
+        return self.__gene_pool.individuals()
 
     def evolve(self, *args):
         """
         Evolves the population until the condition given by the terminating function is met.
         By default, the population will evolve until it reaches 100 generations.
 
+        In steady-state mode (see: steady_state_size), the evaluator keeps steady_state_size
+        offspring in evaluation at all times and each one is inserted in the population as soon as
+        its fitness is known, so the workers of a pool never wait for the slowest evaluation of a
+        generation.
+
+        Args:
+            *args:
+                The arguments passed to the terminating function.
+        """
+        for _ in self.__evolution(*args):
+            pass
+
+    def generations(self, *args) -> Iterator[GenerationSummary]:
+        """
+        Evolves the population like evolve, lazily yielding a summary of each generation (see:
+        genyal.summary.GenerationSummary).
+        The engine doesn't keep the summaries, so the caller decides whether to log, store or
+        discard them, and it can stop the evolution at any point by leaving the loop.
+
         Args:
             *args:
                 The arguments passed to the terminating function.
         """
+        start = time.perf_counter()
+        generation_start, evaluations = start, self.__evaluations
+        for _ in self.__evolution(*args):
+            yield self.__summary(generation_start, start, evaluations)
+            generation_start, evaluations = time.perf_counter(), self.__evaluations
+
+    def __evolution(self, *args) -> Iterator[None]:
+        """Evolves the population until the terminating function says so, yielding after each
+        generation."""
+        if self.__steady_state_size is not None:
+            yield from self.__steady_state_generations(*args)
+            return
         while not self.__terminating_function(self, *args):
-            new_population = []
-            for _ in range(0, len(self.__population)):
-                child = self.__create_offspring()
-                new_population.append(child)
-            new_population.sort()
-            self.__population = new_population
-            self.__fittest = new_population[-1]
-            self.__generations += 1
+            self.step()
+            yield
+
+    def __summary(self, generation_start: float, start: float,
+                  evaluations: int) -> GenerationSummary:
+        """
+        Summarizes the current generation from the cached fitness statistics, so a terminating
+        function that reads them doesn't make the summary go over the fitness again.
+        """
+        now = time.perf_counter()
+        best, mean, std = self.__statistics()
+        return GenerationSummary(self.__generations, best, mean, std,
+                                 self.__evaluations - evaluations, self.__evaluations,
+                                 now - generation_start, now - start)
+
+    def step(self) -> None:
+        """Evolves the population a single generation (ignoring the terminating function)."""
+        self.__start_generation()
+        if self.__steady_state_size is not None:
+            self.__begin_steady_state()
+            offspring = self.__create_offspring(self.__steady_state_size)
+            self.__evaluate(offspring)
+            self.__insert_all(offspring)
+            self.__end_steady_state()
+            return
+        offspring = self.__breed(self.__number_of_offspring())
+        self.__evaluate(offspring)
+        self.__install_population(self.__survivors(offspring))
+        self.__end_generation()
+
+    async def evolve_async(self, *args) -> None:
+        """
+        Evolves the population until the condition given by the terminating function is met,
+        evaluating each generation without blocking the event loop.
+
+        Meant for fitness functions bound by latency rather than computation (e.g. requests to a
+        model server or a simulator): with an AsyncEvaluator, coroutine fitness functions are
+        awaited with bounded concurrency and an optional timeout.
+        Other evaluators run on the loop's default executor.
+        Cancelling the task running the evolution cancels the pending fitness computations.
+
+        Args:
+            *args:
+                The arguments passed to the terminating function.
+        """
+        async for _ in self.generations_async(*args):
+            pass
+
+    async def step_async(self) -> None:
+        """Asynchronous version of step."""
+        self.__start_generation()
+        if self.__steady_state_size is not None:
+            self.__begin_steady_state()
+            offspring = self.__create_offspring(self.__steady_state_size)
+            await self.__evaluate_async(offspring)
+            self.__insert_all(offspring)
+            self.__end_steady_state()
+            return
+        offspring = self.__breed(self.__number_of_offspring())
+        await self.__evaluate_async(offspring)
+        self.__install_population(self.__survivors(offspring))
+        self.__end_generation()
+
+    async def generations_async(self, *args) -> AsyncIterator[GenerationSummary]:
+        """
+        Evolves the population like evolve_async, yielding a summary of each generation (as
+        generations does), so the progress can be followed with ``async for``.
+
+        Args:
+            *args:
+                The arguments passed to the terminating function.
+        """
+        start = time.perf_counter()
+        generation_start, evaluations = start, self.__evaluations
+        while not self.__terminating_function(self, *args):
+            await self.step_async()
+            yield self.__summary(generation_start, start, evaluations)
+            generation_start, evaluations = time.perf_counter(), self.__evaluations
+
+    def __breed(self, size: int) -> List[Individual]:
+        """
+        Creates a number of (unevaluated) offspring.
+        If the population is array-backed, the offspring become the engine's gene pool (the
+        members of the current population stay valid, since they are views over the previous one).
+        """
+        if self.__gene_pool is None:
+            return self.__create_offspring(size)
+        if self.__batch_crossover_strategy is not None:
+            self.__gene_pool = self.__create_pool_offspring(size)
+        else:
+            self.__gene_pool = self.__gene_pool.from_individuals(self.__create_offspring(size))
+        return self.__gene_pool.individuals()
+
+    def __number_of_offspring(self) -> int:
+        """The number of offspring created on each generation."""
+        if self.__survivor_selection is not None and self.__offspring_size is not None:
+            return self.__offspring_size
+        return max(0, len(self.__population) - self.__elitism)
+
+    def __survivors(self, offspring: List[Individual]) -> List[Individual]:
+        """
+        Returns the members of the next generation: the elites of the current population followed
+        by the offspring (or by the individuals chosen by the survivor selection strategy).
+        The survivors are used by reference, so their fitness isn't computed again.
+        """
+        if self.__elitism == 0 and self.__survivor_selection is None:
+            return offspring
+        start = Instrumentation.clock() if self.__instrumentation is not None else 0.0
+        elite_indices = self.__elite_indices(self.__elitism)
+        elites = [self.__population[idx] for idx in elite_indices]
+        if self.__survivor_selection is None:
+            survivors = elites + offspring
+        else:
+            excluded = set(elite_indices)
+            parents = [member for idx, member in enumerate(self.__population)
+                       if idx not in excluded]
+            survivors = elites + self.__survivor_selection(
+                parents, offspring, len(self.__population) - len(elites))
+        if self.__gene_pool is not None:
+            self.__gene_pool = self.__gene_pool.from_individuals(survivors)
+            survivors = self.__gene_pool.individuals()
+        if self.__instrumentation is not None:
+            self.__instrumentation.add_time("replacement", Instrumentation.clock() - start)
+        return survivors
+
+    def __start_generation(self) -> None:
+        """Notifies the instrumentation (if any) that a generation starts."""
+        if self.__instrumentation is not None:
+            self.__instrumentation.start_generation(self)
+
+    def __end_generation(self) -> None:
+        """Counts a finished generation and writes a checkpoint if it's due."""
+        self.__generations += 1
+        if self.__checkpointer is not None:
+            self.__checkpointer(self)
+        if self.__instrumentation is not None:
+            self.__instrumentation.end_generation(self)
+
+    def save_checkpoint(self, path: PathLike) -> None:
+        """
+        Writes the state of the engine (the genes, fitness and objectives of the population, the
+        generation and the state of the random number generator) to a binary file, atomically.
+        The configuration of the engine (fitness function, strategies, etc.) isn't part of the
+        checkpoint.
+        """
+        objectives = None
+        if self.__gene_pool is not None:
+            genes, fitness = self.__gene_pool.genes, self.__gene_pool.fitness
+            mutation_rate = self.__gene_pool.mutation_rate
+        else:
+            genes = [member.genes for member in self.__population]
+            fitness = list(self.__fitness_values)
+            mutation_rate = self.__population[0].mutation_rate if self.__population else 0.01
+            if self.__multi_objective is not None:
+                objectives = [member.objectives for member in self.__population]
+        write_checkpoint(path, {"generation": self.__generations, "genes": genes,
+                                "fitness": fitness, "mutation_rate": mutation_rate,
+                                "objectives": objectives,
+                                "random_state": self._random_generator.getstate()})
+
+    def resume(self, path: PathLike, gene_factory: GeneFactory,
+               crossover_strategy=single_point_crossover,
+               mutation_strategy=simple_mutation) -> None:
+        """
+        Restores the state of the engine from a checkpoint (see: save_checkpoint).
+        The population isn't evaluated again, and an engine configured like the one that wrote the
+        checkpoint continues the evolution exactly as the original would have (as long as every
+        random choice, including the ones of the gene factory, is made with the engine's random
+        number generator).
+
+        Args:
+            path:
+                The checkpoint file.
+            gene_factory:
+                The factory used to create the genes of the individuals.
+            crossover_strategy:
+                The function to perform the crossover between the individuals.
+            mutation_strategy:
+                The function to perform the mutation of the individuals.
+        """
+        state = read_checkpoint(path)
+        if isinstance(state["genes"], list):
+            self.__gene_pool = None
+            population = []
+            # Checkpoints of single-objective populations don't have objectives.
+            objectives = state.get("objectives") or [None] * len(state["genes"])
+            for genes, fitness, member_objectives in zip(state["genes"], state["fitness"],
+                                                         objectives):
+                individual = Individual(genes, state["mutation_rate"], gene_factory,
+                                        crossover_strategy, mutation_strategy,
+                                        self._random_generator)
+                individual.fitness = fitness
+                individual.objectives = member_objectives
+                population.append(individual)
+        else:
+            self.__gene_pool = GenePool(state["genes"], state["mutation_rate"], gene_factory,
+                                        crossover_strategy, mutation_strategy,
+                                        self._random_generator, state["fitness"])
+            population = self.__gene_pool.individuals()
+        self._random_generator.setstate(state["random_state"])
+        self.__generations = state["generation"]
+        self.__install_population(population)
+
+    def immigrate(self, immigrants: Sequence[Individual]) -> None:
+        """
+        Replaces the least fit members of the population with a group of immigrants (e.g. the ones
+        coming from another population).
+        Immigrants that haven't been evaluated are evaluated with the engine's fitness function.
+        The immigrants of a multi-objective population keep their objectives, and are ranked again
+        along with the rest of the population.
+        """
+        if not immigrants:
+            return
+        if self.__multi_objective is not None and any(
+                immigrant.fitness is not None and immigrant.objectives is None
+                for immigrant in immigrants):
+            raise GeneticsError("The evaluated immigrants of a multi-objective population should "
+                                "have their objectives.")
+        new_population = list(self.__population)
+        for idx, immigrant in zip(ranking_order(self.__fitness_values), immigrants):
+            new_population[idx] = immigrant
+        if self.__gene_pool is not None:
+            self.__gene_pool = self.__gene_pool.from_individuals(new_population)
+            new_population = self.__gene_pool.individuals()
+        self.__replace_population(new_population)
 
     def crossover(self, partner_a: Individual, partner_b: Individual, *args) -> Individual:
         """Performs a crossover between two individuals and returns the offspring."""
-        partner_a.random_generator = self._random_generator
-        return partner_a.crossover(partner_b, *args)
+        return self.__own(partner_a).crossover(partner_b, *args)
 
     def mutate(self, individual: Individual, *args) -> Individual:
         """Mutates an individual and returns the result of the mutation."""
-        individual.random_generator = self.random_generator
-        return individual.mutate(*args)
+        return self.__own(individual).mutate(*args)
+
+    def __own(self, individual: Individual) -> Individual:
+        """
+        Returns the individual if it uses the engine's random number generator, or a copy of it that
+        does otherwise.
+        The members of the population (and their offspring) share the engine's generator, so only
+        individuals coming from elsewhere are copied; the individuals themselves are never changed,
+        since they may be shared with other engines.
+        """
+        if individual.random_generator is self._random_generator:
+            return individual
+        own = copy(individual)
+        own.random_generator = self._random_generator
+        return own
+
+    def __mutate_child(self, child: Individual, partner_a: Individual,
+                       partner_b: Individual) -> Individual:
+        """
+        Mutates a child created by crossover.
+        A new child belongs to no one else, so the built-in strategies mutate it in place instead of
+        creating another individual; children returned by reference by a custom crossover (e.g. one
+        of the partners) are mutated like any other individual.
+        """
+        strategy = child.mutation_strategy
+        if (strategy in IN_PLACE_MUTATIONS and child is not partner_a and child is not partner_b
+                and type(child) is Individual
+                and child.random_generator is self._random_generator):
+            return strategy(child, *self.__mutation_args, in_place=True)
+        return self.mutate(child, *self.__mutation_args)
+
+    def __create_offspring(self, size: Optional[int] = None) -> List[Individual]:
+        """
+        Creates the offspring of the current (list-based) population.
+        The partners of each couple are selected from the population and each child is obtained via
+        crossover and mutation.
+        Selected partners are used by reference (unless copy_parents is set), so the only new
+        individuals are the ones created by the crossover and mutation strategies.
+
+        Args:
+            size:
+                The number of children to create (defaults to the size of the population).
+        """
+        if size is None:
+            size = len(self.__population)
+        instrumentation, clock = self.__instrumentation, Instrumentation.clock
+        start = clock() if instrumentation is not None else 0.0
+        if self.__batch_selection_strategy is None:
+            parents = None
+        else:
+            parents = [self.__population[idx] for idx in self.__batch_selection_strategy(
+                self.__fitness_values, 2 * size, self._random_generator, *self.__selection_args)]
+        if instrumentation is not None:
+            instrumentation.add_time("selection", clock() - start)
+        offspring = []
+        for i in range(0, size):
+            if instrumentation is not None:
+                start = clock()
+            if parents is None:
+                partner_a = self.__selection_strategy(self.__population, self._random_generator,
+                                                      *self.__selection_args)
+                partner_b = self.__selection_strategy(self.__population, self._random_generator,
+                                                      *self.__selection_args)
+            else:
+                partner_a, partner_b = parents[2 * i], parents[2 * i + 1]
+            if self.__copy_parents:
+                partner_a, partner_b = copy(partner_a), copy(partner_b)
+            if instrumentation is None:
+                offspring.append(self.__mutate_child(
+                    self.crossover(partner_a, partner_b, *self.__crossover_args),
+                    partner_a, partner_b))
+                continue
+            selected = clock()
+            child = self.crossover(partner_a, partner_b, *self.__crossover_args)
+            crossed = clock()
+            offspring.append(self.__mutate_child(child, partner_a, partner_b))
+            instrumentation.add_time("selection", selected - start)
+            instrumentation.add_time("crossover", crossed - selected)
+            instrumentation.add_time("mutation", clock() - crossed)
+        if instrumentation is not None:
+            instrumentation.count("offspring", size)
+            instrumentation.count("copies", 2 * size if self.__copy_parents else 0)
+        return offspring
+
+    def __create_pool_offspring(self, size: int) -> GenePool:
+        """
+        Creates a whole generation of offspring for an array-backed population.
+        The parents are selected all at once and the crossover and mutation are applied over the
+        genes of every child with a single call to the batch strategies.
+        """
+        pool = self.__gene_pool
+        instrumentation, clock = self.__instrumentation, Instrumentation.clock
+        start = clock() if instrumentation is not None else 0.0
+        # A numpy generator seeded from the engine's generator keeps the runs reproducible.
+        random_generator = numpy.random.default_rng(self._random_generator.getrandbits(64))
+        selection_strategy = self.__batch_selection_strategy or batch_tournament_selection
+        # The tournaments draw their candidates in bulk from the numpy generator; other strategies
+        # get the engine's generator.
+        parents = numpy.asarray(selection_strategy(
+            pool.fitness, 2 * size,
+            random_generator if selection_strategy is batch_tournament_selection
+            else self._random_generator, *self.__selection_args))
+        selected = clock() if instrumentation is not None else 0.0
+        offspring = self.__batch_crossover_strategy(pool.genes, parents[0::2], parents[1::2],
+                                                    random_generator)
+        crossed = clock() if instrumentation is not None else 0.0
+        offspring = self.__batch_mutation_strategy(offspring, pool.mutation_rate,
+                                                   pool.gene_factory, random_generator)
+        if instrumentation is not None:
+            instrumentation.add_time("selection", selected - start)
+            instrumentation.add_time("crossover", crossed - selected)
+            instrumentation.add_time("mutation", clock() - crossed)
+            instrumentation.count("offspring", size)
+        return pool.like(offspring)
+
+    def __steady_state_generations(self, *args) -> Iterator[None]:
+        """
+        Evolves the population in steady-state mode, keeping steady_state_size offspring in
+        evaluation and inserting each one as soon as its evaluation is done (yielding after each
+        generation).
+        A generation ends once steady_state_size offspring have been inserted (or discarded).
+        Evaluations still running when the terminating condition is met are cancelled.
+        """
+        pending: Dict[Future, Tuple[Individual, Optional[Hashable]]] = {}
+        try:
+            while not self.__terminating_function(self, *args):
+                self.__start_generation()
+                self.__begin_steady_state()
+                inserted = 0
+                while inserted < self.__steady_state_size:
+                    while len(pending) < self.__steady_state_size:
+                        child = self.__create_offspring(1)[0]
+                        pending[self.__submit(child)] = child, self.__cache_key(child)
+                    start = Instrumentation.clock()
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    if self.__instrumentation is not None:
+                        self.__instrumentation.add_time("evaluation",
+                                                        Instrumentation.clock() - start)
+                    # The children are inserted in the order they were created, so a run with an
+                    # evaluator that computes the fitness right away is reproducible.
+                    evaluated = []
+                    for future in [future for future in pending if future in done]:
+                        child, key = pending.pop(future)
+                        child.fitness = future.result()
+                        if self.__fitness_cache is not None:
+                            self.__fitness_cache.put(key, child.fitness)
+                        evaluated.append(child)
+                    if self.__instrumentation is not None:
+                        self.__instrumentation.evaluated(self, evaluated)
+                    self.__insert_all(evaluated)
+                    inserted += len(evaluated)
+                self.__end_steady_state()
+                yield
+        finally:
+            for future in pending:
+                future.cancel()
 
-    def __create_offspring(self):
+    def __submit(self, child: Individual) -> Future:
+        """Starts the evaluation of a child, unless its fitness is in the engine's cache."""
+        if self.__fitness_cache is not None:
+            fitness = self.__fitness_cache.get(self.__cache_key(child))
+            if fitness is not None:
+                if self.__instrumentation is not None:
+                    self.__instrumentation.count("cache_hits")
+                future = Future()
+                future.set_result(fitness)
+                return future
+        self.__evaluations += 1
+        if self.__instrumentation is not None:
+            self.__instrumentation.count("evaluations")
+        return self.__evaluator.submit(child, self.__fitness_function,
+                                       *self.__fitness_function_args)
+
+    def __cache_key(self, child: Individual) -> Optional[Hashable]:
+        """The key of a child on the engine's cache (None if there's no cache)."""
+        if self.__fitness_cache is None:
+            return None
+        return self.__fitness_cache.key(child.genes, self.__fitness_function_args)
+
+    def __begin_steady_state(self) -> None:
+        """
+        Prepares the population to receive offspring one at a time, with the fitness values kept
+        as a list parallel to the population (and a heap of the worst members if it's unsorted).
+        """
+        if self.__multi_objective is not None:
+            raise GeneticsError("Multi-objective populations can't evolve in steady-state mode.")
+        self.__population = list(self.__population)
+        if self.__gene_pool is not None:
+            self.__fitness_values = self.__fitness_values.tolist()
+        self.__worst_heap = None if self.__sort_population else worst_heap(self.__fitness_values)
+
+    def __insert_all(self, offspring: List[Individual]) -> None:
+        """Replaces the least fit members of the population with evaluated children, one by one."""
+        start = Instrumentation.clock() if self.__instrumentation is not None else 0.0
+        for child in offspring:
+            if self.__sort_population:
+                insert_sorted(self.__population, self.__fitness_values, child)
+            else:
+                replace_worst(self.__population, self.__fitness_values, self.__worst_heap, child)
+        self.__fitness_statistics = None
+        self.__diversity = None
+        if self.__instrumentation is not None:
+            self.__instrumentation.add_time("replacement", Instrumentation.clock() - start)
+
+    def __end_steady_state(self) -> None:
+        """Installs the population that received the offspring of a steady-state generation."""
+        self.__worst_heap = None
+        population = self.__population
+        if self.__gene_pool is not None:
+            self.__gene_pool = self.__gene_pool.from_individuals(population)
+            population = self.__gene_pool.individuals()
+        self.__install_population(population)
+        self.__end_generation()
+
+    def __replace_population(self, new_population: List[Individual]) -> None:
+        """Evaluates a new generation and makes it the population of the engine."""
+        self.__evaluate(new_population)
+        self.__install_population(new_population)
+
+    def __install_population(self, new_population: List[Individual]) -> None:
+        """
+        Makes an evaluated generation the population of the engine.
+        The generation is sorted by fitness only if sort_population is set; otherwise the fittest
+        individual is found with a linear scan over the fitness values.
+        If the population is array-backed, the members of the new generation must belong to the
+        engine's gene pool.
+        """
+        start = Instrumentation.clock() if self.__instrumentation is not None else 0.0
+        if self.__multi_objective is not None:
+            if self.__gene_pool is not None:
+                raise GeneticsError("Multi-objective populations can't be array-backed.")
+            self.__multi_objective.rank(new_population)
+        if self.__gene_pool is not None:
+            if self.__sort_population:
+                self.__gene_pool = self.__gene_pool.sorted()
+                new_population = self.__gene_pool.individuals()
+            self.__fitness_values = self.__gene_pool.fitness
+        else:
+            if self.__sort_population:
+                new_population.sort(key=fitness_key)
+            self.__fitness_values = [member.fitness for member in new_population]
+        self.__population = new_population
+        self.__fitness_statistics = None
+        self.__diversity = None
+        self.__fittest = new_population[
+            -1 if self.__sort_population else best_index(self.__fitness_values)]
+        if self.__instrumentation is not None:
+            self.__instrumentation.add_time("sorting", Instrumentation.clock() - start)
+
+    def elites(self, count: int) -> List[Individual]:
+        """
+        Returns the count fittest individuals of the population, from the fittest to the least fit.
+        If the population isn't sorted, they are found in O(n log count).
         """
-        Creates an offspring from a couple.
-        The partners are selected from the population and the offspring is obtained via crossover
-        and mutation.
+        return [self.__population[idx] for idx in self.__elite_indices(count)]
+
+    def __elite_indices(self, count: int) -> List[int]:
+        """The indices of the count fittest members of the population, from the fittest."""
+        if self.__sort_population:
+            size = len(self.__population)
+            return list(range(size - 1, size - 1 - min(max(count, 0), size), -1))
+        return top_indices(self.__fitness_values, count)
+
+    def __evaluate(self, individuals: List[Individual]) -> None:
+        """
+        Computes the fitness of a whole generation using the engine's evaluator.
+        With a surrogate, only the individuals it selects are evaluated (see: surrogate).
+        """
+        screening = self.__screen(individuals)
+        if screening is not None:
+            individuals = screening.selected
+        pending, hits = self.__pending_evaluations(individuals)
+        start = Instrumentation.clock() if self.__instrumentation is not None else 0.0
+        if self.__fitness_cache is None:
+            self.__evaluator.evaluate(individuals, self.__fitness_function,
+                                      *self.__fitness_function_args)
+        else:
+            self.__fitness_cache.evaluate(
+                individuals,
+                lambda pending: self.__evaluator.evaluate(pending, self.__fitness_function,
+                                                          *self.__fitness_function_args),
+                self.__fitness_function_args)
+        if screening is not None:
+            self.__surrogate.update(screening)
+        self.__count_evaluations(individuals, pending, hits, start)
+
+    def __screen(self, individuals: List[Individual]) -> Optional[Screening]:
+        """Pre-screens the individuals with the engine's surrogate (if any)."""
+        if self.__surrogate is None:
+            return None
+        if self.__multi_objective is not None:
+            raise GeneticsError("Surrogates don't support multi-objective populations.")
+        return self.__surrogate.screen(individuals)
+
+    def __pending_evaluations(self, individuals: List[Individual]) -> Tuple[int, int]:
+        """The number of unevaluated individuals and the current number of cache hits."""
+        pending = sum(1 for individual in individuals if individual.fitness is None)
+        return pending, self.__fitness_cache.hits if self.__fitness_cache is not None else 0
+
+    def __count_evaluations(self, individuals: List[Individual], pending: int, hits: int,
+                            start: float) -> None:
+        """
+        Counts the evaluations made for a number of individuals (minus the cache hits) and reports
+        them to the instrumentation.
+        """
+        hits = self.__fitness_cache.hits - hits if self.__fitness_cache is not None else 0
+        self.__evaluations += pending - hits
+        if self.__instrumentation is not None:
+            self.__instrumentation.add_time("evaluation", Instrumentation.clock() - start)
+            self.__instrumentation.count("evaluations", pending - hits)
+            self.__instrumentation.count("cache_hits", hits)
+            self.__instrumentation.evaluated(self, individuals)
+
+    async def __evaluate_async(self, individuals: List[Individual]) -> None:
+        """
+        Computes the fitness of a whole generation without blocking the event loop.
+        Evaluators that aren't asynchronous run on the loop's default executor.
         """
-        partner_a = self.__selection_strategy(self.__population, self._random_generator,
-                                              *self.__selection_args)
-        partner_b = self.__selection_strategy(self.__population, self._random_generator,
-                                              *self.__selection_args)
-        child = self.mutate(self.crossover(partner_a, partner_b, *self.__crossover_args),
-                            *self.__mutation_args)
-        child.compute_fitness_using(self.__fitness_function, *self.__fitness_function_args)
-        return child
+        evaluator = self.__evaluator
+        fitness_function, args = self.__fitness_function, self.__fitness_function_args
+
+        async def evaluate(pending: List[Individual]) -> None:
+            if isinstance(evaluator, AsyncEvaluator):
+                await evaluator.evaluate_async(pending, fitness_function, *args)
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: evaluator.evaluate(pending, fitness_function, *args))
+
+        screening = self.__screen(individuals)
+        if screening is not None:
+            individuals = screening.selected
+        pending, hits = self.__pending_evaluations(individuals)
+        start = Instrumentation.clock() if self.__instrumentation is not None else 0.0
+        if self.__fitness_cache is None:
+            await evaluate(individuals)
+        else:
+            await self.__fitness_cache.evaluate_async(individuals, evaluate, args)
+        if screening is not None:
+            self.__surrogate.update(screening)
+        self.__count_evaluations(individuals, pending, hits, start)
 
     @property
     def population(self) -> List[Individual]:
         """The individuals of the current generation."""
         return self.__population
 
+    @property
+    def gene_pool(self) -> Optional[GenePool]:
+        """The array holding the genes of the population (None if the population is list-based)."""
+        return self.__gene_pool
+
+    @property
+    def fitness(self) -> Sequence[float]:
+        """
+        The fitness of each member of the population, in the same order as the population.
+        This is a list for list-based populations and a numpy array for array-backed ones.
+        """
+        return self.__fitness_values
+
+    @property
+    def fitness_mean(self) -> float:
+        """The mean fitness of the population (see: fitness_std)."""
+        return self.__statistics()[1]
+
+    @property
+    def fitness_std(self) -> float:
+        """
+        The (population) standard deviation of the fitness of the population.
+        The statistics of a population are computed once, the first time they are needed, so
+        reading them repeatedly (e.g. from a terminating function) costs O(1).
+        """
+        return self.__statistics()[2]
+
+    @property
+    def diversity(self) -> Diversity:
+        """
+        The genotypic diversity of the population: the number of distinct genomes, the mean
+        Hamming distance between members and the entropy of each locus (see: genyal.diversity).
+        Like the fitness statistics, it's computed in near-linear time the first time it's read on
+        each generation and then cached.
+        """
+        if self.__diversity is None:
+            genomes = self.__population
+            if self.__gene_pool is not None and genomes:
+                genomes = numpy.stack([member.gene_view for member in genomes])
+            self.__diversity = diversity(genomes)
+        return self.__diversity
+
+    def __statistics(self) -> Tuple[float, float, float]:
+        if self.__fitness_statistics is None:
+            self.__fitness_statistics = fitness_statistics(self.__fitness_values)
+        return self.__fitness_statistics
+
+    @property
+    def sort_population(self) -> bool:
+        """
+        If True (the default), each generation is sorted by fitness in ascending order.
+        Otherwise, the population is kept in the order it was created and only the fittest
+        individual is located, which avoids sorting the population on every generation.
+        """
+        return self.__sort_population
+
+    @sort_population.setter
+    def sort_population(self, value: bool) -> None:
+        self.__sort_population = value
+
+    @property
+    def evaluations(self) -> int:
+        """
+        The number of genomes whose fitness has been computed by the engine (genomes taken from the
+        fitness cache aren't counted).
+        """
+        return self.__evaluations
+
     @property
     def generation(self) -> int:
         """The number of generations the population has evolved."""
@@ -143,6 +902,212 @@ class GenyalEngine(GenyalCore):
         """The individual with the greatest fitness from the population"""
         return self.__fittest
 
+    @property
+    def evaluator(self) -> Evaluator:
+        """The strategy used to compute the fitness of each generation."""
+        return self.__evaluator
+
+    @evaluator.setter
+    def evaluator(self, evaluator: Evaluator) -> None:
+        """Sets the strategy used to compute the fitness of each generation."""
+        self.__evaluator = evaluator
+
+    @property
+    def fitness_cache(self) -> Optional[FitnessCache]:
+        """The cache with the fitness of the genomes already evaluated (if any)."""
+        return self.__fitness_cache
+
+    @fitness_cache.setter
+    def fitness_cache(self, cache: Optional[FitnessCache]) -> None:
+        """Sets the cache used to avoid evaluating the same genes more than once."""
+        self.__fitness_cache = cache
+
+    @property
+    def surrogate(self) -> Optional[Surrogate]:
+        """
+        A model of the fitness function that pre-screens the offspring of each generation, so only
+        the most promising fraction is evaluated with the fitness function (see:
+        genyal.surrogate).
+        The model is trained with every evaluated individual, starting with the initial population.
+        Steady-state evolution evaluates each child as soon as it's created, so it ignores the
+        surrogate.
+        If None (the default), every individual is evaluated.
+        """
+        return self.__surrogate
+
+    @surrogate.setter
+    def surrogate(self, surrogate: Optional[Surrogate]) -> None:
+        self.__surrogate = surrogate
+
+    @property
+    def batch_selection_strategy(self) -> Optional[Callable[..., List[int]]]:
+        """
+        The strategy to select the indices of every parent of a generation with a single call.
+        See genyal.operations.evolution for the available strategies.
+        If None, list-based populations call the engine's selection strategy once per parent and
+        array-backed populations use batch_tournament_selection.
+        """
+        return self.__batch_selection_strategy
+
+    @batch_selection_strategy.setter
+    def batch_selection_strategy(self, strategy: Optional[Callable[..., List[int]]]) -> None:
+        self.__batch_selection_strategy = strategy
+
+    @property
+    def steady_state_size(self) -> Optional[int]:
+        """
+        The number of offspring created per generation in steady-state mode.
+        In this mode, instead of replacing the whole population on each generation, the engine
+        creates steady_state_size offspring and each one replaces the least fit member of the
+        population (unless it's less fit than every member, in which case it's discarded), so the
+        fittest individuals are never lost.
+        If None (the default), each generation replaces the whole population.
+        """
+        return self.__steady_state_size
+
+    @steady_state_size.setter
+    def steady_state_size(self, size: Optional[int]) -> None:
+        if size is not None and size < 1:
+            raise GeneticsError(f"The steady-state size should be positive. Got: {size}.")
+        self.__steady_state_size = size
+
+    @property
+    def elitism(self) -> int:
+        """
+        The number of the fittest individuals carried over, as they are, to the next generation.
+        Elites keep their fitness, so they aren't evaluated again, and only
+        ``population size - elitism`` offspring are created on each generation (unless a survivor
+        selection strategy with an offspring size is set).
+        Steady-state evolution never loses the fittest individuals, so it ignores this value.
+        """
+        return self.__elitism
+
+    @elitism.setter
+    def elitism(self, count: int) -> None:
+        if count < 0:
+            raise GeneticsError(f"The number of elites can't be negative. Got: {count}.")
+        self.__elitism = count
+
+    @property
+    def survivor_selection(self) -> Optional[Callable[..., List[Individual]]]:
+        """
+        The strategy that chooses which individuals survive to the next generation, among the
+        (non-elite) members of the population and the offspring (see:
+        genyal.operations.replacement.plus_selection and comma_selection).
+        If None (the default), the offspring replace the whole population, except for the elites.
+        """
+        return self.__survivor_selection
+
+    @survivor_selection.setter
+    def survivor_selection(self, strategy: Optional[Callable[..., List[Individual]]]) -> None:
+        self.__survivor_selection = strategy
+
+    @property
+    def offspring_size(self) -> Optional[int]:
+        """
+        The number of offspring created on each generation when a survivor selection strategy is
+        set (the lambda of the (mu + lambda) and (mu, lambda) strategies).
+        If None, it's the size of the population minus the number of elites.
+        """
+        return self.__offspring_size
+
+    @offspring_size.setter
+    def offspring_size(self, size: Optional[int]) -> None:
+        if size is not None and size < 1:
+            raise GeneticsError(f"The offspring size should be positive. Got: {size}.")
+        self.__offspring_size = size
+
+    @property
+    def multi_objective(self) -> Optional[MultiObjective]:
+        """
+        The ranking of multi-objective populations (see: genyal.multiobjective.MultiObjective).
+        If set, the fitness function returns a sequence of objectives and the fitness of each
+        individual encodes its Pareto front and crowding distance.
+        If None (the default), the population has a single objective: its fitness.
+        """
+        return self.__multi_objective
+
+    @multi_objective.setter
+    def multi_objective(self, ranking: Optional[MultiObjective]) -> None:
+        self.__multi_objective = ranking
+
+    @property
+    def pareto_front(self) -> List[Individual]:
+        """The non-dominated members of a multi-objective population."""
+        if self.__multi_objective is None:
+            raise GeneticsError("The engine doesn't have a multi-objective population.")
+        return self.__multi_objective.pareto_front(self.__population)
+
+    @property
+    def terminating_function(self) -> Callable[..., bool]:
+        """The function that decides when to stop the evolution (called before each generation)."""
+        return self.__terminating_function
+
+    @terminating_function.setter
+    def terminating_function(self, function: Callable[..., bool]) -> None:
+        self.__terminating_function = function
+
+    @property
+    def checkpointer(self) -> Optional[Checkpointer]:
+        """
+        The object that decides when to write a checkpoint (see: genyal.checkpoint.Checkpointer).
+        It's called after every generation.
+        """
+        return self.__checkpointer
+
+    @checkpointer.setter
+    def checkpointer(self, checkpointer: Optional[Checkpointer]) -> None:
+        self.__checkpointer = checkpointer
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """
+        The instrumentation measuring the phases of each generation (see:
+        genyal.instrumentation.Instrumentation).
+        If None (the default), nothing is measured.
+        """
+        return self.__instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: Optional[Instrumentation]) -> None:
+        self.__instrumentation = instrumentation
+
+    @property
+    def copy_parents(self) -> bool:
+        """
+        If True, the selected parents are copied before the crossover.
+        Only needed by strategies that modify the parents they receive, since by default parents
+        are passed by reference.
+        """
+        return self.__copy_parents
+
+    @copy_parents.setter
+    def copy_parents(self, value: bool) -> None:
+        self.__copy_parents = value
+
+    @property
+    def batch_crossover_strategy(self) -> Optional[Callable[..., Any]]:
+        """
+        The vectorized crossover used by array-backed populations (see:
+        genyal.operations.crossover).
+        If None, array-backed populations use the crossover and mutation strategies of their
+        individuals.
+        """
+        return self.__batch_crossover_strategy
+
+    @batch_crossover_strategy.setter
+    def batch_crossover_strategy(self, strategy: Optional[Callable[..., Any]]) -> None:
+        self.__batch_crossover_strategy = strategy
+
+    @property
+    def batch_mutation_strategy(self) -> Callable[..., Any]:
+        """The vectorized mutation used by array-backed populations."""
+        return self.__batch_mutation_strategy
+
+    @batch_mutation_strategy.setter
+    def batch_mutation_strategy(self, strategy: Callable[..., Any]) -> None:
+        self.__batch_mutation_strategy = strategy
+
     @property
     def crossover_args(self) -> Tuple:
         """A tuple with extra arguments to be passed to the crossover operation."""
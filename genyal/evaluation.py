@@ -0,0 +1,495 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import asyncio
+import functools
+import inspect
+import math
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from genyal.core import GeneticsError
+from genyal.individuals import Individual
+from genyal.population import PooledIndividual
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class BatchFitness:
+    """
+    A fitness function that computes the fitness of a whole generation in a single call.
+
+    The wrapped function receives the genes of every unevaluated individual of a generation (as a
+    list of gene lists or, if requested, as a 2-D numpy array with one row per individual) followed
+    by the fitness function arguments, and returns a sequence with the fitness of each individual
+    in the same order.
+    On multi-objective populations (see: genyal.multiobjective.MultiObjective), the fitness of
+    each individual is a sequence of objectives (e.g. a row of a 2-D array).
+    Evaluators detect batch fitness functions and use them in place of per-individual calls.
+    """
+    __as_array: bool
+    __dtype: Any
+    __function: Callable[..., Sequence[float]]
+
+    def __init__(self, function: Callable[..., Sequence[float]], as_array: bool = False,
+                 dtype: Any = None):
+        """
+        Wraps a batch fitness function.
+
+        Args:
+            function:
+                The function computing the fitness of a list of genomes.
+            as_array:
+                If True, the genomes are given to the function as a 2-D numpy array.
+            dtype:
+                The data type of the array given to the function (only used if as_array is True).
+                If none given, numpy infers it from the genes.
+        """
+        if as_array and numpy is None:
+            raise GeneticsError("Batch fitness functions over arrays require numpy.")
+        self.__function = function
+        self.__as_array = as_array
+        self.__dtype = dtype
+
+    @property
+    def function(self) -> Callable[..., Sequence[float]]:
+        """The wrapped function."""
+        return self.__function
+
+    @property
+    def as_array(self) -> bool:
+        """If the genomes are given to the function as a 2-D numpy array."""
+        return self.__as_array
+
+    def __call__(self, genomes: Sequence[Sequence[Any]], *args) -> List[float]:
+        """Computes the fitness of each one of the genomes."""
+        if self.__as_array:
+            genomes = numpy.asarray(genomes, dtype=self.__dtype)
+        return self.__check(genomes, self.__function(genomes, *args))
+
+    async def call_async(self, genomes: Sequence[Sequence[Any]], *args) -> List[float]:
+        """
+        Computes the fitness of each one of the genomes, awaiting the result if the wrapped
+        function is a coroutine function.
+        """
+        if self.__as_array:
+            genomes = numpy.asarray(genomes, dtype=self.__dtype)
+        results = self.__function(genomes, *args)
+        if inspect.isawaitable(results):
+            results = await results
+        return self.__check(genomes, results)
+
+    @staticmethod
+    def __check(genomes: Sequence[Sequence[Any]], results: Sequence[float]) -> List[float]:
+        """
+        Checks that there's one fitness per genome and returns them as floats (or as tuples of
+        floats, for the objectives of multi-objective populations).
+        """
+        if len(results) != len(genomes):
+            raise GeneticsError(
+                f"The batch fitness function returned {len(results)} values for {len(genomes)} "
+                f"genomes.")
+        return [tuple(float(objective) for objective in fitness) if hasattr(fitness, "__len__")
+                else float(fitness) for fitness in results]
+
+
+def batch_fitness(function: Optional[Callable[..., Sequence[float]]] = None, *,
+                  as_array: bool = False, dtype: Any = None):
+    """
+    Decorator that registers a function as a batch fitness function (see: BatchFitness).
+    It can be used either as ``@batch_fitness`` or as ``@batch_fitness(as_array=True)``.
+    """
+    if function is None:
+        return lambda wrapped: BatchFitness(wrapped, as_array, dtype)
+    return BatchFitness(function, as_array, dtype)
+
+
+class Evaluator(ABC):
+    """
+    Evaluators are the strategies used by the engine to compute the fitness of a generation.
+
+    The engine hands a whole generation to the evaluator at once, so an evaluator is free to spread
+    the fitness computations over several workers.
+    Individuals that already have a fitness are never evaluated again, and batch fitness functions
+    (see: BatchFitness) are always called once per generation on the calling thread.
+    Every evaluator gives the fitness function the same genes: a list for list-based individuals
+    and a read-only numpy row for the members of a gene pool (see: GenePool).
+    """
+
+    def evaluate(self, individuals: Sequence[Individual], fitness_function: Callable[..., float],
+                 *args) -> None:
+        """
+        Computes the fitness of the individuals that haven't been evaluated yet.
+
+        Args:
+            individuals:
+                The members of the generation to evaluate.
+            fitness_function:
+                The function to calculate the fitness of each individual.
+            *args:
+                Extra arguments passed to the fitness function.
+        """
+        pending = [individual for individual in individuals if individual.fitness is None]
+        if not pending:
+            return
+        if isinstance(fitness_function, BatchFitness):
+            self._evaluate_batch(pending, fitness_function, args)
+        else:
+            self._evaluate_pending(pending, fitness_function, args)
+
+    def submit(self, individual: Individual, fitness_function: Callable[..., float],
+               *args) -> 'Future[float]':
+        """
+        Starts computing the fitness of a single individual and returns a future with the result,
+        which lets the engine keep evaluating individuals as soon as a worker is free (see:
+        GenyalEngine.steady_state_size).
+        The fitness isn't assigned to the individual; that's left to whoever holds the future.
+        By default the fitness is computed right away with evaluate.
+        """
+        future = Future()
+        try:
+            self.evaluate([individual], fitness_function, *args)
+            future.set_result(individual.fitness)
+        except Exception as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+        return future
+
+    @staticmethod
+    def _evaluate_batch(pending: List[Individual], fitness_function: BatchFitness,
+                        args: Tuple) -> None:
+        """Computes the fitness of a list of unevaluated individuals with a single call."""
+        results = fitness_function(Evaluator._batch_genomes(pending, fitness_function), *args)
+        for individual, fitness in zip(pending, results):
+            individual.fitness = fitness
+
+    @staticmethod
+    def _batch_genomes(pending: List[Individual], fitness_function: BatchFitness):
+        """The genomes of a list of unevaluated individuals, as expected by a batch function."""
+        for individual in pending:
+            if len(individual) == 0:
+                raise GeneticsError("The individual should have genes.")
+        if fitness_function.as_array:
+            return _gather_genes(pending)
+        return [individual.genes for individual in pending]
+
+    @abstractmethod
+    def _evaluate_pending(self, pending: List[Individual], fitness_function: Callable[..., float],
+                          args: Tuple) -> None:
+        """Computes the fitness of every individual of a list of unevaluated individuals."""
+
+    def close(self) -> None:
+        """Releases the resources held by this evaluator."""
+
+    def __enter__(self) -> 'Evaluator':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class SerialEvaluator(Evaluator):
+    """Evaluates the individuals one at a time on the calling thread."""
+
+    def _evaluate_pending(self, pending: List[Individual], fitness_function: Callable[..., float],
+                          args: Tuple) -> None:
+        for individual in pending:
+            individual.compute_fitness_using(fitness_function, *args)
+
+
+class _PoolEvaluator(Evaluator):
+    """Base for the evaluators that delegate the fitness computations to an executor."""
+    _executor: Optional[Executor]
+    _max_workers: Optional[int]
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initializes the evaluator.
+        The executor is created the first time it's needed and reused on every generation.
+
+        Args:
+            max_workers:
+                The number of workers of the pool.
+                Defaults to the number of processors of the machine.
+        """
+        self._executor = None
+        self._max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+
+    @property
+    def max_workers(self) -> int:
+        """The number of workers of the pool."""
+        return self._max_workers
+
+    @property
+    def executor(self) -> Executor:
+        """The executor running the fitness computations."""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        """Creates the executor running the fitness computations."""
+
+    def submit(self, individual: Individual, fitness_function: Callable[..., float],
+               *args) -> 'Future[float]':
+        """Sends the fitness computation of a single individual to the pool."""
+        if len(individual) == 0:
+            raise GeneticsError("The individual should have genes.")
+        genes = individual.genes if isinstance(fitness_function, BatchFitness) \
+            else _fitness_genes(individual)
+        return self.executor.submit(_compute_fitness, fitness_function, genes, args)
+
+    def close(self) -> None:
+        """Shuts down the pool of workers (a new one is created if the evaluator is used again)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """
+    Evaluates the individuals on a pool of threads.
+    Useful when the fitness function releases the GIL (e.g. I/O or native code).
+    """
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self._max_workers)
+
+    def _evaluate_pending(self, pending: List[Individual], fitness_function: Callable[..., float],
+                          args: Tuple) -> None:
+        # Consuming the iterator re-raises any exception thrown by a worker.
+        for _ in self.executor.map(
+                lambda individual: individual.compute_fitness_using(fitness_function, *args),
+                pending):
+            pass
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """
+    Evaluates the individuals on a pool of processes.
+
+    The genes of the individuals are sent to the workers in chunks to amortize the communication
+    cost, so the fitness function, its arguments and the genes must be picklable (e.g. the fitness
+    function must be defined at the top level of a module).
+    """
+    _chunk_size: Optional[int]
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """
+        Initializes the evaluator.
+
+        Args:
+            max_workers:
+                The number of processes of the pool.
+                Defaults to the number of processors of the machine.
+            chunk_size:
+                The number of individuals sent to a worker at once.
+                If none given, each generation is split in about four chunks per worker.
+        """
+        super(ProcessPoolEvaluator, self).__init__(max_workers)
+        self._chunk_size = chunk_size
+
+    @property
+    def chunk_size(self) -> Optional[int]:
+        """The number of individuals sent to a worker at once."""
+        return self._chunk_size
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self._max_workers)
+
+    def _evaluate_pending(self, pending: List[Individual], fitness_function: Callable[..., float],
+                          args: Tuple) -> None:
+        for individual in pending:
+            if len(individual) == 0:
+                raise GeneticsError("The individual should have genes.")
+        chunk_size = self._chunk_size or max(1, math.ceil(len(pending) / (4 * self._max_workers)))
+        results = self.executor.map(_compute_fitness, repeat(fitness_function),
+                                    [_fitness_genes(individual) for individual in pending],
+                                    repeat(args),
+                                    chunksize=chunk_size)
+        for individual, fitness in zip(pending, results):
+            individual.fitness = fitness
+
+
+class AsyncEvaluator(Evaluator):
+    """
+    Evaluates the individuals concurrently on an asyncio event loop.
+
+    Meant for latency-bound fitness functions (e.g. calls to external services): coroutine fitness
+    functions are awaited directly, while regular functions run on the loop's default executor.
+    At most ``max_concurrency`` evaluations are in flight at the same time, each one is limited to
+    ``timeout`` seconds, and cancelling the evaluation cancels every pending fitness computation.
+    """
+    __max_concurrency: int
+    __timeout: Optional[float]
+    __timeout_fitness: Optional[float]
+
+    def __init__(self, max_concurrency: int = 16, timeout: Optional[float] = None,
+                 timeout_fitness: Optional[float] = None):
+        """
+        Initializes the evaluator.
+
+        Args:
+            max_concurrency:
+                The maximum number of fitness computations running at the same time.
+            timeout:
+                The number of seconds a single fitness computation is allowed to take.
+                If None, computations never time out.
+            timeout_fitness:
+                The fitness given to the individuals whose evaluation timed out.
+                If None, a timeout raises an EvaluationTimeoutError.
+        """
+        if max_concurrency < 1:
+            raise GeneticsError(
+                f"The maximum concurrency should be positive. Got: {max_concurrency}.")
+        self.__max_concurrency = max_concurrency
+        self.__timeout = timeout
+        self.__timeout_fitness = timeout_fitness
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of fitness computations running at the same time."""
+        return self.__max_concurrency
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """The number of seconds a single fitness computation is allowed to take."""
+        return self.__timeout
+
+    def evaluate(self, individuals: Sequence[Individual], fitness_function: Callable[..., Any],
+                 *args) -> None:
+        """
+        Computes the fitness of the individuals that haven't been evaluated yet, running a new
+        event loop until they are done.
+        This can't be called from a running event loop (use evaluate_async instead).
+        """
+        asyncio.run(self.evaluate_async(individuals, fitness_function, *args))
+
+    async def evaluate_async(self, individuals: Sequence[Individual],
+                             fitness_function: Callable[..., Any], *args) -> None:
+        """
+        Computes the fitness of the individuals that haven't been evaluated yet.
+
+        Args:
+            individuals:
+                The members of the generation to evaluate.
+            fitness_function:
+                The (coroutine or regular) function to calculate the fitness of each individual.
+                Awaitable results are awaited, whatever the kind of function that returned them.
+            *args:
+                Extra arguments passed to the fitness function.
+        """
+        pending = [individual for individual in individuals if individual.fitness is None]
+        if not pending:
+            return
+        if isinstance(fitness_function, BatchFitness):
+            results = await self.__limit_time(fitness_function.call_async(
+                self._batch_genomes(pending, fitness_function), *args))
+            if results is None:
+                results = [self.__timeout_fitness] * len(pending)
+            for individual, fitness in zip(pending, results):
+                individual.fitness = fitness
+            return
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+        tasks = [asyncio.ensure_future(self.__evaluate_one(semaphore, individual,
+                                                           fitness_function, args))
+                 for individual in pending]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def __evaluate_one(self, semaphore: asyncio.Semaphore, individual: Individual,
+                             fitness_function: Callable[..., Any], args: Tuple) -> None:
+        """Computes the fitness of an individual once the semaphore lets it."""
+        async with semaphore:
+            if len(individual) == 0:
+                raise GeneticsError("The individual should have genes.")
+            if asyncio.iscoroutinefunction(fitness_function):
+                computation = fitness_function(_fitness_genes(individual), *args)
+            else:
+                computation = asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(fitness_function, _fitness_genes(individual), *args))
+            fitness = await self.__limit_time(self.__resolve(computation))
+            individual.fitness = fitness if fitness is not None else self.__timeout_fitness
+
+    @staticmethod
+    async def __resolve(computation):
+        """
+        Awaits a computation and then its result, if it's awaitable too (e.g. the coroutine returned
+        by an object with an async __call__ or by a partial of a coroutine function).
+        """
+        result = await computation
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def __limit_time(self, computation):
+        """
+        Awaits a computation for at most the timeout of the evaluator.
+        Returns None if it timed out and a timeout fitness was given.
+        """
+        if self.__timeout is None:
+            return await computation
+        try:
+            return await asyncio.wait_for(computation, self.__timeout)
+        except asyncio.TimeoutError:
+            if self.__timeout_fitness is None:
+                raise EvaluationTimeoutError(
+                    f"A fitness computation took more than {self.__timeout} seconds.") from None
+            return None
+
+    def _evaluate_pending(self, pending: List[Individual], fitness_function: Callable[..., float],
+                          args: Tuple) -> None:
+        asyncio.run(self.evaluate_async(pending, fitness_function, *args))
+
+
+class EvaluationTimeoutError(GeneticsError):
+    """If the computation of a fitness takes longer than allowed"""
+
+    def __init__(self, cause: str):
+        super(EvaluationTimeoutError, self).__init__(cause)
+
+
+def _gather_genes(individuals: List[Individual]):
+    """
+    Returns the genes of a list of individuals.
+    If all of them belong to the same gene pool, their rows are taken directly from the pool.
+    """
+    pool = getattr(individuals[0], "pool", None)
+    if pool is not None and all(
+            isinstance(individual, PooledIndividual) and individual.pool is pool
+            for individual in individuals):
+        return pool.genes[[individual.row for individual in individuals]]
+    return [individual.genes for individual in individuals]
+
+
+def _fitness_genes(individual: Individual):
+    """
+    The genes given to a (per-individual) fitness function: a list, or a read-only view over the
+    row of a pooled individual.
+    """
+    if isinstance(individual, PooledIndividual):
+        return individual.gene_view
+    return individual.genes
+
+
+def _compute_fitness(fitness_function: Callable[..., float], genes: List[Any], args: Tuple) \
+        -> float:
+    """Computes the fitness of a set of genes (this runs on the workers of a pool)."""
+    if isinstance(fitness_function, BatchFitness):
+        return fitness_function([genes], *args)[0]
+    return fitness_function(genes, *args)
@@ -5,25 +5,45 @@ Creative Commons Attribution 4.0 International License.
 You should have received a copy of the license along with this
 work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 """
-from typing import Callable, Generic, Tuple
+import string
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple
 
-from genyal.core import DNA
+from genyal.core import DNA, GeneticsError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class GeneFactory(Generic[DNA]):
-    """Factory class for creating genes of type DNA."""
+    """
+    Factory class for creating genes of type DNA.
+
+    Genes can be made one at a time (see: make) or in bulk (see: make_many and make_array).
+    By default the bulk methods call the generator once per gene, but a factory can be given a
+    batch generator that produces many genes in a single call; the numpy-backed factories of this
+    module (e.g. IntegerFactory) draw whole arrays of genes at once.
+    """
+    __batch_generator: Optional[Callable[..., Sequence[DNA]]]
     __generator: Callable
 
-    def __init__(self, generator=id, *args):
+    def __init__(self, generator=id, *args,
+                 batch_generator: Optional[Callable[..., Sequence[DNA]]] = None):
         """
         Creates a new factory to make genes.
         Args:
             *args:
                 In case that the generator function of this factory needs arguments they can be
                 supplied by using the constructor.
+            batch_generator:
+                An optional function that receives a number of genes (and the arguments of the
+                factory) and returns a sequence (or numpy array) with that many new genes.
         """
         self.__generator = generator
         self.__args = args
+        self.__batch_generator = batch_generator
 
     @property
     def generator(self) -> Callable[..., DNA]:
@@ -35,6 +55,15 @@ class GeneFactory(Generic[DNA]):
         """Gives a new generator function to the factory."""
         self.__generator = generator_function
 
+    @property
+    def batch_generator(self) -> Optional[Callable[..., Sequence[DNA]]]:
+        """The function used to create many genes at once, if any."""
+        return self.__batch_generator
+
+    @batch_generator.setter
+    def batch_generator(self, batch_generator: Optional[Callable[..., Sequence[DNA]]]) -> None:
+        self.__batch_generator = batch_generator
+
     @property
     def generator_args(self) -> Tuple:
         return self.__args
@@ -49,3 +78,124 @@ class GeneFactory(Generic[DNA]):
         given on the constructor.
         """
         return self.__generator(*self.__args)
+
+    def make_many(self, count: int) -> List[DNA]:
+        """
+        Creates a list of new genes.
+        Without a batch generator this is the same as calling make count times (in order).
+        """
+        if self.__batch_generator is None:
+            generator, args = self.__generator, self.__args
+            return [generator(*args) for _ in range(0, count)]
+        genes = self.__batch_generator(count, *self.__args)
+        if numpy is not None and isinstance(genes, numpy.ndarray):
+            return genes.tolist()
+        return list(genes)
+
+    def make_array(self, count: int, dtype: Any = None):
+        """Creates a 1-D numpy array of new genes (see: make_many)."""
+        if numpy is None:
+            raise GeneticsError("Arrays of genes require numpy.")
+        if self.__batch_generator is None:
+            return numpy.array(self.make_many(count), dtype=dtype)
+        return numpy.asarray(self.__batch_generator(count, *self.__args), dtype=dtype)
+
+
+class _NumpyFactory(GeneFactory[DNA], ABC):
+    """
+    Base class of the gene factories backed by a numpy random number generator.
+    Genes made one at a time are taken from a buffer that is refilled in blocks, so the cost of
+    drawing from numpy is paid once per block instead of once per gene.
+    """
+    __buffer: List[DNA]
+    __random_generator: Any
+
+    BUFFER_SIZE = 1024
+
+    def __init__(self, random_generator=None):
+        """
+        Args:
+            random_generator:
+                A numpy random number generator, or a seed to create one.
+        """
+        if numpy is None:
+            raise GeneticsError(f"{type(self).__name__} requires numpy.")
+        super(_NumpyFactory, self).__init__(self.make)
+        self.__random_generator = numpy.random.default_rng(random_generator)
+        self.__buffer = []
+
+    @abstractmethod
+    def _draw(self, count: int, random_generator):
+        """Returns a numpy array with count new genes."""
+
+    def make(self) -> DNA:
+        if not self.__buffer:
+            self.__buffer = self._draw(self.BUFFER_SIZE, self.__random_generator).tolist()
+            self.__buffer.reverse()
+        return self.__buffer.pop()
+
+    def make_many(self, count: int) -> List[DNA]:
+        return self._draw(count, self.__random_generator).tolist()
+
+    def make_array(self, count: int, dtype: Any = None):
+        genes = self._draw(count, self.__random_generator)
+        return genes if dtype is None else genes.astype(dtype, copy=False)
+
+    @property
+    def random_generator(self):
+        """The numpy random number generator of the factory."""
+        return self.__random_generator
+
+
+class IntegerFactory(_NumpyFactory[int]):
+    """Makes integer genes drawn uniformly from the closed interval [low, high]."""
+    __high: int
+    __low: int
+
+    def __init__(self, low: int, high: int, random_generator=None):
+        super(IntegerFactory, self).__init__(random_generator)
+        self.__low = low
+        self.__high = high
+
+    def _draw(self, count: int, random_generator):
+        return random_generator.integers(self.__low, self.__high, count, endpoint=True)
+
+
+class FloatFactory(_NumpyFactory[float]):
+    """Makes float genes drawn uniformly from the interval [low, high)."""
+    __high: float
+    __low: float
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, random_generator=None):
+        super(FloatFactory, self).__init__(random_generator)
+        self.__low = low
+        self.__high = high
+
+    def _draw(self, count: int, random_generator):
+        return random_generator.uniform(self.__low, self.__high, count)
+
+
+class BooleanFactory(_NumpyFactory[bool]):
+    """Makes boolean genes that are True with a given probability."""
+    __probability: float
+
+    def __init__(self, probability: float = 0.5, random_generator=None):
+        super(BooleanFactory, self).__init__(random_generator)
+        self.__probability = probability
+
+    def _draw(self, count: int, random_generator):
+        return random_generator.random(count) < self.__probability
+
+
+class AlphabetFactory(_NumpyFactory[str]):
+    """Makes single character genes drawn uniformly from an alphabet."""
+    __alphabet: Any
+
+    def __init__(self, alphabet: str = string.ascii_lowercase, random_generator=None):
+        super(AlphabetFactory, self).__init__(random_generator)
+        if not alphabet:
+            raise GeneticsError("The alphabet can't be empty.")
+        self.__alphabet = numpy.array(list(alphabet))
+
+    def _draw(self, count: int, random_generator):
+        return self.__alphabet[random_generator.integers(0, len(self.__alphabet), count)]
@@ -8,7 +8,7 @@ work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 
 from copy import copy
 from random import Random
-from typing import Any, Callable, Generic, List, Optional, Tuple, get_args
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from genyal.core import DNA, GeneticsError, GenyalCore
 from genyal.genotype import GeneFactory
@@ -27,7 +27,12 @@ class Individual(GenyalCore, Generic[DNA]):
 
     Most of the handling process of the individuals will be done by the engine (see:
     genyal.engine.GenyalEngine).
+
+    Individuals use __slots__ to keep their memory footprint small, so subclasses should declare
+    their own __slots__ too.
     """
+    __slots__ = ("__factory_args", "__fitness", "__genes", "__gene_factory", "__mutation_rate",
+                 "__crossover_strategy", "__mutation_strategy", "__objectives")
     __factory_args: Tuple
     __fitness: Optional[float]
     __genes: List[DNA]
@@ -35,10 +40,11 @@ class Individual(GenyalCore, Generic[DNA]):
     __mutation_rate: float
     __crossover_strategy: Callable[..., 'Individual[DNA]']
     __mutation_strategy: Callable[..., 'Individual[DNA]']
+    __objectives: Optional[Tuple[float, ...]]
 
     def __init__(self, genes=None, mutation_rate=0.01, gene_factory=GeneFactory(),
                  crossover_strategy=single_point_crossover, mutation_strategy=simple_mutation,
-                 random_generator=Random()):
+                 random_generator: Optional[Random] = None):
         """
         Initializes an individual.
         If no parameters are given to the constructor the individual is created with default
@@ -63,6 +69,7 @@ class Individual(GenyalCore, Generic[DNA]):
                 Defaults to simple_mutation (see: genyal.operations.mutation).
             random_generator:
                 The random number generator used in the algorithm's operations.
+                If none given, the individual gets its own generator when it first needs one.
         """
         super(Individual, self).__init__(random_generator)
         self.__fitness = None
@@ -72,13 +79,17 @@ class Individual(GenyalCore, Generic[DNA]):
         self.__mutation_strategy = mutation_strategy
         self.__gene_factory = gene_factory
         self.__factory_args = ()
+        self.__objectives = None
 
     @classmethod
     def create(cls, number_of_individuals: int, number_of_genes: int,
-               gene_factory: GeneFactory[DNA], mutation_rate: float = 0.01, *args) \
-            -> List['Individual[DNA]']:
+               gene_factory: GeneFactory[DNA], mutation_rate: float = 0.01, *args,
+               seeds: Optional[Iterable[Sequence[DNA]]] = None,
+               random_generator: Optional[Random] = None) -> List['Individual[DNA]']:
         """
         Factory method to easily create a population of individuals.
+        The genes of the whole population are made with a single call to the gene factory (see:
+        genyal.genotype.GeneFactory.make_many).
 
         Args:
             number_of_individuals:
@@ -89,11 +100,22 @@ class Individual(GenyalCore, Generic[DNA]):
                 a one-argument factory to generate a gene.
             mutation_rate:
                 the probability —a number in [0, 1)—  with which an individual will mutate.
+            seeds:
+                genomes (e.g. the result of a heuristic or of a previous run) used as the genes of
+                the first individuals; the rest are generated by the factory.
+            random_generator:
+                the random number generator shared by the individuals (see: __init__).
         """
+        genomes = seed_genomes(seeds, number_of_individuals, number_of_genes)
+        missing = number_of_individuals - len(genomes)
+        generated = gene_factory.make_many(missing * number_of_genes)
+        genomes.extend(generated[idx * number_of_genes:(idx + 1) * number_of_genes]
+                       for idx in range(0, missing))
         individuals = []
-        for _ in range(0, number_of_individuals):
-            individual = Individual(gene_factory=gene_factory, mutation_rate=mutation_rate)
-            individual.set(number_of_genes, *args)
+        for genes in genomes:
+            individual = Individual(genes, mutation_rate, gene_factory,
+                                    random_generator=random_generator)
+            individual.__factory_args = args
             individuals.append(individual)
         return individuals
 
@@ -107,8 +129,7 @@ class Individual(GenyalCore, Generic[DNA]):
     def set(self, number_of_genes: int, *args):
         """Generate the genes of the individual."""
         self.__factory_args = args
-        for _ in range(0, number_of_genes):
-            self.__genes.append(self.__gene_factory.make())
+        self.__genes.extend(self.__gene_factory.make_many(number_of_genes))
 
     def crossover(self, partner: 'Individual[DNA]', *args):
         return self.__crossover_strategy(self, partner, *args)
@@ -116,12 +137,52 @@ class Individual(GenyalCore, Generic[DNA]):
     def mutate(self, *args) -> 'Individual[DNA]':
         return self.__mutation_strategy(self, *args)
 
+    def offspring(self, genes: List[DNA]) -> 'Individual[DNA]':
+        """
+        Returns a new individual with the same configuration as this one and the given genes.
+        The list of genes is taken as is (without copying it), so it shouldn't be shared.
+        """
+        return Individual(genes, self.mutation_rate, self.gene_factory, self.crossover_strategy,
+                          self.mutation_strategy, self.random_generator)
+
     # region : Properties
+    @property
+    def random_generator(self) -> Random:
+        """
+        The random number generator used by the crossover and mutation strategies.
+        An individual created without one gets a new generator the first time it's needed, so
+        individuals never share a generator unless they are given the same one.
+        """
+        if self._random_generator is None:
+            self._random_generator = Random()
+        return self._random_generator
+
+    @random_generator.setter
+    def random_generator(self, new_generator: Random) -> None:
+        self._random_generator = new_generator
+
     @property
     def fitness(self) -> float:
         """The fitness of this individual according to its fitness function."""
         return self.__fitness
 
+    @fitness.setter
+    def fitness(self, value: Optional[float]) -> None:
+        """Assigns a fitness computed elsewhere (e.g. by an evaluator) to this individual."""
+        self.__fitness = value
+
+    @property
+    def objectives(self) -> Optional[Tuple[float, ...]]:
+        """
+        The objectives of this individual if it belongs to a multi-objective population (see:
+        genyal.multiobjective.MultiObjective), whose fitness is then derived from them.
+        """
+        return self.__objectives
+
+    @objectives.setter
+    def objectives(self, value: Optional[Tuple[float, ...]]) -> None:
+        self.__objectives = value
+
     @property
     def genes(self) -> List[DNA]:
         """The genes of this individual"""
@@ -185,37 +246,78 @@ class Individual(GenyalCore, Generic[DNA]):
         """The number of genes of this individual"""
         return len(self.__genes)
 
+    def __getitem__(self, index):
+        """
+        Returns a gene (or a list of genes if the index is a slice) without copying the rest of the
+        genes of this individual.
+        """
+        return self.__genes[index]
+
+    def __setitem__(self, index, value) -> None:
+        """
+        Replaces a gene (or a slice of genes) of this individual in place.
+        The fitness of the individual is discarded, since it no longer matches its genes.
+        """
+        self.__genes[index] = value
+        self.__fitness = None
+        self.__objectives = None
+
+    def __iter__(self) -> Iterator[DNA]:
+        """Iterates over the genes of this individual without copying them."""
+        return iter(self.__genes)
+
     def __repr__(self) -> str:
         """An individual is represented by its fitness and its genes."""
         return f"{self.__fitness} - {self.__genes}"
 
     def __eq__(self, other: Any) -> bool:
         """Two individuals are equal if they have the same fitness"""
-        return isinstance(other, Individual) and get_args(self) == get_args(
-            other) and self.__fitness == other.__fitness
+        return isinstance(other, Individual) and self.fitness == other.fitness
 
     def __lt__(self, other: Any) -> bool:
         """Individuals are sorted according to their fitness."""
-        return isinstance(other, Individual) and get_args(self) == get_args(
-            other) and self.__fitness < other.__fitness
+        return isinstance(other, Individual) and self.fitness < other.fitness
 
     def __le__(self, other):
         """Individuals are sorted according to their fitness."""
-        return isinstance(other, Individual) and get_args(self) == get_args(
-            other) and self.__fitness <= other.__fitness
+        return isinstance(other, Individual) and self.fitness <= other.fitness
 
     def __gt__(self, other) -> bool:
         """Individuals are sorted according to their fitness."""
-        return isinstance(other, Individual) and get_args(self) == get_args(
-            other) and self.__fitness > other.__fitness
+        return isinstance(other, Individual) and self.fitness > other.fitness
 
     def __ge__(self, other) -> bool:
         """Individuals are sorted according to their fitness."""
-        return isinstance(other, Individual) and get_args(self) == get_args(
-            other) and self.__fitness >= other.__fitness
+        return isinstance(other, Individual) and self.fitness >= other.fitness
 
     def __copy__(self) -> 'Individual[DNA]':
-        """Returns a copy of this individual."""
-        return Individual(self.__genes, self.__mutation_rate, self.__gene_factory,
+        """Returns a copy of this individual, with its own list of genes."""
+        return Individual(list(self.__genes), self.__mutation_rate, self.__gene_factory,
                           self.__crossover_strategy, self.__mutation_strategy,
                           self._random_generator)
+
+
+def fitness_key(individual: Individual) -> float:
+    """
+    The key to sort individuals by their fitness.
+    Sorting with this key compares plain floats instead of calling the comparison methods of the
+    individuals.
+    """
+    return individual.fitness
+
+
+def seed_genomes(seeds: Optional[Iterable[Sequence[DNA]]], number_of_individuals: int,
+                 number_of_genes: int) -> List[List[DNA]]:
+    """
+    Returns (copies of) at most number_of_individuals seed genomes, checking that each one has
+    number_of_genes genes.
+    """
+    genomes = []
+    for genes in seeds if seeds is not None else ():
+        if len(genomes) == number_of_individuals:
+            break
+        if len(genes) != number_of_genes:
+            raise GeneticsError(f"The seeds should have {number_of_genes} genes. "
+                                f"Got: {len(genes)}.")
+        genomes.append(list(genes))
+    return genomes
@@ -0,0 +1,120 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+# The phases of a generation timed by the engine.
+PHASES = ("selection", "crossover", "mutation", "evaluation", "replacement", "sorting")
+# The events counted by the engine.
+COUNTERS = ("offspring", "copies", "evaluations", "cache_hits")
+
+
+class Instrumentation:
+    """
+    Collects the time spent on each phase of a generation, counts the work done by the engine and
+    calls user hooks at the start and end of each generation and after each evaluation.
+
+    Instrumentation is opt-in (see: GenyalEngine.instrumentation); an engine without it only pays
+    for a check against None on each phase.
+    The records of each generation can be streamed as JSON lines, and the totals exported as a
+    plain dict.
+    """
+    __counters: Dict[str, int]
+    __generations: int
+    __json_lines: Optional[TextIO]
+    __last_generation: Optional[Dict[str, Any]]
+    __on_evaluate: Optional[Callable[..., None]]
+    __on_generation_end: Optional[Callable[..., None]]
+    __on_generation_start: Optional[Callable[..., None]]
+    __times: Dict[str, float]
+    __total_counters: Dict[str, int]
+    __total_times: Dict[str, float]
+
+    clock: Callable[[], float] = staticmethod(time.perf_counter)
+
+    def __init__(self, on_generation_start: Optional[Callable[..., None]] = None,
+                 on_generation_end: Optional[Callable[..., None]] = None,
+                 on_evaluate: Optional[Callable[..., None]] = None,
+                 json_lines: Optional[TextIO] = None):
+        """
+        Initializes the instrumentation.
+
+        Args:
+            on_generation_start:
+                A function called with the engine before each generation.
+            on_generation_end:
+                A function called with the engine and the record of the generation (see:
+                last_generation) after each generation.
+            on_evaluate:
+                A function called with the engine and the evaluated individuals after each
+                evaluation.
+            json_lines:
+                A text stream where the record of each generation is written as a JSON line.
+        """
+        self.__on_generation_start = on_generation_start
+        self.__on_generation_end = on_generation_end
+        self.__on_evaluate = on_evaluate
+        self.__json_lines = json_lines
+        self.reset()
+
+    def reset(self) -> None:
+        """Discards every measurement."""
+        self.__times = dict.fromkeys(PHASES, 0.0)
+        self.__counters = dict.fromkeys(COUNTERS, 0)
+        self.__total_times = dict.fromkeys(PHASES, 0.0)
+        self.__total_counters = dict.fromkeys(COUNTERS, 0)
+        self.__generations = 0
+        self.__last_generation = None
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Adds the time spent on a phase of the current generation."""
+        self.__times[phase] += seconds
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """Increases a counter of the current generation."""
+        self.__counters[counter] += amount
+
+    def start_generation(self, engine) -> None:
+        """Starts measuring a new generation of an engine."""
+        self.__times = dict.fromkeys(PHASES, 0.0)
+        self.__counters = dict.fromkeys(COUNTERS, 0)
+        if self.__on_generation_start is not None:
+            self.__on_generation_start(engine)
+
+    def end_generation(self, engine) -> None:
+        """Closes the record of the current generation of an engine."""
+        self.__generations += 1
+        for phase, seconds in self.__times.items():
+            self.__total_times[phase] += seconds
+        for counter, amount in self.__counters.items():
+            self.__total_counters[counter] += amount
+        self.__last_generation = {"generation": engine.generation, "phases": self.__times,
+                                  "counters": self.__counters}
+        if self.__json_lines is not None:
+            self.__json_lines.write(json.dumps(self.__last_generation) + "\n")
+        if self.__on_generation_end is not None:
+            self.__on_generation_end(engine, self.__last_generation)
+
+    def evaluated(self, engine, individuals: List[Any]) -> None:
+        """Notifies the evaluation of a group of individuals."""
+        if self.__on_evaluate is not None:
+            self.__on_evaluate(engine, individuals)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The totals over every measured generation, as a plain dict."""
+        return {"generations": self.__generations, "phases": dict(self.__total_times),
+                "counters": dict(self.__total_counters)}
+
+    @property
+    def last_generation(self) -> Optional[Dict[str, Any]]:
+        """
+        The record of the last measured generation: its number and the time spent on each phase
+        and the counters of the generation.
+        """
+        return self.__last_generation
@@ -0,0 +1,252 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import multiprocessing
+from random import Random
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.individuals import Individual
+from genyal.operations.evolution import default_terminating_function
+from genyal.streams import RandomStreams
+
+# A migrant travels between islands as its genes, its fitness and its objectives (None unless the
+# island has a multi-objective population).
+Migrant = Tuple[List[Any], float, Optional[Tuple[float, ...]]]
+
+
+def ring_topology(islands: int) -> List[List[int]]:
+    """Each island receives migrants from the previous one (and the first from the last)."""
+    return [[(idx - 1) % islands] if islands > 1 else [] for idx in range(0, islands)]
+
+
+def complete_topology(islands: int) -> List[List[int]]:
+    """Each island receives migrants from every other island."""
+    return [[source for source in range(0, islands) if source != idx]
+            for idx in range(0, islands)]
+
+
+class IslandModel:
+    """
+    Evolves several populations (islands) in parallel, each one on its own engine and process.
+
+    Every ``migration_interval`` generations, the fittest members of each island migrate to its
+    neighbours (according to the topology), where they replace the least fit individuals.
+    Islands evolve in lockstep between migrations and each one gets its own random number
+    generator derived from the model's seed (see: genyal.streams.RandomStreams), so a run is
+    reproducible for a given seed no matter if the islands run on separate processes or not, and
+    each island gets the same generator no matter how many islands there are.
+    """
+    __engine_factory: Callable[[Random], GenyalEngine]
+    __fittest: Optional[Individual]
+    __generations: int
+    __islands: List['_Island']
+    __migrants: int
+    __migration_interval: int
+    __seeds: List[int]
+    __sources: List[List[int]]
+    __terminating_function: Callable[..., bool]
+    __workers: List[Tuple[Any, Any]]
+
+    def __init__(self, engine_factory: Callable[[Random], GenyalEngine], islands: int = 4,
+                 migration_interval: int = 10, migrants: int = 2,
+                 topology: Callable[[int], List[List[int]]] = ring_topology, seed: int = 0,
+                 processes: bool = True,
+                 terminating_function=default_terminating_function):
+        """
+        Initializes the islands.
+
+        Args:
+            engine_factory:
+                A function that receives a random number generator and returns an engine with an
+                initial population.
+                When the islands run on separate processes it must be picklable (i.e., defined at
+                the top level of a module).
+            islands:
+                The number of islands.
+            migration_interval:
+                The number of generations between two migrations.
+            migrants:
+                The number of individuals that each island sends to each one of its neighbours.
+            topology:
+                A function that receives the number of islands and returns, for each island, the
+                list of islands it receives migrants from.
+                Defaults to a ring (see also: complete_topology).
+            seed:
+                The seed from which the random number generator of each island is derived.
+            processes:
+                If True, each island runs on its own process; otherwise every island is evolved on
+                the calling process.
+            terminating_function:
+                The function that will decide when to stop the evolution of the islands.
+                It's called with the model between migrations.
+        """
+        if islands < 1:
+            raise GeneticsError(f"The model should have at least one island. Got: {islands}.")
+        if migration_interval < 1:
+            raise GeneticsError(
+                f"The migration interval should be positive. Got: {migration_interval}.")
+        self.__engine_factory = engine_factory
+        self.__migration_interval = migration_interval
+        self.__migrants = migrants
+        self.__sources = topology(islands)
+        streams = RandomStreams(seed)
+        self.__seeds = [streams.seed("island", idx) for idx in range(0, islands)]
+        self.__terminating_function = terminating_function
+        self.__generations = 0
+        self.__fittest = None
+        self.__islands = []
+        self.__workers = []
+        if processes:
+            for island_seed in self.__seeds:
+                connection, worker_connection = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_run_island, daemon=True,
+                                                  args=(engine_factory, island_seed,
+                                                        worker_connection))
+                process.start()
+                worker_connection.close()
+                self.__workers.append((process, connection))
+        else:
+            self.__islands = [_Island(engine_factory, island_seed) for island_seed in self.__seeds]
+        self.__reports = self.__exchange([None] * islands, 0)
+
+    def evolve(self, *args) -> None:
+        """
+        Evolves the islands until the condition given by the terminating function is met.
+        By default, the islands will evolve until they reach 100 generations.
+
+        Args:
+            *args:
+                The arguments passed to the terminating function.
+        """
+        while not self.__terminating_function(self, *args):
+            self.step()
+
+    def step(self) -> None:
+        """Performs a migration and then evolves every island for a migration interval."""
+        emigrants = [report[0] for report in self.__reports]
+        immigrants = [[migrant for source in sources for migrant in emigrants[source]]
+                      for sources in self.__sources]
+        self.__reports = self.__exchange(immigrants, self.__migration_interval)
+        self.__generations += self.__migration_interval
+
+    def close(self) -> None:
+        """Stops the processes running the islands."""
+        for process, connection in self.__workers:
+            connection.send(None)
+            connection.close()
+            process.join()
+        self.__workers = []
+
+    def __exchange(self, immigrants: List[Optional[List[Migrant]]], generations: int) \
+            -> List[Tuple[List[Migrant], Migrant]]:
+        """
+        Sends the immigrants to each island, evolves them and collects their reports (the
+        emigrants and the fittest individual of each island).
+        """
+        if self.__workers:
+            for (_, connection), island_immigrants in zip(self.__workers, immigrants):
+                connection.send((island_immigrants, generations, self.__migrants))
+            reports = [connection.recv() for _, connection in self.__workers]
+        else:
+            reports = [island.advance(island_immigrants, generations, self.__migrants)
+                       for island, island_immigrants in zip(self.__islands, immigrants)]
+        for report in reports:
+            if isinstance(report, Exception):
+                self.close()
+                raise report
+        self.__fittest = _individual(max((report[1] for report in reports),
+                                         key=lambda best: best[1]))
+        return reports
+
+    @property
+    def fittest(self) -> Optional[Individual]:
+        """The individual with the greatest fitness among every island."""
+        return self.__fittest
+
+    @property
+    def generation(self) -> int:
+        """The number of generations the islands have evolved."""
+        return self.__generations
+
+    @property
+    def seeds(self) -> Sequence[int]:
+        """The seed of the random number generator of each island."""
+        return tuple(self.__seeds)
+
+    @property
+    def islands_fittest(self) -> List[Individual]:
+        """The fittest individual of each island."""
+        return [_individual(report[1]) for report in self.__reports]
+
+    def __enter__(self) -> 'IslandModel':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class _Island:
+    """An engine evolving one of the populations of an island model."""
+    engine: GenyalEngine
+
+    def __init__(self, engine_factory: Callable[[Random], GenyalEngine], seed: int):
+        self.engine = engine_factory(Random(seed))
+
+    def advance(self, immigrants: Optional[List[Migrant]], generations: int, migrants: int) \
+            -> Tuple[List[Migrant], Migrant]:
+        """
+        Receives the immigrants, evolves the island and returns its emigrants and its fittest
+        individual.
+        """
+        if immigrants:
+            template = self.engine.population[0]
+            arrivals = []
+            for genes, fitness, objectives in immigrants:
+                arrival = template.offspring(list(genes))
+                arrival.fitness = fitness
+                arrival.objectives = objectives
+                arrivals.append(arrival)
+            self.engine.immigrate(arrivals)
+        for _ in range(0, generations):
+            self.engine.step()
+        emigrants = [_migrant(elite) for elite in self.engine.elites(migrants)]
+        return emigrants, _migrant(self.engine.fittest)
+
+
+def _migrant(individual: Individual) -> Migrant:
+    """The message that carries an individual to another island."""
+    return individual.genes, individual.fitness, individual.objectives
+
+
+def _individual(migrant: Migrant) -> Individual:
+    """Recreates the individual carried by a migrant."""
+    genes, fitness, objectives = migrant
+    individual = Individual(genes)
+    individual.fitness = fitness
+    individual.objectives = objectives
+    return individual
+
+
+def _run_island(engine_factory: Callable[[Random], GenyalEngine], seed: int, connection) -> None:
+    """Runs an island on a worker process until the model sends None."""
+    island, failure = None, None
+    try:
+        island = _Island(engine_factory, seed)
+    except Exception as error:  # pylint: disable=broad-except
+        failure = error
+    message = connection.recv()
+    while message is not None:
+        try:
+            if failure is not None:
+                raise failure
+            connection.send(island.advance(*message))
+        except Exception as error:  # pylint: disable=broad-except
+            connection.send(error)
+        message = connection.recv()
+    connection.close()
@@ -0,0 +1,200 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import bisect
+import math
+from typing import List, Sequence, Tuple
+
+from genyal.core import GeneticsError
+from genyal.individuals import Individual
+from genyal.ranking import top_indices
+
+# Every objective is maximized, like the fitness of single-objective populations; objectives to
+# minimize (e.g. cost or latency) should be negated by the fitness function.
+Objectives = Sequence[float]
+
+
+def dominates(first: Objectives, second: Objectives) -> bool:
+    """
+    Checks if the first vector of objectives dominates the second one, i.e. if it's at least as
+    good on every objective and strictly better on at least one.
+    """
+    better = False
+    for a, b in zip(first, second):
+        if a < b:
+            return False
+        better = better or a > b
+    return better
+
+
+def fast_non_dominated_sort(objectives: Sequence[Objectives]) -> List[List[int]]:
+    """
+    Splits a population into Pareto fronts with the fast non-dominated sort of NSGA-II, in
+    O(M N^2) for N vectors of M objectives.
+    The first front has the non-dominated vectors, the second one the vectors that are only
+    dominated by the first front, and so on.
+    Returns the indices of the vectors of each front.
+    """
+    size = len(objectives)
+    dominated: List[List[int]] = [[] for _ in range(0, size)]
+    domination_count = [0] * size
+    for i in range(0, size):
+        for j in range(i + 1, size):
+            if dominates(objectives[i], objectives[j]):
+                dominated[i].append(j)
+                domination_count[j] += 1
+            elif dominates(objectives[j], objectives[i]):
+                dominated[j].append(i)
+                domination_count[i] += 1
+    fronts = []
+    front = [idx for idx in range(0, size) if domination_count[idx] == 0]
+    while front:
+        fronts.append(front)
+        next_front = []
+        for idx in front:
+            for other in dominated[idx]:
+                domination_count[other] -= 1
+                if domination_count[other] == 0:
+                    next_front.append(other)
+        front = sorted(next_front)
+    return fronts
+
+
+def non_dominated_sort_2d(objectives: Sequence[Objectives]) -> List[List[int]]:
+    """
+    Splits a population of two-objective vectors into Pareto fronts in O(N log N).
+    The vectors are visited from the best to the worst on the first objective, so a vector can
+    only be dominated by the ones already visited; each front is then represented by its last
+    vector (the worst on the second objective so far), and the front of a new vector is found by a
+    binary search over those.
+    Returns the same fronts as fast_non_dominated_sort.
+    """
+    order = sorted(range(0, len(objectives)),
+                   key=lambda idx: (-objectives[idx][0], -objectives[idx][1]))
+    fronts: List[List[int]] = []
+    # The negated second objective of the last vector of each front, which is non-decreasing, so
+    # the fronts that dominate a vector are a prefix of the list.
+    last_seconds: List[float] = []
+    for idx in order:
+        first, second = objectives[idx][0], objectives[idx][1]
+        rank = bisect.bisect_right(last_seconds, -second)
+        # A vector equal to the last one of the previous front isn't dominated by it.
+        if rank > 0 and tuple(objectives[fronts[rank - 1][-1]][:2]) == (first, second):
+            rank -= 1
+        if rank == len(fronts):
+            fronts.append([])
+            last_seconds.append(-second)
+        fronts[rank].append(idx)
+        last_seconds[rank] = -second
+    return [sorted(front) for front in fronts]
+
+
+def non_dominated_sort(objectives: Sequence[Objectives]) -> List[List[int]]:
+    """Splits a population into Pareto fronts, using the O(N log N) sort for two objectives."""
+    if objectives and all(len(vector) == 2 for vector in objectives):
+        return non_dominated_sort_2d(objectives)
+    return fast_non_dominated_sort(objectives)
+
+
+def crowding_distance(objectives: Sequence[Objectives], front: Sequence[int]) -> List[float]:
+    """
+    Returns the crowding distance of each member of a front (in the same order as the front): the
+    sum over the objectives of the normalized distance between its two neighbours.
+    The extremes of each objective get an infinite distance, so they are always preferred.
+    """
+    size = len(front)
+    distances = [0.0] * size
+    if size <= 2:
+        return [math.inf] * size
+    for objective in range(0, len(objectives[front[0]])):
+        order = sorted(range(0, size), key=lambda pos: objectives[front[pos]][objective])
+        lowest = objectives[front[order[0]]][objective]
+        highest = objectives[front[order[-1]]][objective]
+        distances[order[0]] = distances[order[-1]] = math.inf
+        if highest == lowest:
+            continue
+        for before, pos, after in zip(order, order[1:], order[2:]):
+            distances[pos] += (objectives[front[after]][objective]
+                               - objectives[front[before]][objective]) / (highest - lowest)
+    return distances
+
+
+def pareto_front(objectives: Sequence[Objectives]) -> List[int]:
+    """Returns the indices of the non-dominated vectors."""
+    fronts = non_dominated_sort(objectives)
+    return fronts[0] if fronts else []
+
+
+def rank_fitness(rank: int, distance: float) -> float:
+    """
+    Encodes the front and the crowding distance of an individual as a scalar fitness that orders
+    individuals like the crowded-comparison operator of NSGA-II: a lower front always wins and,
+    within a front, the larger crowding distance wins.
+    The first front gets values in [0, 0.5], the second in [-1, -0.5], and so on.
+    """
+    return -rank + 0.5 * (1 - 1 / (1 + distance))
+
+
+class MultiObjective:
+    """
+    NSGA-II style ranking for populations with several objectives (see:
+    GenyalEngine.multi_objective).
+
+    The fitness function returns a sequence of objectives (all of them maximized) —or, if it's a
+    batch fitness function (see: genyal.evaluation.BatchFitness), one sequence per genome— which
+    the engine moves to the ``objectives`` of each individual; the ``fitness`` of each individual is
+    then replaced by a scalar that encodes its Pareto front and crowding distance (see:
+    rank_fitness), so the engine's sorting, selection strategies and elitism follow the
+    crowded-comparison order with no changes.
+    Use ``survivors`` as the engine's survivor selection to get the (mu + lambda) elitist
+    replacement of NSGA-II, and a binary tournament (``engine.selection_args = [2]``) for the
+    selection of parents.
+
+    Multi-objective populations must be list-based (objectives don't fit the fitness array of a
+    gene pool) and can't evolve in steady-state mode.
+    """
+
+    def rank(self, population: Sequence[Individual]) -> List[List[int]]:
+        """
+        Assigns the scalar fitness of each member of a population from its objectives.
+        Members that were just evaluated have their objectives in their fitness, and these are
+        moved to their objectives first.
+        Returns the fronts of the population.
+        """
+        objectives = []
+        for member in population:
+            if member.objectives is None:
+                member.objectives = self.__objectives_of(member)
+            objectives.append(member.objectives)
+        fronts = non_dominated_sort(objectives)
+        for rank, front in enumerate(fronts):
+            for idx, distance in zip(front, crowding_distance(objectives, front)):
+                population[idx].fitness = rank_fitness(rank, distance)
+        return fronts
+
+    def survivors(self, parents: Sequence[Individual], offspring: Sequence[Individual],
+                  size: int) -> List[Individual]:
+        """
+        Chooses size survivors among the parents and the offspring by front and then by crowding
+        distance, like the replacement of NSGA-II.
+        """
+        pool = list(parents) + list(offspring)
+        self.rank(pool)
+        return [pool[idx] for idx in top_indices([member.fitness for member in pool], size)]
+
+    @staticmethod
+    def pareto_front(population: Sequence[Individual]) -> List[Individual]:
+        """Returns the members of the first front of a ranked population."""
+        return [member for member in population if member.fitness >= 0]
+
+    @staticmethod
+    def __objectives_of(member: Individual) -> Tuple[float, ...]:
+        try:
+            return tuple(float(objective) for objective in member.fitness)
+        except TypeError:
+            raise GeneticsError(f"The fitness function of a multi-objective population should "
+                                f"return a sequence of objectives. Got: {member.fitness!r}.")
@@ -1 +1 @@
-ALL = ["crossover", "evolution", "mutation"]
+ALL = ["crossover", "evolution", "mutation", "replacement", "termination"]
@@ -5,10 +5,13 @@ Creative Commons Attribution 4.0 International License.
 You should have received a copy of the license along with this
 work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 """
-from copy import copy
-
 from genyal.core import GeneticsError
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 def single_point_crossover(individual, partner, cut_point: int = -1):
     """
@@ -20,12 +23,110 @@ def single_point_crossover(individual, partner, cut_point: int = -1):
             f"Can't perform a crossover over individuals of different sizes. {len(individual)} != "
             f"{len(partner)}.")
     if cut_point == -1:
-        cut_point = individual.random_generator.randrange(0, len(individual.genes))
-    child = copy(individual)
-    child.random_generator = individual.random_generator
-    crossover_genes = individual.genes[:cut_point] + partner.genes[cut_point:]
-    child.genes = crossover_genes
-    return child
+        cut_point = individual.random_generator.randrange(0, len(individual))
+    return individual.offspring(individual[:cut_point] + partner[cut_point:])
+
+
+def batch_single_point_crossover(genes, parents_a, parents_b, random_generator):
+    """
+    Returns the offspring of a whole generation using a single-point crossover strategy.
+    The cut point of each couple is selected at random, like in single_point_crossover.
+
+    Args:
+        genes:
+            A 2-D numpy array with the genes of the population (one individual per row).
+        parents_a:
+            The rows of the first partner of each couple.
+        parents_b:
+            The rows of the second partner of each couple.
+        random_generator:
+            A numpy random number generator.
+    Returns:
+        A 2-D array with the genes of each child (one per couple).
+    """
+    number_of_genes = _check_couples(genes, parents_a, parents_b)
+    cut_points = random_generator.integers(0, number_of_genes, size=(len(parents_a), 1))
+    from_partner = numpy.arange(number_of_genes) >= cut_points
+    return numpy.where(from_partner, genes[parents_b], genes[parents_a])
+
+
+def batch_two_point_crossover(genes, parents_a, parents_b, random_generator):
+    """
+    Returns the offspring of a whole generation using a two-point crossover strategy.
+    Each child takes the genes of the second partner between two random cut points and the genes
+    of the first partner elsewhere.
+    See batch_single_point_crossover for the description of the arguments.
+    """
+    number_of_genes = _check_couples(genes, parents_a, parents_b)
+    cut_points = numpy.sort(
+        random_generator.integers(0, number_of_genes + 1, size=(len(parents_a), 2)), axis=1)
+    loci = numpy.arange(number_of_genes)
+    from_partner = (loci >= cut_points[:, :1]) & (loci < cut_points[:, 1:])
+    return numpy.where(from_partner, genes[parents_b], genes[parents_a])
+
+
+def batch_uniform_crossover(genes, parents_a, parents_b, random_generator,
+                            probability: float = 0.5):
+    """
+    Returns the offspring of a whole generation using a uniform crossover strategy.
+    Each gene of a child is taken from the second partner with the given probability, and from the
+    first one otherwise.
+    See batch_single_point_crossover for the description of the other arguments.
+    """
+    number_of_genes = _check_couples(genes, parents_a, parents_b)
+    from_partner = random_generator.random((len(parents_a), number_of_genes)) < probability
+    return numpy.where(from_partner, genes[parents_b], genes[parents_a])
+
+
+def batch_arithmetic_crossover(genes, parents_a, parents_b, random_generator):
+    """
+    Returns the offspring of a whole generation using an arithmetic crossover strategy.
+    Each child is a random convex combination ``w * a + (1 - w) * b`` of its partners, with one
+    weight per child.
+    Only numeric genes are supported.
+    See batch_single_point_crossover for the description of the arguments.
+    """
+    _check_couples(genes, parents_a, parents_b)
+    _check_numeric(genes)
+    weights = random_generator.random((len(parents_a), 1))
+    offspring = weights * genes[parents_a] + (1 - weights) * genes[parents_b]
+    return _cast_like(offspring, genes)
+
+
+def batch_blend_crossover(genes, parents_a, parents_b, random_generator, alpha: float = 0.5):
+    """
+    Returns the offspring of a whole generation using a blend crossover (BLX-alpha) strategy.
+    Each gene of a child is drawn uniformly from the interval spanned by the genes of its partners,
+    extended by alpha times its length on both sides.
+    Only numeric genes are supported.
+    See batch_single_point_crossover for the description of the other arguments.
+    """
+    number_of_genes = _check_couples(genes, parents_a, parents_b)
+    _check_numeric(genes)
+    genes_a = genes[parents_a]
+    genes_b = genes[parents_b]
+    weights = random_generator.uniform(-alpha, 1 + alpha, size=(len(parents_a), number_of_genes))
+    return _cast_like(genes_a + weights * (genes_b - genes_a), genes)
+
+
+def _check_couples(genes, parents_a, parents_b) -> int:
+    """Checks that the couples of a batch crossover match and returns the number of genes."""
+    if len(parents_a) != len(parents_b):
+        raise CrossoverError(
+            f"Can't pair {len(parents_a)} individuals with {len(parents_b)} partners.")
+    return genes.shape[1]
+
+
+def _check_numeric(genes) -> None:
+    if not numpy.issubdtype(genes.dtype, numpy.number):
+        raise CrossoverError(f"Can't combine genes of type {genes.dtype} arithmetically.")
+
+
+def _cast_like(offspring, genes):
+    """Casts the offspring of an arithmetic crossover back to the data type of the genes."""
+    if numpy.issubdtype(genes.dtype, numpy.integer):
+        offspring = numpy.rint(offspring)
+    return offspring.astype(genes.dtype, copy=False)
 
 
 class CrossoverError(GeneticsError):
@@ -5,14 +5,22 @@ Creative Commons Attribution 4.0 International License.
 You should have received a copy of the license along with this
 work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 """
-from copy import copy
+import math
 from random import Random
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
+from genyal.core import GeneticsError
 from genyal.individuals import Individual
+from genyal.ranking import ranking_order
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
-def tournament_selection(population: List[Individual], random_generator: Random = Random(),
+
+def tournament_selection(population: List[Individual],
+                         random_generator: Optional[Random] = None,
                          matches: int = 5) -> Individual:
     """
     Selects the fittest from a group of individuals.
@@ -28,13 +36,249 @@ def tournament_selection(population: List[Individual], random_generator: Random
             the numbers of matches the tournament is going to last.
     Returns:
         The individual who won all the matches (i.e. the one with the highest fitness).
+        The winner is returned by reference, so it shouldn't be modified.
     """
-    best_idx = 0
+    random_generator = _own_generator(random_generator)
+    best_idx = None
     for _ in range(0, matches):
         candidate_idx = random_generator.randrange(0, len(population))
-        if best_idx is None or candidate_idx > best_idx:
+        if best_idx is None or _wins(population[candidate_idx].fitness, candidate_idx,
+                                     population[best_idx].fitness, best_idx):
             best_idx = candidate_idx
-    return copy(population[best_idx])
+    return population[best_idx if best_idx is not None else 0]
+
+
+def batch_tournament_selection(fitness: Sequence[float], count: int,
+                               random_generator=None, matches: int = 5) -> Sequence[int]:
+    """
+    Selects several parents at once using tournaments (see: tournament_selection).
+    If the random generator is a numpy generator (as the one the engine uses on array-backed
+    populations), every candidate is drawn with a single call and the tournaments are decided with
+    array reductions, so the selection does no Python work per candidate.
+
+    Args:
+        fitness:
+            the fitness of each member of the population.
+        count:
+            the number of parents to select.
+        random_generator:
+            a random number generator (or a numpy generator) to pick individuals for the matches.
+        matches:
+            the numbers of matches each tournament is going to last.
+    Returns:
+        The indices of the selected parents (a numpy array if a numpy generator was given).
+    """
+    if numpy is not None and isinstance(random_generator, numpy.random.Generator):
+        return _array_tournaments(numpy.asarray(fitness), count, random_generator, matches)
+    random_generator = _own_generator(random_generator)
+    size = len(fitness)
+    winners = []
+    for _ in range(0, count):
+        best_idx = None
+        for _ in range(0, matches):
+            candidate_idx = random_generator.randrange(0, size)
+            if best_idx is None or _wins(fitness[candidate_idx], candidate_idx,
+                                         fitness[best_idx], best_idx):
+                best_idx = candidate_idx
+        winners.append(best_idx if best_idx is not None else 0)
+    return winners
+
+
+def _array_tournaments(fitness, count: int, random_generator, matches: int):
+    """Plays count tournaments at once, breaking ties like _wins (the highest index wins)."""
+    if matches < 1:
+        return numpy.zeros(count, dtype=numpy.intp)
+    candidates = random_generator.integers(0, len(fitness), size=(count, matches))
+    candidate_fitness = fitness[candidates]
+    best = candidate_fitness.max(axis=1, keepdims=True)
+    return numpy.where(candidate_fitness == best, candidates, -1).max(axis=1)
+
+
+def _own_generator(random_generator: Optional[Random]) -> Random:
+    """
+    The generator given to a selection strategy, or a new one if none was given (a default
+    generator would be shared by every call, and by every thread calling the strategy).
+    """
+    return Random() if random_generator is None else random_generator
+
+
+def _wins(candidate_fitness: float, candidate_idx: int, best_fitness: float, best_idx: int) \
+        -> bool:
+    """
+    Decides a match of a tournament.
+    Ties are broken in favour of the highest index, so on a population sorted by fitness the winner
+    is simply the candidate with the highest index.
+    """
+    return candidate_fitness > best_fitness or (
+            candidate_fitness == best_fitness and candidate_idx > best_idx)
+
+
+def roulette_selection(fitness: Sequence[float], count: int,
+                       random_generator: Optional[Random] = None) -> List[int]:
+    """
+    Selects several parents at once with a probability proportional to their fitness.
+    An alias table (Walker's method) is built once per call, so each selection costs O(1).
+    Negative fitness values are shifted so that the least fit individual has probability 0 (if
+    every individual has the same fitness, they are chosen uniformly).
+
+    Args:
+        fitness:
+            the fitness of each member of the population.
+        count:
+            the number of parents to select.
+        random_generator:
+            a random number generator to pick the parents.
+    Returns:
+        The indices of the selected parents.
+    """
+    return _alias_draws(_alias_table(_proportional_weights(fitness)), count,
+                        _own_generator(random_generator))
+
+
+def stochastic_universal_sampling(fitness: Sequence[float], count: int,
+                                  random_generator: Optional[Random] = None) -> List[int]:
+    """
+    Selects several parents at once with a probability proportional to their fitness, using evenly
+    spaced pointers over the cumulative fitness and a single random offset.
+    Unlike roulette_selection, the number of times an individual is selected never deviates from
+    its expected value by more than one.
+    The selected indices are shuffled so that consecutive parents are paired at random.
+    See roulette_selection for the description of the arguments.
+    """
+    weights = _proportional_weights(fitness)
+    step = sum(weights) / count if count else 0
+    random_generator = _own_generator(random_generator)
+    pointer = random_generator.random() * step
+    selected = []
+    cumulative = 0.0
+    for idx, weight in enumerate(weights):
+        cumulative += weight
+        while pointer < cumulative and len(selected) < count:
+            selected.append(idx)
+            pointer += step
+    # Rounding errors may leave the last pointers beyond the cumulative fitness.
+    selected.extend([len(weights) - 1] * (count - len(selected)))
+    random_generator.shuffle(selected)
+    return selected
+
+
+def linear_rank_selection(fitness: Sequence[float], count: int,
+                          random_generator: Optional[Random] = None,
+                          selective_pressure: float = 1.5) -> List[int]:
+    """
+    Selects several parents at once with a probability that grows linearly with their rank.
+    If the population is sorted by fitness (as the engine keeps it by default) the rank of an
+    individual is its index and no sorting is needed.
+
+    Args:
+        fitness:
+            the fitness of each member of the population.
+        count:
+            the number of parents to select.
+        random_generator:
+            a random number generator to pick the parents.
+        selective_pressure:
+            the expected number of times the fittest individual is selected per individual
+            selected, a number in [1, 2].
+    Returns:
+        The indices of the selected parents.
+    """
+    if not 1 <= selective_pressure <= 2:
+        raise SelectionError(
+            f"The selective pressure should be a number in [1, 2]. Got: {selective_pressure}")
+    size = len(fitness)
+    slope = 2 * (selective_pressure - 1) / (size - 1) if size > 1 else 0
+    return _alias_draws(
+        _alias_table(_rank_weights(fitness, lambda rank: 2 - selective_pressure + slope * rank)),
+        count, _own_generator(random_generator))
+
+
+def exponential_rank_selection(fitness: Sequence[float], count: int,
+                               random_generator: Optional[Random] = None,
+                               base: float = 0.95) -> List[int]:
+    """
+    Selects several parents at once with a probability proportional to ``base ** k``, where k is
+    the number of individuals fitter than the parent.
+    Like linear_rank_selection, it only sorts the population if it isn't sorted already.
+
+    Args:
+        fitness:
+            the fitness of each member of the population.
+        count:
+            the number of parents to select.
+        random_generator:
+            a random number generator to pick the parents.
+        base:
+            a number in (0, 1]; the lower it is, the higher the selective pressure.
+    Returns:
+        The indices of the selected parents.
+    """
+    if not 0 < base <= 1:
+        raise SelectionError(f"The base should be a number in (0, 1]. Got: {base}")
+    size = len(fitness)
+    return _alias_draws(
+        _alias_table(_rank_weights(fitness, lambda rank: base ** (size - 1 - rank))),
+        count, _own_generator(random_generator))
+
+
+def _rank_weights(fitness: Sequence[float], weight_of_rank) -> List[float]:
+    """The selection weight of each individual, given the weight of each rank (0 is the worst)."""
+    if len(fitness) == 0:
+        raise SelectionError("Can't select individuals from an empty population.")
+    weights = [0.0] * len(fitness)
+    for rank, idx in enumerate(ranking_order(fitness)):
+        weights[idx] = weight_of_rank(rank)
+    return weights
+
+
+def _proportional_weights(fitness: Sequence[float]) -> List[float]:
+    """The non-negative weights used by the fitness-proportionate strategies."""
+    if len(fitness) == 0:
+        raise SelectionError("Can't select individuals from an empty population.")
+    lowest = min(fitness)
+    weights = [value - lowest for value in fitness] if lowest < 0 else list(fitness)
+    if sum(weights) <= 0:
+        return [1.0] * len(weights)
+    return weights
+
+
+def _alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """
+    Builds the alias table of a discrete distribution (Vose's algorithm) in O(n).
+    Returns the probability of keeping each column and the alias of each column.
+    If every weight is zero, the distribution is uniform.
+    """
+    size = len(weights)
+    if size == 0:
+        raise SelectionError("Can't select individuals from an empty population.")
+    total = math.fsum(weights)
+    if total <= 0:
+        return [1.0] * size, list(range(0, size))
+    scaled = [weight * size / total for weight in weights]
+    probabilities = [1.0] * size
+    aliases = list(range(0, size))
+    small = [idx for idx, value in enumerate(scaled) if value < 1]
+    large = [idx for idx, value in enumerate(scaled) if value >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    return probabilities, aliases
+
+
+def _alias_draws(table: Tuple[List[float], List[int]], count: int,
+                 random_generator: Random) -> List[int]:
+    """Draws indices from an alias table using a single random number per draw."""
+    probabilities, aliases = table
+    size = len(probabilities)
+    selected = []
+    for _ in range(0, count):
+        column, remainder = divmod(random_generator.random() * size, 1)
+        column = min(int(column), size - 1)
+        selected.append(column if remainder < probabilities[column] else aliases[column])
+    return selected
 
 
 def default_terminating_function(engine, max_generations=100):
@@ -52,3 +296,10 @@ def default_terminating_function(engine, max_generations=100):
         True when the engine has evolved the population until the indicated generation.
     """
     return engine.generation >= max_generations
+
+
+class SelectionError(GeneticsError):
+    """If an error occurs during a selection operation"""
+
+    def __init__(self, cause: str):
+        super(SelectionError, self).__init__(cause)
@@ -6,18 +6,114 @@ You should have received a copy of the license along with this
 work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
 """
 
-from copy import copy
+import math
+from random import Random
+from typing import Iterator
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
-def simple_mutation(original_individual):
+
+def simple_mutation(original_individual, *, in_place: bool = False):
     """
     Returns a new individual resulting from mutating the original with a given mutation rate.
-    The second argument is a placeholder.
+    If in_place is set, the genes of the original are replaced instead and the original itself is
+    returned (the engine does this with the children it has just created by crossover, which
+    aren't shared with anyone).
+    """
+
+    random_generator = original_individual.random_generator
+    mutation_rate = original_individual.mutation_rate
+    kept = [random_generator.random() <= mutation_rate for _ in original_individual]
+    # The new genes are made in a single batch once the mutated positions are known.
+    new_genes = iter(original_individual.gene_factory.make_many(kept.count(False)))
+    genes = [gene if keep else next(new_genes) for gene, keep in zip(original_individual, kept)]
+    if in_place:
+        original_individual[:] = genes
+        return original_individual
+    return original_individual.offspring(genes)
+
+
+def sparse_mutation(original_individual, *, in_place: bool = False):
     """
+    Returns a new individual where each gene of the original is replaced by a new one with a
+    probability equal to the mutation rate.
 
-    new_individual = copy(original_individual)
-    new_individual.genes = [
-        gene if new_individual.random_generator.random() <= new_individual.mutation_rate
-        else new_individual.gene_factory.make()
-        for gene in new_individual.genes]
-    return new_individual
+    Instead of drawing a random number per gene, the positions to mutate are sampled directly
+    by skipping ahead a geometrically distributed number of genes, so the cost is proportional to
+    the number of mutated genes rather than to the length of the genome.
+    Note that, unlike simple_mutation (which keeps each gene with probability mutation_rate), here
+    the mutation rate is the probability of replacing a gene.
+    If in_place is set, the original is mutated and returned (see: simple_mutation).
+    """
+    genes = original_individual if in_place else list(original_individual)
+    loci = list(mutation_loci(len(genes), original_individual.mutation_rate,
+                              original_individual.random_generator))
+    for locus, gene in zip(loci, original_individual.gene_factory.make_many(len(loci))):
+        genes[locus] = gene
+    return original_individual if in_place else original_individual.offspring(genes)
+
+
+# The strategies that can mutate an individual in place, which the engine uses to avoid creating a
+# second individual for each child.
+IN_PLACE_MUTATIONS = (simple_mutation, sparse_mutation)
+
+
+def mutation_loci(number_of_genes: int, mutation_rate: float,
+                  random_generator: Random) -> Iterator[int]:
+    """
+    Yields the (increasing) positions of the genes to mutate, choosing each position independently
+    with probability mutation_rate.
+    The gap between two consecutive positions follows a geometric distribution, so only one
+    random number is drawn per mutated gene.
+    """
+    if mutation_rate <= 0:
+        return
+    if mutation_rate >= 1:
+        yield from range(0, number_of_genes)
+        return
+    log_complement = math.log1p(-mutation_rate)
+    locus = -1
+    while True:
+        locus += 1 + int(math.log(1.0 - random_generator.random()) / log_complement)
+        if locus >= number_of_genes:
+            return
+        yield locus
+
+
+def batch_simple_mutation(genes, mutation_rate, gene_factory, random_generator):
+    """
+    Mutates the genes of a whole generation (in place) with the same rule as simple_mutation and
+    returns them.
+
+    Args:
+        genes:
+            A 2-D numpy array with the genes of the offspring (one individual per row).
+        mutation_rate:
+            The mutation rate of the individuals.
+        gene_factory:
+            The factory used to produce the new genes.
+        random_generator:
+            A numpy random number generator.
+    """
+    replaced = random_generator.random(genes.shape) > mutation_rate
+    genes[replaced] = gene_factory.make_array(int(numpy.count_nonzero(replaced)), genes.dtype)
+    return genes
+
+
+def batch_sparse_mutation(genes, mutation_rate, gene_factory, random_generator):
+    """
+    Mutates the genes of a whole generation (in place) with the same rule as sparse_mutation and
+    returns them.
+    The number of mutated genes is drawn from a binomial distribution and their positions are then
+    sampled without replacement, so the cost is proportional to the number of mutations.
+    See batch_simple_mutation for the description of the arguments.
+    """
+    mutations = int(random_generator.binomial(genes.size, min(max(mutation_rate, 0), 1)))
+    if mutations:
+        loci = random_generator.choice(genes.size, size=mutations, replace=False)
+        rows, columns = numpy.divmod(loci, genes.shape[1])
+        genes[rows, columns] = gene_factory.make_array(mutations, genes.dtype)
+    return genes
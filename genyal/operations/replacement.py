@@ -0,0 +1,128 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import heapq
+from bisect import bisect_right
+from typing import List, Sequence, Tuple
+
+from genyal.individuals import Individual
+from genyal.operations.evolution import SelectionError
+from genyal.ranking import top_indices
+
+
+def insert_sorted(population: List[Individual], fitness: List[float],
+                  offspring: Individual) -> bool:
+    """
+    Replaces the least fit member of a population sorted by fitness (ascending) with an evaluated
+    offspring, which is placed with a binary search so the population stays sorted.
+
+    Args:
+        population:
+            the members of the population, from the least fit to the fittest.
+        fitness:
+            the fitness of each member, in the same order as the population.
+            It's updated along with the population.
+        offspring:
+            the individual to insert.
+    Returns:
+        True if the offspring was inserted, or False if it was discarded for being less fit than
+        every member of the population.
+    """
+    if not population or offspring.fitness < fitness[0]:
+        return False
+    del population[0]
+    del fitness[0]
+    # Inserting to the right of equal values keeps the order of a stable sort.
+    idx = bisect_right(fitness, offspring.fitness)
+    population.insert(idx, offspring)
+    fitness.insert(idx, offspring.fitness)
+    return True
+
+
+def worst_heap(fitness: Sequence[float]) -> List[Tuple[float, int]]:
+    """
+    Returns a min-heap with the (fitness, index) pairs of the members of an unsorted population,
+    to be used with replace_worst.
+    """
+    heap = [(value, idx) for idx, value in enumerate(fitness)]
+    heapq.heapify(heap)
+    return heap
+
+
+def replace_worst(population: List[Individual], fitness: List[float],
+                  heap: List[Tuple[float, int]], offspring: Individual) -> bool:
+    """
+    Replaces the least fit member of an unsorted population with an evaluated offspring in
+    O(log n), keeping the rest of the members in place.
+
+    Args:
+        population:
+            the members of the population.
+        fitness:
+            the fitness of each member, in the same order as the population.
+            It's updated along with the population.
+        heap:
+            the min-heap of the population (see: worst_heap).
+            It's updated along with the population.
+        offspring:
+            the individual to insert.
+    Returns:
+        True if the offspring was inserted, or False if it was discarded for being less fit than
+        every member of the population.
+    """
+    if not heap or offspring.fitness < heap[0][0]:
+        return False
+    idx = heap[0][1]
+    heapq.heapreplace(heap, (offspring.fitness, idx))
+    population[idx] = offspring
+    fitness[idx] = offspring.fitness
+    return True
+
+
+def plus_selection(parents: Sequence[Individual], offspring: Sequence[Individual],
+                   size: int) -> List[Individual]:
+    """
+    The (mu + lambda) survivor selection: the fittest individuals among the parents and their
+    offspring survive.
+    Ties are broken in favour of the offspring.
+
+    Args:
+        parents:
+            the evaluated members of the current population.
+        offspring:
+            the evaluated offspring of the population.
+        size:
+            the number of survivors.
+    Returns:
+        The survivors (by reference), from the fittest to the least fit.
+    """
+    candidates = list(parents) + list(offspring)
+    return [candidates[idx]
+            for idx in top_indices([candidate.fitness for candidate in candidates], size)]
+
+
+def comma_selection(parents: Sequence[Individual], offspring: Sequence[Individual],
+                    size: int) -> List[Individual]:
+    """
+    The (mu, lambda) survivor selection: only the fittest offspring survive, and every parent is
+    discarded.
+
+    Args:
+        parents:
+            the members of the current population (ignored).
+        offspring:
+            the evaluated offspring of the population.
+            There should be at least as many offspring as survivors.
+        size:
+            the number of survivors.
+    Returns:
+        The survivors (by reference), from the fittest to the least fit.
+    """
+    if len(offspring) < size:
+        raise SelectionError(f"Can't select {size} survivors from {len(offspring)} offspring.")
+    return [offspring[idx]
+            for idx in top_indices([child.fitness for child in offspring], size)]
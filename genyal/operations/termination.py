@@ -0,0 +1,220 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Terminating criteria for the engine.
+
+A criterion is a terminating function (it's called with the engine before each generation and
+returns True to stop the evolution) that can be combined with others using ``&`` (stop when every
+criterion is met) and ``|`` (stop when any criterion is met), e.g.::
+
+    engine = GenyalEngine(terminating_function=MaxGenerations(500) | Stagnation(30)
+                                               | TargetFitness(1.0))
+
+Criteria only read the statistics the engine already keeps (the fittest individual, the number of
+evaluations and the cached fitness statistics), so checking them costs O(1) per generation; the
+exception is DiversityCollapse, which reads the genotypic diversity the engine computes (in
+near-linear time) once per generation.
+Some criteria keep state between calls, so each engine should get its own instances.
+"""
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple
+
+from genyal.core import GeneticsError
+
+TerminatingFunction = Callable[..., bool]
+
+
+class TerminatingCriterion(ABC):
+    """Base class of the composable terminating criteria."""
+
+    @abstractmethod
+    def __call__(self, engine, *args) -> bool:
+        """Returns True if the evolution of the engine should stop."""
+
+    def reset(self) -> None:
+        """Discards the state kept from previous calls (if any)."""
+
+    def __and__(self, other: TerminatingFunction) -> 'AllOf':
+        return AllOf(self, other)
+
+    def __rand__(self, other: TerminatingFunction) -> 'AllOf':
+        return AllOf(other, self)
+
+    def __or__(self, other: TerminatingFunction) -> 'AnyOf':
+        return AnyOf(self, other)
+
+    def __ror__(self, other: TerminatingFunction) -> 'AnyOf':
+        return AnyOf(other, self)
+
+
+class AllOf(TerminatingCriterion):
+    """
+    Stops the evolution when every one of its criteria is met.
+    Every criterion is called on each generation (there's no short-circuit), so the ones that keep
+    track of the evolution (e.g. Stagnation) never miss a generation.
+    """
+    __criteria: Tuple[TerminatingFunction, ...]
+
+    def __init__(self, *criteria: TerminatingFunction):
+        self.__criteria = criteria
+
+    def __call__(self, engine, *args) -> bool:
+        return all([criterion(engine, *args) for criterion in self.__criteria])
+
+    def reset(self) -> None:
+        for criterion in self.__criteria:
+            if isinstance(criterion, TerminatingCriterion):
+                criterion.reset()
+
+    @property
+    def criteria(self) -> Tuple[TerminatingFunction, ...]:
+        """The combined criteria."""
+        return self.__criteria
+
+
+class AnyOf(AllOf):
+    """Stops the evolution when any of its criteria is met (see: AllOf)."""
+
+    def __call__(self, engine, *args) -> bool:
+        return any([criterion(engine, *args) for criterion in self.criteria])
+
+
+class MaxGenerations(TerminatingCriterion):
+    """Stops the evolution after a number of generations (like default_terminating_function)."""
+    __generations: int
+
+    def __init__(self, generations: int = 100):
+        self.__generations = generations
+
+    def __call__(self, engine, *args) -> bool:
+        return engine.generation >= self.__generations
+
+
+class TargetFitness(TerminatingCriterion):
+    """Stops the evolution once the fittest individual reaches a target fitness."""
+    __target: float
+
+    def __init__(self, target: float):
+        self.__target = target
+
+    def __call__(self, engine, *args) -> bool:
+        return engine.fittest is not None and engine.fittest.fitness >= self.__target
+
+
+class Stagnation(TerminatingCriterion):
+    """
+    Stops the evolution when the highest fitness hasn't improved (by more than a tolerance) for a
+    number of generations.
+    Only the best fitness seen and the generation where it was reached are kept.
+    """
+    __best: float
+    __generations: int
+    __improved_at: int
+    __tolerance: float
+
+    def __init__(self, generations: int, tolerance: float = 0.0):
+        """
+        Args:
+            generations:
+                The number of generations without improvement after which the evolution stops.
+            tolerance:
+                The minimum increase of the highest fitness that counts as an improvement.
+        """
+        if generations < 1:
+            raise GeneticsError(f"The number of generations should be positive. "
+                                f"Got: {generations}.")
+        self.__generations = generations
+        self.__tolerance = tolerance
+        self.reset()
+
+    def __call__(self, engine, *args) -> bool:
+        if engine.fittest is None:
+            return False
+        generation, best = engine.generation, engine.fittest.fitness
+        # An engine that goes back in time (e.g. resumed from a checkpoint) starts over.
+        if generation < self.__improved_at:
+            self.reset()
+        if best > self.__best + self.__tolerance:
+            self.__best, self.__improved_at = best, generation
+        return generation - self.__improved_at >= self.__generations
+
+    def reset(self) -> None:
+        self.__best = -math.inf
+        self.__improved_at = 0
+
+
+class TimeBudget(TerminatingCriterion):
+    """Stops the evolution once a wall-clock budget is spent, counted from the first call."""
+    __clock: Callable[[], float]
+    __seconds: float
+    __start: Optional[float]
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.__seconds = seconds
+        self.__clock = clock
+        self.__start = None
+
+    def __call__(self, engine, *args) -> bool:
+        now = self.__clock()
+        if self.__start is None:
+            self.__start = now
+        return now - self.__start >= self.__seconds
+
+    def reset(self) -> None:
+        self.__start = None
+
+
+class EvaluationBudget(TerminatingCriterion):
+    """Stops the evolution once the engine has made a number of fitness evaluations."""
+    __evaluations: int
+
+    def __init__(self, evaluations: int):
+        self.__evaluations = evaluations
+
+    def __call__(self, engine, *args) -> bool:
+        return engine.evaluations >= self.__evaluations
+
+
+class FitnessSpreadCollapse(TerminatingCriterion):
+    """
+    Stops the evolution when the standard deviation of the fitness of the population falls to a
+    threshold, i.e. when the population has converged in fitness.
+    Members with different genes may share the same fitness, so this doesn't mean the population
+    lost its diversity (see: DiversityCollapse).
+    """
+    __threshold: float
+
+    def __init__(self, threshold: float = 1e-12):
+        self.__threshold = threshold
+
+    def __call__(self, engine, *args) -> bool:
+        return bool(engine.population) and engine.fitness_std <= self.__threshold
+
+
+class DiversityCollapse(TerminatingCriterion):
+    """
+    Stops the evolution when the mean Hamming distance between the members of the population falls
+    to a threshold, i.e. when the population has converged in genotype (see:
+    GenyalEngine.diversity).
+    With the default threshold, it stops once every member has the same genes.
+    """
+    __threshold: float
+
+    def __init__(self, threshold: float = 0.0):
+        """
+        Args:
+            threshold:
+                The mean number of loci where two members differ at or below which the evolution
+                stops.
+        """
+        self.__threshold = threshold
+
+    def __call__(self, engine, *args) -> bool:
+        return bool(engine.population) \
+               and engine.diversity.mean_hamming_distance <= self.__threshold
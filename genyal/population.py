@@ -0,0 +1,330 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+from random import Random
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple)
+
+from genyal.core import DNA, GeneticsError
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual, seed_genomes
+from genyal.operations.crossover import single_point_crossover
+from genyal.operations.mutation import simple_mutation
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class GenePool(Generic[DNA]):
+    """
+    A population whose genes are stored in a single contiguous 2-D numpy array.
+
+    Each row of the array holds the genes of one individual, and the fitness of the individuals is
+    kept on a parallel array (NaN marks the individuals that haven't been evaluated yet).
+    The members of the pool are lightweight views over a row (see: PooledIndividual), and they
+    share the configuration of the pool (mutation rate, gene factory, strategies and random number
+    generator).
+
+    The fitness function of a pool gets the genes of each member as a read-only numpy row (not a
+    list), whatever the evaluator that computes it.
+    Gene pools need numpy and are meant for numeric (or fixed-size string) genes; populations with
+    arbitrary genes should use the list-based individuals.
+    """
+    __crossover_strategy: Callable[..., Individual]
+    __fitness: 'numpy.ndarray'
+    __gene_factory: GeneFactory[DNA]
+    __genes: 'numpy.ndarray'
+    __mutation_rate: float
+    __mutation_strategy: Callable[..., Individual]
+    __random_generator: Random
+
+    def __init__(self, genes, mutation_rate: float = 0.01,
+                 gene_factory: GeneFactory[DNA] = GeneFactory(),
+                 crossover_strategy=single_point_crossover, mutation_strategy=simple_mutation,
+                 random_generator: Optional[Random] = None, fitness=None, dtype: Any = None):
+        """
+        Initializes a pool from the genes of its members.
+
+        Args:
+            genes:
+                A 2-D array-like with the genes of one individual per row.
+            mutation_rate:
+                The mutation rate of the members of the pool.
+            gene_factory:
+                The factory used to produce new genes for the members of the pool.
+            crossover_strategy:
+                The function to perform the crossover between members of the pool.
+            mutation_strategy:
+                The function to perform the mutation of the members of the pool.
+            random_generator:
+                The random number generator given to the members of the pool.
+            fitness:
+                The fitness of each member, if already known.
+            dtype:
+                The data type of the genes.
+                If none given, it's inferred from the genes.
+        """
+        if numpy is None:
+            raise GeneticsError("Gene pools require numpy.")
+        self.__genes = numpy.ascontiguousarray(genes, dtype=dtype)
+        if self.__genes.ndim != 2:
+            raise GeneticsError(
+                f"The genes of a pool should be a 2-D array. Got {self.__genes.ndim} dimensions.")
+        if fitness is None:
+            self.__fitness = numpy.full(len(self.__genes), numpy.nan)
+        else:
+            self.__fitness = numpy.array(fitness, dtype=numpy.float64)
+        self.__mutation_rate = mutation_rate
+        self.__gene_factory = gene_factory
+        self.__crossover_strategy = crossover_strategy
+        self.__mutation_strategy = mutation_strategy
+        self.__random_generator = Random() if random_generator is None else random_generator
+
+    @classmethod
+    def create(cls, number_of_individuals: int, number_of_genes: int,
+               gene_factory: GeneFactory[DNA], dtype: Any, mutation_rate: float = 0.01,
+               seeds: Optional[Iterable[Sequence[DNA]]] = None,
+               random_generator: Optional[Random] = None) -> 'GenePool[DNA]':
+        """
+        Factory method to create a pool with genes produced by a gene factory.
+
+        Args:
+            number_of_individuals:
+                number of individuals of the pool.
+            number_of_genes:
+                the number of genes each individual should have.
+            gene_factory:
+                the factory to generate the genes.
+            dtype:
+                the data type of the genes.
+            mutation_rate:
+                the probability with which the genes of an individual will mutate.
+            seeds:
+                genomes used as the genes of the first rows of the pool; the rest are generated by
+                the factory.
+            random_generator:
+                the random number generator of the members of the pool.
+        """
+        if numpy is None:
+            raise GeneticsError("Gene pools require numpy.")
+        genes = numpy.empty((number_of_individuals, number_of_genes), dtype=dtype)
+        genomes = seed_genomes(seeds, number_of_individuals, number_of_genes)
+        if genomes:
+            genes[:len(genomes)] = genomes
+        genes[len(genomes):].reshape(-1)[:] = gene_factory.make_array(
+            (number_of_individuals - len(genomes)) * number_of_genes, genes.dtype)
+        return cls(genes, mutation_rate, gene_factory, random_generator=random_generator)
+
+    def like(self, genes, fitness=None) -> 'GenePool[DNA]':
+        """Returns a new pool with the given genes and the same configuration as this one."""
+        return GenePool(genes, self.__mutation_rate, self.__gene_factory,
+                        self.__crossover_strategy, self.__mutation_strategy,
+                        self.__random_generator, fitness, self.__genes.dtype)
+
+    def from_individuals(self, individuals: Sequence[Individual]) -> 'GenePool[DNA]':
+        """
+        Packs a sequence of individuals into a new pool with the same configuration as this one.
+        The fitness of the individuals (if computed) is kept.
+        The members of a pool (e.g. the survivors of a generation, taken from the parents and the
+        offspring pools) are gathered with a single indexing operation per pool; only list-based
+        individuals are copied one by one.
+        """
+        genes = numpy.empty((len(individuals), self.number_of_genes), dtype=self.__genes.dtype)
+        fitness = numpy.full(len(individuals), numpy.nan)
+        # The positions on the new pool and the rows on their pool of the members of each pool.
+        members: Dict[int, Tuple[GenePool, List[int], List[int]]] = {}
+        for position, individual in enumerate(individuals):
+            if isinstance(individual, PooledIndividual):
+                _, positions, rows = members.setdefault(id(individual.pool),
+                                                        (individual.pool, [], []))
+                positions.append(position)
+                rows.append(individual.row)
+            else:
+                genes[position] = individual.genes
+                if individual.fitness is not None:
+                    fitness[position] = individual.fitness
+        for pool, positions, rows in members.values():
+            genes[positions] = pool.genes[rows]
+            fitness[positions] = pool.fitness[rows]
+        return self.like(genes, fitness)
+
+    def sorted(self) -> 'GenePool[DNA]':
+        """Returns a new pool with the same members sorted by their fitness (ascending)."""
+        order = numpy.argsort(self.__fitness, kind="stable")
+        return self.like(self.__genes[order], self.__fitness[order])
+
+    def individuals(self) -> List['PooledIndividual[DNA]']:
+        """The members of this pool, in the same order as the rows of the genes array."""
+        return [PooledIndividual(self, row) for row in range(0, len(self.__genes))]
+
+    # region : Properties
+    @property
+    def genes(self) -> 'numpy.ndarray':
+        """The genes of the pool (one individual per row)."""
+        return self.__genes
+
+    @property
+    def fitness(self) -> 'numpy.ndarray':
+        """The fitness of each member of the pool (NaN if it hasn't been computed)."""
+        return self.__fitness
+
+    @property
+    def dtype(self) -> Any:
+        """The data type of the genes."""
+        return self.__genes.dtype
+
+    @property
+    def number_of_genes(self) -> int:
+        """The number of genes of each member of the pool."""
+        return self.__genes.shape[1]
+
+    @property
+    def mutation_rate(self) -> float:
+        """The probability with which the genes of the members will mutate."""
+        return self.__mutation_rate
+
+    @property
+    def gene_factory(self) -> GeneFactory[DNA]:
+        """The factory used to produce new genes for the members of the pool."""
+        return self.__gene_factory
+
+    @property
+    def crossover_strategy(self) -> Callable[..., Individual]:
+        """The strategy to perform a crossover between members of the pool."""
+        return self.__crossover_strategy
+
+    @property
+    def mutation_strategy(self) -> Callable[..., Individual]:
+        """The strategy to perform a mutation over the members of the pool."""
+        return self.__mutation_strategy
+
+    @property
+    def random_generator(self) -> Random:
+        """The random number generator given to the members of the pool."""
+        return self.__random_generator
+
+    # endregion
+
+    def __getitem__(self, row: int) -> 'PooledIndividual[DNA]':
+        """The member of the pool stored at a given row."""
+        return PooledIndividual(self, row)
+
+    def __len__(self) -> int:
+        """The number of members of the pool."""
+        return len(self.__genes)
+
+
+class PooledIndividual(Individual[DNA]):
+    """
+    An individual whose genes and fitness live in a row of a gene pool.
+    Reading the genes of a pooled individual returns a list with a copy of the row; the row itself
+    can be read without copying through ``gene_view``.
+    Copies of a pooled individual (e.g. the ones made by the crossover and mutation strategies) are
+    regular list-based individuals.
+    """
+    __slots__ = ("__pool", "__row")
+    __pool: GenePool[DNA]
+    __row: int
+
+    def __init__(self, pool: GenePool[DNA], row: int):
+        """
+        Initializes a view over a row of a pool.
+
+        Args:
+            pool:
+                The pool holding the genes of the individual.
+            row:
+                The index of the row of the individual.
+        """
+        super(PooledIndividual, self).__init__((), pool.mutation_rate, pool.gene_factory,
+                                               pool.crossover_strategy, pool.mutation_strategy,
+                                               pool.random_generator)
+        self.__pool = pool
+        self.__row = row
+
+    def compute_fitness_using(self, fitness_function: Callable[..., float], *args):
+        """Computes this individual's fitness (over a view of its row) if it hasn't been yet."""
+        if self.__pool.number_of_genes == 0:
+            raise GeneticsError("The individual should have genes.")
+        if self.fitness is None:
+            self.fitness = fitness_function(self.gene_view, *args)
+
+    def set(self, number_of_genes: int, *args):
+        """Generate the genes of the individual."""
+        if number_of_genes != self.__pool.number_of_genes:
+            raise GeneticsError(f"The members of the pool have {self.__pool.number_of_genes} "
+                                f"genes. Got: {number_of_genes}.")
+        genes = self.__pool.genes[self.__row]
+        genes[:] = self.gene_factory.make_array(number_of_genes, genes.dtype)
+
+    @property
+    def pool(self) -> GenePool[DNA]:
+        """The pool holding the genes of this individual."""
+        return self.__pool
+
+    @property
+    def row(self) -> int:
+        """The index of the row of the pool holding the genes of this individual."""
+        return self.__row
+
+    @property
+    def fitness(self) -> Optional[float]:
+        """The fitness of this individual according to its fitness function."""
+        fitness = self.__pool.fitness[self.__row]
+        return None if math.isnan(fitness) else float(fitness)
+
+    @fitness.setter
+    def fitness(self, value: Optional[float]) -> None:
+        """Assigns a fitness computed elsewhere (e.g. by an evaluator) to this individual."""
+        self.__pool.fitness[self.__row] = numpy.nan if value is None else value
+
+    @property
+    def genes(self) -> List[DNA]:
+        """The genes of this individual"""
+        return self.__pool.genes[self.__row].tolist()
+
+    @genes.setter
+    def genes(self, new_genes: Sequence[DNA]):
+        """Overwrites the row of this individual with a new set of genes"""
+        self.__pool.genes[self.__row] = new_genes
+
+    @property
+    def gene_view(self) -> 'numpy.ndarray':
+        """A read-only view over the row with the genes of this individual."""
+        view = self.__pool.genes[self.__row]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        """The number of genes of this individual"""
+        return self.__pool.number_of_genes
+
+    def __getitem__(self, index):
+        """Returns a gene (or a list of genes if the index is a slice) of this individual."""
+        genes = self.__pool.genes[self.__row]
+        return genes[index].tolist()
+
+    def __setitem__(self, index, value) -> None:
+        """Replaces a gene (or a slice of genes) in the row of this individual."""
+        self.__pool.genes[self.__row, index] = value
+        self.fitness = None
+        self.objectives = None
+
+    def __iter__(self) -> Iterator[DNA]:
+        """Iterates over the genes of this individual."""
+        return iter(self.genes)
+
+    def __repr__(self) -> str:
+        """An individual is represented by its fitness and its genes."""
+        return f"{self.fitness} - {self.genes}"
+
+    def __copy__(self) -> Individual[DNA]:
+        """Returns a list-based copy of this individual."""
+        return self.offspring(self.genes)
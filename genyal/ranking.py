@@ -0,0 +1,71 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import heapq
+from typing import List, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def best_index(fitness: Sequence[float]) -> int:
+    """
+    Returns the index of the highest fitness in O(n).
+    Ties are broken in favour of the last index, which matches the fittest individual of a
+    population sorted with a stable sort.
+    """
+    if _is_array(fitness):
+        return len(fitness) - 1 - int(numpy.argmax(fitness[::-1]))
+    best = 0
+    for idx in range(1, len(fitness)):
+        if fitness[idx] >= fitness[best]:
+            best = idx
+    return best
+
+
+def top_indices(fitness: Sequence[float], k: int) -> List[int]:
+    """
+    Returns the indices of the k highest fitness values, from the fittest to the least fit (ties
+    are broken in favour of the last index, as in best_index).
+    It costs O(n log k) (or O(n + k log k) for numpy arrays) instead of sorting the whole sequence.
+    """
+    k = max(0, min(k, len(fitness)))
+    if k == 0:
+        return []
+    if _is_array(fitness):
+        threshold = numpy.partition(fitness, len(fitness) - k)[len(fitness) - k]
+        above = numpy.flatnonzero(fitness > threshold)
+        ties = numpy.flatnonzero(fitness == threshold)[::-1][:k - len(above)]
+        candidates = numpy.concatenate((above, ties))
+        return candidates[numpy.lexsort((-candidates, -fitness[candidates]))].tolist()
+    return heapq.nlargest(k, range(0, len(fitness)), key=lambda idx: (fitness[idx], idx))
+
+
+def ranking_order(fitness: Sequence[float]) -> List[int]:
+    """
+    Returns the indices of a sequence ordered from the lowest to the highest fitness.
+    If the sequence is already sorted (like the population of an engine that sorts its
+    generations) this takes O(n); otherwise the indices are sorted by their fitness value.
+    """
+    if is_sorted(fitness):
+        return list(range(0, len(fitness)))
+    if _is_array(fitness):
+        return numpy.argsort(fitness, kind="stable").tolist()
+    return sorted(range(0, len(fitness)), key=fitness.__getitem__)
+
+
+def is_sorted(fitness: Sequence[float]) -> bool:
+    """Checks in O(n) if a sequence of fitness values is in ascending order."""
+    if _is_array(fitness):
+        return bool(numpy.all(fitness[:-1] <= fitness[1:]))
+    return all(fitness[idx] <= fitness[idx + 1] for idx in range(0, len(fitness) - 1))
+
+
+def _is_array(fitness: Sequence[float]) -> bool:
+    return numpy is not None and isinstance(fitness, numpy.ndarray)
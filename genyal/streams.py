@@ -0,0 +1,92 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import hashlib
+import secrets
+from random import Random
+from typing import List, Optional, Tuple, Union
+
+from genyal.core import GeneticsError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# The parts of the key of a stream, e.g. ("island", 3) or ("batch", generation, index).
+KeyPart = Union[int, str]
+
+
+class RandomStreams:
+    """
+    A tree of independent and reproducible random number streams derived from a master seed.
+
+    Each stream is identified by a key (a tuple of ints and strings) and its seed is a hash of the
+    master seed and the key, so the stream given to a worker, island or batch depends only on what
+    it is and not on how many workers there are or in which order they ask for their streams.
+    This makes parallel runs match for a given master seed no matter the worker count, which isn't
+    possible with a single generator shared by every worker.
+
+    Example:
+        streams = RandomStreams(2021)
+        island_generators = [streams.random("island", idx) for idx in range(0, 4)]
+        batch_streams = streams.spawn("batch", generation)
+    """
+    __entropy: int
+    __key: Tuple[KeyPart, ...]
+
+    def __init__(self, seed: Optional[int] = None, key: Tuple[KeyPart, ...] = ()):
+        """
+        Initializes the streams.
+
+        Args:
+            seed:
+                The master seed.
+                If none given, a random one is drawn from the operating system (see: entropy).
+            key:
+                The key of the node of the tree, used by spawn.
+        """
+        self.__entropy = secrets.randbits(128) if seed is None else seed
+        self.__key = tuple(key)
+
+    def seed(self, *key: KeyPart) -> int:
+        """Returns the (128-bit) seed of the stream with the given key."""
+        for part in key:
+            if not isinstance(part, (int, str)):
+                raise GeneticsError(f"The keys of the streams should be ints or strings. "
+                                    f"Got: {part!r}.")
+        digest = hashlib.blake2b(repr((self.__entropy,) + self.__key + key).encode(),
+                                 digest_size=16)
+        return int.from_bytes(digest.digest(), "little")
+
+    def random(self, *key: KeyPart) -> Random:
+        """Returns a new random number generator for the stream with the given key."""
+        return Random(self.seed(*key))
+
+    def numpy(self, *key: KeyPart):
+        """Returns a new numpy random number generator for the stream with the given key."""
+        if numpy is None:
+            raise GeneticsError("Numpy streams require numpy.")
+        return numpy.random.default_rng(self.seed(*key))
+
+    def spawn(self, *key: KeyPart) -> 'RandomStreams':
+        """Returns the sub-tree of streams whose keys start with the given key."""
+        return RandomStreams(self.__entropy, self.__key + key)
+
+    def spawn_many(self, count: int, *key: KeyPart) -> List['RandomStreams']:
+        """Returns count independent sub-trees, one for each index in [0, count)."""
+        return [self.spawn(*key, idx) for idx in range(0, count)]
+
+    @property
+    def entropy(self) -> int:
+        """The master seed, which is enough to reproduce every stream."""
+        return self.__entropy
+
+    @property
+    def key(self) -> Tuple[KeyPart, ...]:
+        """The key of this node of the tree."""
+        return self.__key
@@ -0,0 +1,73 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+from typing import NamedTuple, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class GenerationSummary(NamedTuple):
+    """
+    The statistics of a generation, as produced by GenyalEngine.generations.
+    Summaries don't keep references to the population, so they are cheap to store or stream.
+
+    Attributes:
+        generation:
+            The number of the generation.
+        best:
+            The highest fitness of the generation.
+        mean:
+            The mean fitness of the generation.
+        std:
+            The (population) standard deviation of the fitness of the generation.
+        evaluations:
+            The number of fitness evaluations made to produce the generation.
+        total_evaluations:
+            The number of fitness evaluations made by the engine so far.
+        seconds:
+            The wall time it took to produce the generation.
+        elapsed:
+            The wall time since the engine started yielding summaries.
+    """
+    generation: int
+    best: float
+    mean: float
+    std: float
+    evaluations: int
+    total_evaluations: int
+    seconds: float
+    elapsed: float
+
+    @classmethod
+    def of(cls, generation: int, fitness: Sequence[float], evaluations: int,
+           total_evaluations: int, seconds: float, elapsed: float) -> 'GenerationSummary':
+        """Summarizes the fitness values of a generation in a single pass (O(n))."""
+        best, mean, std = fitness_statistics(fitness)
+        return cls(generation, best, mean, std, evaluations, total_evaluations, seconds, elapsed)
+
+
+def fitness_statistics(fitness: Sequence[float]) -> Tuple[float, float, float]:
+    """
+    Returns the highest, the mean and the (population) standard deviation of a sequence of fitness
+    values in a single pass, or NaNs if it's empty.
+    """
+    if not len(fitness):
+        return math.nan, math.nan, math.nan
+    if numpy is not None and isinstance(fitness, numpy.ndarray):
+        return float(fitness.max()), float(fitness.mean()), float(fitness.std())
+    best, mean, squares = -math.inf, 0.0, 0.0
+    # Welford's algorithm keeps the variance accurate without a second pass.
+    for count, value in enumerate(fitness, 1):
+        best = value if value > best else best
+        delta = value - mean
+        mean += delta / count
+        squares += delta * (value - mean)
+    return best, mean, math.sqrt(squares / len(fitness))
@@ -0,0 +1,305 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+from abc import ABC, abstractmethod
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from genyal.core import GeneticsError
+from genyal.individuals import Individual
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class Screening(NamedTuple):
+    """
+    The result of pre-screening a group of individuals with a surrogate (see: Surrogate.screen).
+
+    Attributes:
+        selected:
+            The individuals that should be evaluated with the fitness function.
+        predictions:
+            The predicted fitness of the selected individuals (empty if the model isn't trained).
+        deferred:
+            The individuals that won't be evaluated.
+        estimates:
+            The predicted fitness of the deferred individuals.
+    """
+    selected: List[Individual]
+    predictions: List[float]
+    deferred: List[Individual]
+    estimates: List[float]
+
+
+class Surrogate(ABC):
+    """
+    A cheap model of the fitness function, trained with the individuals the engine evaluates, that
+    pre-screens the offspring so only the most promising fraction is evaluated (see:
+    GenyalEngine.surrogate).
+
+    The rest of the offspring keep a pessimistic estimate of their fitness: the prediction of the
+    model, but never more than the lowest fitness evaluated on the same group, so they stay in the
+    population (keeping its diversity) without ever being taken for the fittest individual.
+    The predictions of the evaluated individuals are compared with their actual fitness to report
+    the accuracy of the model, along with the number of evaluations saved.
+
+    Surrogates work on numeric genes and require numpy; subclasses implement the model (see:
+    KNNSurrogate and RidgeSurrogate).
+    """
+    __absolute_error: float
+    __count: int
+    __evaluations_saved: int
+    __fitness: Any
+    __fraction: float
+    __genomes: Any
+    __max_samples: int
+    __min_samples: int
+    __next_sample: int
+    __samples: int
+    __stale: bool
+    __sums: List[float]
+
+    def __init__(self, fraction: float = 0.5, min_samples: int = 32, max_samples: int = 4096):
+        """
+        Initializes an untrained surrogate.
+
+        Args:
+            fraction:
+                The fraction —a number in (0, 1]— of each group of unevaluated individuals that is
+                evaluated with the fitness function.
+            min_samples:
+                The number of evaluated individuals needed before the model is used; until then,
+                every individual is evaluated.
+            max_samples:
+                The maximum number of evaluated individuals the model is trained with (the most
+                recent ones are kept).
+        """
+        if numpy is None:
+            raise GeneticsError("Surrogates require numpy.")
+        if not 0 < fraction <= 1:
+            raise GeneticsError(f"The fraction should be a number in (0, 1]. Got: {fraction}.")
+        if min_samples < 1 or max_samples < min_samples:
+            raise GeneticsError(f"Invalid number of samples: min_samples={min_samples}, "
+                                f"max_samples={max_samples}.")
+        self.__fraction = fraction
+        self.__min_samples = min_samples
+        self.__max_samples = max_samples
+        self.__genomes = None
+        self.__fitness = None
+        self.__samples = 0
+        self.__next_sample = 0
+        self.__stale = True
+        self.__evaluations_saved = 0
+        self.reset_statistics()
+
+    @abstractmethod
+    def _fit(self, genomes, fitness) -> None:
+        """Trains the model with a 2-D array of genomes and an array with their fitness."""
+
+    @abstractmethod
+    def _predict(self, genomes):
+        """Returns an array with the predicted fitness of a 2-D array of genomes."""
+
+    def predict(self, individuals: Sequence[Individual]) -> List[float]:
+        """Predicts the fitness of a group of individuals."""
+        if self.__stale:
+            self._fit(self.__genomes[:self.__samples], self.__fitness[:self.__samples])
+            self.__stale = False
+        return self._predict(self.__as_array(individuals)).tolist()
+
+    def screen(self, individuals: Sequence[Individual]) -> Screening:
+        """
+        Splits the unevaluated individuals of a group into the ones that should be evaluated (the
+        most promising fraction, according to the model) and the ones that shouldn't.
+        Every unevaluated individual is selected while the model has too few samples.
+        """
+        pending = [individual for individual in individuals if individual.fitness is None]
+        if not self.trained or self.__fraction >= 1 or not pending:
+            return Screening(pending, [], [], [])
+        predictions = self.predict(pending)
+        count = math.ceil(self.__fraction * len(pending))
+        order = sorted(range(0, len(pending)), key=predictions.__getitem__, reverse=True)
+        return Screening([pending[idx] for idx in order[:count]],
+                         [predictions[idx] for idx in order[:count]],
+                         [pending[idx] for idx in order[count:]],
+                         [predictions[idx] for idx in order[count:]])
+
+    def update(self, screening: Screening) -> None:
+        """
+        Learns from the evaluated individuals of a screening, measures the error of their
+        predictions and gives the deferred individuals their (pessimistic) estimates.
+        """
+        self.learn(screening.selected)
+        for individual, prediction in zip(screening.selected, screening.predictions):
+            self.__record(prediction, individual.fitness)
+        if screening.deferred:
+            floor = min((individual.fitness for individual in screening.selected),
+                        default=math.inf)
+            for individual, estimate in zip(screening.deferred, screening.estimates):
+                individual.fitness = min(estimate, floor)
+            self.__evaluations_saved += len(screening.deferred)
+
+    def learn(self, individuals: Sequence[Individual]) -> None:
+        """Adds evaluated individuals to the samples of the model."""
+        evaluated = [individual for individual in individuals if individual.fitness is not None]
+        if not evaluated:
+            return
+        genomes = self.__as_array(evaluated)
+        if self.__genomes is None:
+            self.__genomes = numpy.empty((self.__max_samples, genomes.shape[1]))
+            self.__fitness = numpy.empty(self.__max_samples)
+        # The samples are kept on a circular buffer, so the oldest ones are overwritten.
+        genomes = genomes[-self.__max_samples:]
+        fitness = [individual.fitness for individual in evaluated[-self.__max_samples:]]
+        rows = (self.__next_sample + numpy.arange(len(genomes))) % self.__max_samples
+        self.__genomes[rows] = genomes
+        self.__fitness[rows] = fitness
+        self.__next_sample = int(rows[-1] + 1) % self.__max_samples
+        self.__samples = min(self.__samples + len(genomes), self.__max_samples)
+        self.__stale = True
+
+    def reset_statistics(self) -> None:
+        """Discards the accuracy measurements (the samples of the model are kept)."""
+        self.__count = 0
+        self.__absolute_error = 0.0
+        # The sums of the predictions, the fitness values, their squares and their products.
+        self.__sums = [0.0] * 5
+
+    def __record(self, prediction: float, fitness: float) -> None:
+        self.__count += 1
+        self.__absolute_error += abs(prediction - fitness)
+        for idx, value in enumerate((prediction, fitness, prediction * prediction,
+                                     fitness * fitness, prediction * fitness)):
+            self.__sums[idx] += value
+
+    def __as_array(self, individuals: Sequence[Individual]):
+        try:
+            genomes = numpy.array([individual.genes for individual in individuals], dtype=float)
+        except (TypeError, ValueError):
+            raise GeneticsError("Surrogates require numeric genes.")
+        if self.__genomes is not None and genomes.shape[1:] != self.__genomes.shape[1:]:
+            raise GeneticsError(f"The surrogate was trained with genomes of "
+                                f"{self.__genomes.shape[1]} genes. Got: {genomes.shape[1:]}.")
+        return genomes
+
+    @property
+    def trained(self) -> bool:
+        """If the model has enough samples to be used."""
+        return self.__samples >= self.__min_samples
+
+    @property
+    def samples(self) -> int:
+        """The number of evaluated individuals the model is trained with."""
+        return self.__samples
+
+    @property
+    def fraction(self) -> float:
+        """The fraction of each group of unevaluated individuals that is evaluated."""
+        return self.__fraction
+
+    @property
+    def evaluations_saved(self) -> int:
+        """The number of individuals whose evaluation was avoided."""
+        return self.__evaluations_saved
+
+    @property
+    def predictions(self) -> int:
+        """The number of predictions that were checked against the actual fitness."""
+        return self.__count
+
+    @property
+    def mean_absolute_error(self) -> float:
+        """The mean absolute error of the checked predictions (NaN if there are none)."""
+        return self.__absolute_error / self.__count if self.__count else math.nan
+
+    @property
+    def correlation(self) -> float:
+        """
+        The (Pearson) correlation between the checked predictions and the actual fitness, which
+        measures how well the model ranks the individuals (NaN if it's undefined).
+        """
+        count = self.__count
+        predictions, fitness, squared_predictions, squared_fitness, products = self.__sums
+        covariance = count * products - predictions * fitness
+        variances = ((count * squared_predictions - predictions ** 2)
+                     * (count * squared_fitness - fitness ** 2))
+        return covariance / math.sqrt(variances) if count and variances > 0 else math.nan
+
+
+class KNNSurrogate(Surrogate):
+    """Predicts the fitness of a genome as the inverse-distance weighted mean of its k nearest."""
+    __neighbours: int
+    __sample_fitness: Any
+    __sample_genomes: Any
+
+    def __init__(self, neighbours: int = 5, fraction: float = 0.5, min_samples: int = 32,
+                 max_samples: int = 4096):
+        """
+        Args:
+            neighbours:
+                The number of evaluated genomes used for each prediction.
+            fraction, min_samples, max_samples:
+                See Surrogate.
+        """
+        super(KNNSurrogate, self).__init__(fraction, min_samples, max_samples)
+        if neighbours < 1:
+            raise GeneticsError(f"The number of neighbours should be positive. Got: {neighbours}.")
+        self.__neighbours = neighbours
+
+    def _fit(self, genomes, fitness) -> None:
+        self.__sample_genomes = genomes.copy()
+        self.__sample_fitness = fitness.copy()
+
+    def _predict(self, genomes):
+        # Squared euclidean distances from every genome to every sample, computed with a matrix
+        # product instead of a (queries x samples x genes) array.
+        distances = ((genomes * genomes).sum(axis=1)[:, None]
+                     + (self.__sample_genomes * self.__sample_genomes).sum(axis=1)[None, :]
+                     - 2 * genomes @ self.__sample_genomes.T)
+        numpy.maximum(distances, 0, out=distances)
+        k = min(self.__neighbours, distances.shape[1])
+        nearest = numpy.argpartition(distances, k - 1, axis=1)[:, :k]
+        nearest_distances = numpy.take_along_axis(distances, nearest, axis=1)
+        weights = 1 / (numpy.sqrt(nearest_distances) + 1e-12)
+        return (weights * self.__sample_fitness[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+class RidgeSurrogate(Surrogate):
+    """Predicts the fitness of a genome with a linear (ridge) regression over its genes."""
+    __alpha: float
+    __intercept: float
+    __weights: Optional[Any]
+
+    def __init__(self, alpha: float = 1.0, fraction: float = 0.5, min_samples: int = 32,
+                 max_samples: int = 4096):
+        """
+        Args:
+            alpha:
+                The strength of the L2 regularization.
+            fraction, min_samples, max_samples:
+                See Surrogate.
+        """
+        super(RidgeSurrogate, self).__init__(fraction, min_samples, max_samples)
+        if alpha <= 0:
+            raise GeneticsError(f"The regularization should be positive. Got: {alpha}.")
+        self.__alpha = alpha
+        self.__weights = None
+        self.__intercept = 0.0
+
+    def _fit(self, genomes, fitness) -> None:
+        genome_mean, fitness_mean = genomes.mean(axis=0), fitness.mean()
+        centered = genomes - genome_mean
+        gram = centered.T @ centered
+        gram[numpy.diag_indices_from(gram)] += self.__alpha
+        self.__weights = numpy.linalg.solve(gram, centered.T @ (fitness - fitness_mean))
+        self.__intercept = fitness_mean - genome_mean @ self.__weights
+
+    def _predict(self, genomes):
+        return genomes @ self.__weights + self.__intercept
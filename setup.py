@@ -19,4 +19,5 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires='>=3.9',
+    extras_require={"numpy": ["numpy>=1.19"]},
 )
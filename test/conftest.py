@@ -0,0 +1,32 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Fixtures shared by the tests (shared helpers live in the helpers module).
+"""
+import random
+import string
+import sys
+from random import Random
+
+import pytest
+
+from genyal.genotype import GeneFactory
+
+
+@pytest.fixture
+def ascii_gene_factory(random_generator: Random) -> GeneFactory[str]:
+    return GeneFactory(lambda: random_generator.choice(string.ascii_lowercase))
+
+
+@pytest.fixture()
+def random_generator(seed: int) -> Random:
+    return Random(seed)
+
+
+@pytest.fixture()
+def seed() -> int:
+    return random.randrange(-sys.maxsize, sys.maxsize)
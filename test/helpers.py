@@ -0,0 +1,46 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+
+Helpers shared by the tests that evolve words.
+"""
+import string
+from random import Random
+from typing import Callable, List, Optional
+
+from genyal.engine import GenyalEngine
+from genyal.evaluation import Evaluator
+from genyal.genotype import GeneFactory
+
+TARGET = "genyal"
+
+
+def match_word_fitness(predicted: List[str], target: str) -> float:
+    return sum([predicted[i] == target[i] for i in range(0, len(target))])
+
+
+def exact_match(engine: GenyalEngine, target: str) -> bool:
+    return "".join(engine.fittest.genes) == target
+
+
+def make_engine(seed: int, fitness_function: Callable[..., float] = match_word_fitness,
+                evaluator: Optional[Evaluator] = None, target: str = TARGET) -> GenyalEngine:
+    """An engine that evolves words towards a target (see: word_factory)."""
+    rng = Random(seed)
+    if evaluator is None:
+        engine = GenyalEngine(rng, fitness_function)
+    else:
+        engine = GenyalEngine(rng, fitness_function, evaluator=evaluator)
+    engine.factory_generator_args = (rng,)
+    engine.fitness_function_args = (target,)
+    return engine
+
+
+def word_factory(engine: GenyalEngine) -> GeneFactory[str]:
+    """A factory of lowercase letters drawn from the engine's random generator."""
+    factory = GeneFactory(generator=lambda r: r.choice(string.ascii_lowercase))
+    factory.generator_args = (engine.random_generator,)
+    return factory
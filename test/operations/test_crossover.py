@@ -15,7 +15,10 @@ import pytest
 
 from genyal.genotype import GeneFactory
 from genyal.individuals import Individual
-from genyal.operations.crossover import CrossoverError, single_point_crossover
+from genyal.operations.crossover import (CrossoverError, batch_arithmetic_crossover,
+                                         batch_blend_crossover, batch_single_point_crossover,
+                                         batch_two_point_crossover, batch_uniform_crossover,
+                                         single_point_crossover)
 
 
 @pytest.mark.repeat(16)
@@ -45,6 +48,48 @@ def test_single_point_crossover(couple: Tuple[Individual, Individual], seed: int
             couple[0].genes[:expected_cut_point] + couple[1].genes[expected_cut_point:])
 
 
+@pytest.mark.repeat(8)
+@pytest.mark.parametrize("crossover", [batch_single_point_crossover, batch_two_point_crossover,
+                                       batch_uniform_crossover])
+def test_batch_crossover_takes_genes_from_partners(crossover, seed: int):
+    numpy = pytest.importorskip("numpy")
+    rng = numpy.random.default_rng(abs(seed))
+    genes = rng.integers(0, 100, size=(10, 16))
+    parents_a = rng.integers(0, 10, size=32)
+    parents_b = rng.integers(0, 10, size=32)
+    offspring = crossover(genes, parents_a, parents_b, numpy.random.default_rng(abs(seed)))
+    assert offspring.shape == (32, 16) and offspring.dtype == genes.dtype
+    from_a = offspring == genes[parents_a]
+    assert numpy.all(from_a | (offspring == genes[parents_b])), f"Test failed with seed: {seed}"
+    again = crossover(genes, parents_a, parents_b, numpy.random.default_rng(abs(seed)))
+    assert numpy.array_equal(offspring, again), f"Test failed with seed: {seed}"
+
+
+@pytest.mark.repeat(8)
+def test_batch_single_point_crossover(seed: int):
+    numpy = pytest.importorskip("numpy")
+    genes = numpy.array([list("abcd"), list("defg")])
+    offspring = batch_single_point_crossover(genes, numpy.zeros(64, dtype=int),
+                                             numpy.ones(64, dtype=int),
+                                             numpy.random.default_rng(abs(seed)))
+    for child in offspring.tolist():
+        assert "".join(child) in ["defg", "aefg", "abfg", "abcg"], f"Test failed with seed: {seed}"
+
+
+@pytest.mark.parametrize("crossover", [batch_arithmetic_crossover, batch_blend_crossover])
+def test_batch_arithmetic_crossovers(crossover, seed: int):
+    numpy = pytest.importorskip("numpy")
+    genes = numpy.array([[0.0, 10.0], [10.0, 20.0]])
+    offspring = crossover(genes, numpy.zeros(16, dtype=int), numpy.ones(16, dtype=int),
+                          numpy.random.default_rng(abs(seed)))
+    assert numpy.all((offspring >= [-5, 5]) & (offspring <= [15, 25]))
+    integer_offspring = crossover(genes.astype(int), numpy.zeros(4, dtype=int),
+                                  numpy.ones(4, dtype=int), numpy.random.default_rng(abs(seed)))
+    assert integer_offspring.dtype == int
+    with pytest.raises(CrossoverError):
+        crossover(numpy.array([list("ab")]), [0], [0], numpy.random.default_rng(abs(seed)))
+
+
 @pytest.fixture
 def couple(ascii_gene_factory: GeneFactory[str], random_generator: random.Random) \
         -> Tuple[Individual, Individual]:
@@ -0,0 +1,86 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import random
+import unittest
+from collections import Counter
+
+import pytest
+
+from genyal.operations.evolution import (SelectionError, batch_tournament_selection,
+                                         exponential_rank_selection, linear_rank_selection,
+                                         roulette_selection, stochastic_universal_sampling)
+
+FITNESS = [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.repeat(4)
+@pytest.mark.parametrize("strategy", [roulette_selection, stochastic_universal_sampling])
+def test_fitness_proportionate_selection(strategy, seed: int):
+    selected = strategy(FITNESS, 20000, random.Random(seed))
+    assert len(selected) == 20000
+    counts = Counter(selected)
+    assert counts[0] == 0
+    for idx in range(1, 5):
+        assert counts[idx] / 20000 == pytest.approx(idx / 10, abs=0.02), \
+            f"Test failed with seed: {seed}"
+
+
+@pytest.mark.repeat(8)
+def test_stochastic_universal_sampling_spread(seed: int):
+    counts = Counter(stochastic_universal_sampling(FITNESS, 10, random.Random(seed)))
+    for idx in range(0, 5):
+        assert abs(counts[idx] - idx) <= 1, f"Test failed with seed: {seed}"
+
+
+@pytest.mark.repeat(4)
+def test_rank_selection(seed: int):
+    fitness = [-50.0, -3.0, 0.5, 2.0, 1000.0]
+    counts = Counter(linear_rank_selection(fitness, 50000, random.Random(seed), 2))
+    for rank in range(0, 5):
+        assert counts[rank] / 50000 == pytest.approx(2 * rank / 20, abs=0.02), \
+            f"Test failed with seed: {seed}"
+    counts = Counter(exponential_rank_selection(fitness, 50000, random.Random(seed), 0.5))
+    assert counts[4] / 50000 == pytest.approx(16 / 31, abs=0.02), f"Test failed with seed: {seed}"
+    assert counts[3] > counts[2] > counts[1] > counts[0]
+    assert linear_rank_selection([1.0], 4, random.Random(seed), 2) == [0] * 4
+
+
+def test_selection_errors():
+    with pytest.raises(SelectionError):
+        linear_rank_selection(FITNESS, 1, random.Random(), 3)
+    with pytest.raises(SelectionError):
+        exponential_rank_selection(FITNESS, 1, random.Random(), 0)
+    with pytest.raises(SelectionError):
+        roulette_selection([], 1, random.Random())
+
+
+@pytest.mark.repeat(8)
+def test_degenerate_populations(seed: int):
+    assert set(roulette_selection([2.0] * 4, 100, random.Random(seed))) == {0, 1, 2, 3}
+    assert linear_rank_selection([1.0], 3, random.Random(seed)) == [0, 0, 0]
+    assert max(batch_tournament_selection(FITNESS, 16, random.Random(seed), 3)) <= 4
+
+
+@pytest.mark.repeat(8)
+def test_array_tournaments_match_the_matches(seed: int):
+    numpy = pytest.importorskip("numpy")
+    fitness = numpy.array([1.0, 3.0, 3.0, 0.0, 3.0, 2.0])
+    winners = batch_tournament_selection(fitness, 64, numpy.random.default_rng(seed % 2 ** 32), 3)
+    candidates = numpy.random.default_rng(seed % 2 ** 32).integers(0, len(fitness), size=(64, 3))
+    expected = []
+    for row in candidates.tolist():
+        best = row[0]
+        for candidate in row[1:]:
+            if (fitness[candidate], candidate) > (fitness[best], best):
+                best = candidate
+        expected.append(best)
+    assert winners.tolist() == expected, f"Test failed with seed: {seed}"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import random
+import unittest
+
+import pytest
+
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from genyal.operations.mutation import (batch_sparse_mutation, mutation_loci, simple_mutation,
+                                        sparse_mutation)
+
+
+@pytest.mark.repeat(8)
+def test_mutation_loci(seed: int):
+    rng = random.Random(seed)
+    loci = list(mutation_loci(100000, 0.01, rng))
+    assert loci == sorted(set(loci))
+    assert all(0 <= locus < 100000 for locus in loci)
+    assert 700 < len(loci) < 1300, f"Test failed with seed: {seed}"
+    assert list(mutation_loci(10, 0, rng)) == []
+    assert list(mutation_loci(10, 1, rng)) == list(range(0, 10))
+
+
+@pytest.mark.repeat(8)
+def test_sparse_mutation(seed: int):
+    individual = Individual(genes=[0] * 64, mutation_rate=0.25,
+                            gene_factory=GeneFactory(lambda: 1),
+                            random_generator=random.Random(seed))
+    mutated = sparse_mutation(individual)
+    expected = set(mutation_loci(64, 0.25, random.Random(seed)))
+    assert mutated.genes == [1 if i in expected else 0 for i in range(0, 64)]
+    assert individual.genes == [0] * 64
+
+
+@pytest.mark.parametrize("strategy", [simple_mutation, sparse_mutation])
+def test_in_place_mutation(strategy, seed: int):
+    def make() -> Individual:
+        return Individual(genes=[0] * 32, mutation_rate=0.5, gene_factory=GeneFactory(lambda: 1),
+                          random_generator=random.Random(seed))
+
+    expected = strategy(make()).genes
+    individual = make()
+    individual.fitness = 1.0
+    assert strategy(individual, in_place=True) is individual
+    assert individual.genes == expected and individual.fitness is None
+
+
+@pytest.mark.repeat(8)
+def test_batch_sparse_mutation(seed: int):
+    numpy = pytest.importorskip("numpy")
+    genes = numpy.zeros((100, 1000), dtype=numpy.int8)
+    mutated = batch_sparse_mutation(genes, 0.01, GeneFactory(lambda: 1),
+                                    numpy.random.default_rng(abs(seed)))
+    assert mutated is genes
+    assert set(numpy.unique(genes).tolist()) <= {0, 1}
+    assert 700 < numpy.count_nonzero(genes) < 1300, f"Test failed with seed: {seed}"
+    untouched = numpy.zeros((4, 4))
+    batch_sparse_mutation(untouched, 0, GeneFactory(lambda: 1), numpy.random.default_rng(0))
+    assert not untouched.any()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.individuals import Individual, fitness_key
+from genyal.operations.evolution import SelectionError
+from genyal.operations.replacement import (comma_selection, insert_sorted, plus_selection,
+                                           replace_worst, worst_heap)
+
+
+@pytest.mark.repeat(16)
+def test_insert_sorted(random_generator: Random, seed: int) -> None:
+    population = sorted(make_individuals(random_generator, 20), key=fitness_key)
+    fitness = [individual.fitness for individual in population]
+    for _ in range(0, 50):
+        offspring = make_individuals(random_generator, 1)[0]
+        worst = fitness[0]
+        inserted = insert_sorted(population, fitness, offspring)
+        assert inserted == (offspring.fitness >= worst), f"Test failed with seed: {seed}"
+        assert len(population) == 20 and (offspring in population) == inserted
+        assert fitness == sorted(fitness) == [member.fitness for member in population]
+
+
+@pytest.mark.repeat(16)
+def test_replace_worst(random_generator: Random, seed: int) -> None:
+    population = make_individuals(random_generator, 20)
+    fitness = [individual.fitness for individual in population]
+    heap = worst_heap(fitness)
+    for _ in range(0, 50):
+        offspring = make_individuals(random_generator, 1)[0]
+        worst_idx = min(range(0, 20), key=lambda idx: (fitness[idx], idx))
+        worst = fitness[worst_idx]
+        survivors = population[:worst_idx] + population[worst_idx + 1:]
+        if replace_worst(population, fitness, heap, offspring):
+            assert offspring.fitness >= worst, f"Test failed with seed: {seed}"
+            assert population[worst_idx] is offspring
+            assert population[:worst_idx] + population[worst_idx + 1:] == survivors
+        else:
+            assert offspring.fitness < worst, f"Test failed with seed: {seed}"
+        assert fitness == [member.fitness for member in population]
+
+
+@pytest.mark.repeat(16)
+def test_survivor_selection(random_generator: Random, seed: int) -> None:
+    parents = make_individuals(random_generator, 10)
+    offspring = make_individuals(random_generator, 15)
+    survivors = plus_selection(parents, offspring, 10)
+    expected = sorted([individual.fitness for individual in parents + offspring])[-10:]
+    assert [survivor.fitness for survivor in survivors] == expected[::-1], \
+        f"Test failed with seed: {seed}"
+    assert all(any(survivor is candidate for candidate in parents + offspring)
+               for survivor in survivors)
+    survivors = comma_selection(parents, offspring, 10)
+    expected = sorted([individual.fitness for individual in offspring])[-10:]
+    assert [survivor.fitness for survivor in survivors] == expected[::-1], \
+        f"Test failed with seed: {seed}"
+    assert all(any(survivor is child for child in offspring) for survivor in survivors)
+    with pytest.raises(SelectionError):
+        comma_selection(parents, offspring, 16)
+
+
+def make_individuals(random_generator: Random, count: int) -> List[Individual]:
+    individuals = []
+    for _ in range(0, count):
+        individual = Individual([random_generator.random()])
+        individual.fitness = random_generator.randint(0, 10)
+        individuals.append(individual)
+    return individuals
+
+
+if __name__ == '__main__':
+    unittest.main()
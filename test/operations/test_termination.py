@@ -0,0 +1,120 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.operations.evolution import default_terminating_function
+from genyal.operations.termination import (AllOf, AnyOf, DiversityCollapse, EvaluationBudget,
+                                           FitnessSpreadCollapse, MaxGenerations, Stagnation,
+                                           TargetFitness, TerminatingCriterion, TimeBudget)
+
+
+def one_max(genes: List[int]) -> float:
+    return sum(genes)
+
+
+def test_stagnation() -> None:
+    engine = GenyalEngine(fitness_function=lambda genes: 1.0)
+    engine.create_population(4, 2, GeneFactory(lambda: 0))
+    engine.terminating_function = Stagnation(5)
+    engine.evolve()
+    assert engine.generation == 5
+    engine.terminating_function.reset()
+    with pytest.raises(GeneticsError):
+        Stagnation(0)
+
+
+@pytest.mark.repeat(4)
+def test_target_fitness(seed: int) -> None:
+    engine = one_max_engine(seed, TargetFitness(8) | MaxGenerations(1000))
+    engine.evolve()
+    assert engine.fittest.fitness == 8 and engine.generation < 1000, \
+        f"Test failed with seed: {seed}"
+
+
+def test_budgets(seed: int) -> None:
+    engine = one_max_engine(seed, EvaluationBudget(100))
+    engine.evolve()
+    assert 100 <= engine.evaluations < 100 + len(engine.population)
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    budget = TimeBudget(10, clock)
+    assert not budget(engine)
+    now = 9.5
+    assert not budget(engine)
+    now = 10
+    assert budget(engine)
+    budget.reset()
+    assert not budget(engine)
+
+
+def test_fitness_spread_collapse() -> None:
+    engine = GenyalEngine(fitness_function=one_max)
+    engine.create_population(4, 4, GeneFactory(lambda: 1))
+    assert engine.fitness_std == 0 and engine.fitness_mean == 4
+    assert FitnessSpreadCollapse()(engine)
+    assert not FitnessSpreadCollapse()(GenyalEngine())
+
+
+def test_diversity_collapse() -> None:
+    genes = iter([1, 0, 0, 1] * 2)
+    engine = GenyalEngine(fitness_function=one_max)
+    engine.create_population(4, 2, GeneFactory(lambda: next(genes)))
+    # Every member has the same fitness, but the genomes still differ.
+    assert engine.fitness_std == 0 and FitnessSpreadCollapse()(engine)
+    assert engine.diversity.mean_hamming_distance > 0
+    assert not DiversityCollapse()(engine)
+    assert DiversityCollapse(engine.diversity.mean_hamming_distance)(engine)
+    converged = GenyalEngine(fitness_function=one_max)
+    converged.create_population(4, 4, GeneFactory(lambda: 1))
+    assert DiversityCollapse()(converged)
+    assert not DiversityCollapse()(GenyalEngine())
+
+
+def test_criteria_must_be_callable() -> None:
+    class Never(TerminatingCriterion):
+        pass
+
+    with pytest.raises(TypeError):
+        Never()
+
+
+def test_composition(seed: int) -> None:
+    engine = one_max_engine(seed, MaxGenerations(5) & (lambda engine: engine.generation >= 3))
+    engine.evolve()
+    assert engine.generation == 5
+    either = MaxGenerations(7) | default_terminating_function
+    both = default_terminating_function & MaxGenerations(7)
+    assert isinstance(either, AnyOf) and isinstance(both, AllOf)
+    assert not either(engine, 10) and not both(engine, 10)
+    assert either(engine, 5) and not both(engine, 5)
+    calls = []
+    stagnation = Stagnation(2)
+    combined = AnyOf(MaxGenerations(0), lambda engine: calls.append(engine) or False, stagnation)
+    assert combined(engine) and len(calls) == 1
+    assert stagnation in combined.criteria
+
+
+def one_max_engine(seed: int, terminating_function) -> GenyalEngine:
+    random_generator = Random(seed)
+    engine = GenyalEngine(random_generator, one_max, terminating_function=terminating_function)
+    engine.create_population(16, 8, GeneFactory(lambda: random_generator.randint(0, 1)), 0.9)
+    return engine
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import asyncio
+import unittest
+from typing import List
+
+import pytest
+
+from genyal.cache import FitnessCache
+from genyal.engine import GenyalEngine
+from genyal.evaluation import AsyncEvaluator, EvaluationTimeoutError, batch_fitness
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from genyal.summary import GenerationSummary
+from helpers import TARGET, make_engine, match_word_fitness, word_factory
+
+
+async def remote_word_fitness(predicted: List[str], target: str) -> float:
+    await asyncio.sleep(0)
+    return match_word_fitness(predicted, target)
+
+
+class RemoteClient:
+    """A client whose calls are coroutines (e.g. requests to a remote fitness service)."""
+
+    async def __call__(self, predicted: List[str], target: str) -> float:
+        return await remote_word_fitness(predicted, target)
+
+
+@pytest.mark.parametrize("fitness_function", [
+    match_word_fitness, remote_word_fitness, RemoteClient(),
+    lambda predicted, target: remote_word_fitness(predicted, target)])
+def test_async_evolution_matches_sync_run(fitness_function, seed: int) -> None:
+    expected = make_engine(seed, match_word_fitness)
+    expected.create_population(16, len(TARGET), word_factory(expected), 0.5)
+    expected.evolve(5)
+
+    async def run() -> GenyalEngine:
+        engine = make_engine(seed, fitness_function, AsyncEvaluator(4))
+        await engine.create_population_async(16, len(TARGET), word_factory(engine), 0.5)
+        await engine.evolve_async(5)
+        return engine
+
+    actual = asyncio.run(run())
+    assert actual.generation == 5
+    assert [(i.fitness, i.genes) for i in actual.population] == [
+        (i.fitness, i.genes) for i in expected.population], f"Test failed with seed: {seed}"
+
+
+def test_concurrency_is_bounded(ascii_gene_factory: GeneFactory[str]) -> None:
+    running, peak = 0, 0
+
+    async def slow_fitness(genes: List[str]) -> float:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return len(genes)
+
+    individuals = Individual.create(20, 3, ascii_gene_factory)
+    asyncio.run(AsyncEvaluator(max_concurrency=3).evaluate_async(individuals, slow_fitness))
+    assert peak == 3
+    assert all(individual.fitness == 3 for individual in individuals)
+
+
+def test_timeout() -> None:
+    async def stuck_fitness(genes: List[str]) -> float:
+        if genes[0] == "a":
+            await asyncio.sleep(10)
+        return 1
+
+    individuals = [Individual(["a", "a"])] + [Individual(["b", "c"]) for _ in range(0, 3)]
+    with pytest.raises(EvaluationTimeoutError):
+        AsyncEvaluator(timeout=0.01).evaluate(individuals, stuck_fitness)
+    for individual in individuals:
+        individual.fitness = None
+    AsyncEvaluator(timeout=0.01, timeout_fitness=-1).evaluate(individuals, stuck_fitness)
+    assert individuals[0].fitness == -1
+    assert all(individual.fitness == 1 for individual in individuals[1:])
+
+
+def test_cancellation(ascii_gene_factory: GeneFactory[str]) -> None:
+    cancelled = []
+
+    async def endless_fitness(_: List[str]) -> float:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 0
+
+    async def run() -> None:
+        task = asyncio.ensure_future(AsyncEvaluator(max_concurrency=2).evaluate_async(
+            Individual.create(5, 2, ascii_gene_factory), endless_fitness))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert len(cancelled) == 2
+
+
+def test_generations_async_with_cache(seed: int) -> None:
+    calls = []
+
+    @batch_fitness
+    async def remote_batch_fitness(genomes: List[List[str]], target: str) -> List[float]:
+        calls.append(len(genomes))
+        await asyncio.sleep(0)
+        return [match_word_fitness(genes, target) for genes in genomes]
+
+    async def run() -> List[GenerationSummary]:
+        engine = make_engine(seed, remote_batch_fitness, AsyncEvaluator())
+        engine.fitness_cache = FitnessCache()
+        await engine.create_population_async(16, len(TARGET), word_factory(engine), 0.5)
+        return [summary async for summary in engine.generations_async(4)]
+
+    summaries = asyncio.run(run())
+    assert [summary.generation for summary in summaries] == [1, 2, 3, 4]
+    assert len(calls) == 5 and all(0 < size <= 16 for size in calls)
+    assert [summary.evaluations for summary in summaries] == calls[1:]
+    assert summaries[-1].total_evaluations == sum(calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.cache import FitnessCache
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.evaluation import SerialEvaluator
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+
+
+def test_repeated_genomes_are_evaluated_once() -> None:
+    calls = []
+
+    def fitness_function(genes: List[str]) -> float:
+        calls.append("".join(genes))
+        return len(set(genes))
+
+    cache = FitnessCache()
+    individuals = [Individual(list(word)) for word in ["abc", "aab", "abc", "abc"]]
+    cache.evaluate(individuals, lambda pending: [i.compute_fitness_using(fitness_function)
+                                                 for i in pending])
+    assert sorted(calls) == ["aab", "abc"]
+    assert [i.fitness for i in individuals] == [3, 2, 3, 3]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    again = Individual(list("aab"))
+    cache.evaluate([again], lambda pending: [i.compute_fitness_using(fitness_function)
+                                             for i in pending])
+    assert again.fitness == 2 and len(calls) == 2
+    assert cache.hits == 3
+
+
+def test_arguments_are_part_of_the_key() -> None:
+    cache = FitnessCache()
+    cache.put(FitnessCache.key("abc", ("abc",)), 3)
+    assert cache.get(FitnessCache.key("abc", ("abc",))) == 3
+    assert cache.get(FitnessCache.key("abc", ("xyz",))) is None
+    assert FitnessCache.key(["a"], ([],)) is None
+
+
+def test_least_recently_used_is_evicted() -> None:
+    cache = FitnessCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert "b" not in cache and "a" in cache and "c" in cache
+    with pytest.raises(GeneticsError):
+        FitnessCache(0)
+
+
+@pytest.mark.repeat(8)
+def test_engine_with_cache(seed: int) -> None:
+    evaluations = []
+
+    def fitness_function(genes: List[str], target: str) -> float:
+        evaluations.append(genes)
+        return sum([genes[i] == target[i] for i in range(0, len(target))])
+
+    expected = run_engine(None, seed, fitness_function)
+    uncached_evaluations = len(evaluations)
+    evaluations.clear()
+    cache = FitnessCache(max_size=128)
+    actual = run_engine(cache, seed, fitness_function)
+    assert [(i.fitness, i.genes) for i in actual.population] == [
+        (i.fitness, i.genes) for i in expected.population], f"Test failed with seed: {seed}"
+    assert len(evaluations) + cache.hits == uncached_evaluations
+    assert len({"".join(genes) for genes in evaluations}) == len(evaluations)
+
+
+def test_evaluator_and_cache_set_after_construction(seed: int) -> None:
+    rng = Random(seed)
+    engine = GenyalEngine(rng, lambda genes: len(set(genes)))
+    evaluator, cache = SerialEvaluator(), FitnessCache()
+    engine.evaluator = evaluator
+    engine.fitness_cache = cache
+    assert engine.evaluator is evaluator and engine.fitness_cache is cache
+    engine.create_population(16, 4, GeneFactory(lambda r: r.choice("ab"), rng), 0.5)
+    engine.evolve(2)
+    assert cache.misses > 0 and all(i.fitness is not None for i in engine.population)
+
+
+def run_engine(cache, seed: int, fitness_function) -> GenyalEngine:
+    rng = Random(seed)
+    factory = GeneFactory(lambda r: r.choice("ab"), rng)
+    engine = GenyalEngine(rng, fitness_function, fitness_cache=cache)
+    engine.fitness_function_args = ("abba",)
+    engine.create_population(32, 4, factory, 0.9)
+    engine.evolve(10)
+    return engine
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import os
+import unittest
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from genyal.checkpoint import (CheckpointError, Checkpointer, read_checkpoint, read_genomes,
+                               write_checkpoint)
+from genyal.core import GeneticsError
+from helpers import make_engine, match_word_fitness, word_factory
+
+TARGET = "checkpoint"
+
+
+@pytest.mark.parametrize("dtype", [None, "<U1"])
+def test_resume_is_identical(dtype: Optional[str], tmp_path: Path, seed: int) -> None:
+    if dtype is not None:
+        pytest.importorskip("numpy")
+    path = tmp_path / "engine.ckpt"
+    original = make_engine(seed, target=TARGET)
+    original.checkpointer = Checkpointer(path, generations=5)
+    original.create_population(24, len(TARGET), word_factory(original), 0.5, dtype=dtype)
+    original.evolve(5)
+    assert read_checkpoint(path)["generation"] == 5
+    original.checkpointer = None
+    original.evolve(12)
+
+    resumed = make_engine(seed, target=TARGET)
+    resumed.resume(path, word_factory(resumed))
+    assert resumed.generation == 5
+    resumed.evolve(12)
+    assert resumed.generation == original.generation == 12
+    assert [(member.fitness, member.genes) for member in resumed.population] == [
+        (member.fitness, member.genes) for member in original.population], \
+        f"Test failed with seed: {seed}"
+    assert resumed.fittest.genes == original.fittest.genes
+    assert (resumed.gene_pool is None) == (dtype is None)
+
+
+def test_seed_from_checkpoint(tmp_path: Path, seed: int) -> None:
+    path = tmp_path / "engine.ckpt"
+    engine = make_engine(seed, target=TARGET)
+    engine.create_population(16, len(TARGET), word_factory(engine), 0.5)
+    engine.evolve(5)
+    engine.save_checkpoint(path)
+    genomes = read_genomes(path)
+    assert match_word_fitness(genomes[0], TARGET) == engine.fittest.fitness
+    assert sorted(match_word_fitness(genes, TARGET) for genes in genomes) == sorted(
+        member.fitness for member in engine.population)
+
+    seeded = make_engine(seed, target=TARGET)
+    seeded.create_population(24, len(TARGET), word_factory(seeded), 0.5, seeds=path)
+    assert seeded.fittest.fitness == engine.fittest.fitness, f"Test failed with seed: {seed}"
+    assert len(seeded.population) == 24
+
+
+def test_checkpoint_intervals(tmp_path: Path, seed: int) -> None:
+    now = 0.0
+    checkpointer = Checkpointer(tmp_path / "engine.ckpt", generations=4, seconds=10,
+                                clock=lambda: now)
+    engine = make_engine(seed, target=TARGET)
+    engine.checkpointer = checkpointer
+    engine.create_population(8, len(TARGET), word_factory(engine), 0.5)
+    written = []
+    for generation in range(1, 10):
+        now = generation * 3.0
+        engine.step()
+        if os.path.exists(checkpointer.path):
+            written.append(read_checkpoint(checkpointer.path)["generation"])
+    assert sorted(set(written)) == [4, 8]
+    assert checkpointer(engine) is False
+    now += 10
+    assert checkpointer(engine) is True
+    with pytest.raises(GeneticsError):
+        Checkpointer(tmp_path / "engine.ckpt")
+
+
+def test_invalid_checkpoints(tmp_path: Path) -> None:
+    path = tmp_path / "engine.ckpt"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(CheckpointError):
+        read_checkpoint(path)
+    write_checkpoint(path, {"generation": 3})
+    assert read_checkpoint(path) == {"generation": 3}
+    with pytest.raises(RuntimeError):
+        write_checkpoint(path, {"generation": Unpicklable()})
+    assert read_checkpoint(path) == {"generation": 3}
+    assert os.listdir(tmp_path) == ["engine.ckpt"]
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise RuntimeError("Interrupted while writing.")
+
+
+if __name__ == '__main__':
+    unittest.main()
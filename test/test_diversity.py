@@ -0,0 +1,105 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+import unittest
+from itertools import combinations
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.diversity import diversity, sampled_hamming_distance
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+
+
+def pairwise_hamming_distance(genomes: List[List[int]]) -> float:
+    distances = [sum(a != b for a, b in zip(first, second))
+                 for first, second in combinations(genomes, 2)]
+    return sum(distances) / len(distances)
+
+
+def test_uniform_population() -> None:
+    report = diversity([[1, 0, 1]] * 5)
+    assert report.unique_genomes == 1
+    assert report.mean_hamming_distance == 0
+    assert report.locus_entropy == [0, 0, 0]
+    assert report.mean_entropy == 0
+
+
+def test_locus_entropy() -> None:
+    report = diversity([[0, 0], [1, 0], [0, 0], [1, 0]])
+    assert report.locus_entropy == pytest.approx([1.0, 0.0])
+    assert report.unique_genomes == 2
+
+
+@pytest.mark.repeat(8)
+def test_exact_hamming_distance(random_generator: Random, seed: int) -> None:
+    genomes = [[random_generator.randint(0, 3) for _ in range(0, 12)] for _ in range(0, 30)]
+    report = diversity(genomes)
+    assert report.mean_hamming_distance == pytest.approx(pairwise_hamming_distance(genomes)), \
+        f"Test failed with seed: {seed}"
+    assert report.unique_genomes == len({tuple(genome) for genome in genomes})
+
+
+@pytest.mark.repeat(8)
+def test_array_diversity(random_generator: Random, seed: int) -> None:
+    numpy = pytest.importorskip("numpy")
+    genomes = [[random_generator.randint(0, 2) for _ in range(0, 10)] for _ in range(0, 25)]
+    genomes += genomes[:5]
+    expected = diversity(genomes)
+    for dtype in (int, float, bool):
+        report = diversity(numpy.array(genomes, dtype=dtype))
+        if dtype is bool:
+            expected = diversity([[gene > 0 for gene in genome] for genome in genomes])
+        assert report.unique_genomes == expected.unique_genomes, f"Test failed with seed: {seed}"
+        assert report.mean_hamming_distance == pytest.approx(expected.mean_hamming_distance)
+        assert report.locus_entropy == pytest.approx(expected.locus_entropy)
+
+
+@pytest.mark.repeat(4)
+def test_sampled_hamming_distance(random_generator: Random, seed: int) -> None:
+    genomes = [[random_generator.randint(0, 1) for _ in range(0, 20)] for _ in range(0, 40)]
+    estimate = sampled_hamming_distance(genomes, 4000, random_generator)
+    assert estimate == pytest.approx(pairwise_hamming_distance(genomes), rel=0.1), \
+        f"Test failed with seed: {seed}"
+
+
+def test_degenerate_populations() -> None:
+    assert diversity([]).unique_genomes == 0
+    assert math.isnan(diversity([]).mean_hamming_distance)
+    assert diversity([[1, 2]]).mean_hamming_distance == 0
+    assert math.isnan(sampled_hamming_distance([[1, 2]]))
+
+
+@pytest.mark.repeat(4)
+def test_engine_diversity(random_generator: Random, seed: int) -> None:
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.create_population(20, 8, GeneFactory(lambda: random_generator.randint(0, 1)), 0.5)
+    report = engine.diversity
+    assert report is engine.diversity
+    assert report.mean_hamming_distance == pytest.approx(
+        pairwise_hamming_distance([member.genes for member in engine.population])), \
+        f"Test failed with seed: {seed}"
+    engine.evolve()
+    assert engine.diversity is not report
+
+
+def test_gene_pool_diversity(random_generator: Random) -> None:
+    numpy = pytest.importorskip("numpy")
+    engine = GenyalEngine(random_generator, lambda genes: float(genes.sum()))
+    engine.create_population(20, 8, GeneFactory(lambda: random_generator.randint(0, 3)), 0.5,
+                             dtype=numpy.int64)
+    expected = diversity([member.genes for member in engine.population])
+    assert engine.diversity.unique_genomes == expected.unique_genomes
+    assert engine.diversity.mean_hamming_distance == pytest.approx(expected.mean_hamming_distance)
+    assert engine.diversity.locus_entropy == pytest.approx(expected.locus_entropy)
+
+
+if __name__ == '__main__':
+    unittest.main()
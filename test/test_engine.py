@@ -1,20 +1,17 @@
 import string
-import sys
 import unittest
-from random import Random, random, randrange
+from copy import copy
+from random import Random, random
 
 import pytest
 
 from genyal.engine import GenyalEngine
+from genyal.evaluation import SerialEvaluator, ThreadPoolEvaluator
 from genyal.genotype import GeneFactory
-
-
-def match_word_fitness(predicted: list[str], target: str) -> float:
-    return sum([predicted[i] == target[i] for i in range(0, len(target))])
-
-
-def exact_match(engine: GenyalEngine, target: str) -> bool:
-    return "".join(engine.fittest.genes) == target
+from genyal.individuals import Individual
+from genyal.operations.evolution import roulette_selection, tournament_selection
+from genyal.operations.replacement import comma_selection, plus_selection
+from helpers import exact_match, match_word_fitness
 
 
 @pytest.mark.repeat(16)
@@ -48,6 +45,183 @@ def test_word_match_engine(match_word_engine: GenyalEngine, population_size: int
     assert "".join(match_word_engine.fittest.genes) == random_word, f"Test failed with seed: {seed}"
 
 
+@pytest.mark.parametrize("batch_selection", [None, roulette_selection])
+def test_offspring_creation_is_copy_free(batch_selection, random_generator: Random,
+                                         monkeypatch) -> None:
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.batch_selection_strategy = batch_selection
+    engine.create_population(20, 8, GeneFactory(random_generator.random), 0.5)
+    created = []
+    original_init = Individual.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Individual, "__init__", counting_init)
+    engine.evolve(3)
+    # A single individual per child: the crossover creates it and the mutation reuses it.
+    assert len(created) == 3 * 20
+    engine.copy_parents = True
+    engine.evolve(4)
+    assert len(created) == 3 * 20 + 20 * 3
+
+
+def test_copy_parents(random_generator: Random) -> None:
+    def destructive_crossover(individual, partner):
+        partner.genes = [0.0] * len(partner)
+        return individual.offspring(list(individual))
+
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.copy_parents = True
+    engine.create_population(10, 4, GeneFactory(random_generator.random), 0.5)
+    for individual in engine.population:
+        individual.crossover_strategy = destructive_crossover
+    previous_generation = list(engine.population)
+    previous_genes = [individual.genes for individual in previous_generation]
+    engine.evolve(1)
+    assert [individual.genes for individual in previous_generation] == previous_genes
+
+
+def test_copies_dont_share_genes(random_generator: Random) -> None:
+    def copying_crossover(individual, partner):
+        return copy(individual)
+
+    def editing_crossover(individual, partner):
+        partner[0] = -1.0
+        return copy(individual)
+
+    for crossover_strategy, copy_parents in [(copying_crossover, False),
+                                             (editing_crossover, True)]:
+        engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+        engine.copy_parents = copy_parents
+        engine.elitism = 2
+        engine.create_population(10, 4, GeneFactory(random_generator.random), 0.5)
+        for individual in engine.population:
+            individual.crossover_strategy = crossover_strategy
+        previous_generation = list(engine.population)
+        previous_genes = [individual.genes for individual in previous_generation]
+        engine.step()
+        assert [individual.genes for individual in previous_generation] == previous_genes
+        assert all(member.fitness == sum(member.genes) for member in engine.population)
+
+
+def test_engines_dont_share_generators(random_generator: Random) -> None:
+    assert GenyalEngine().random_generator is not GenyalEngine().random_generator
+    assert Individual().random_generator is not Individual().random_generator
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.create_population(4, 4, GeneFactory(random_generator.random), 0.5)
+    assert all(member.random_generator is random_generator for member in engine.population)
+    stranger = Individual([0.0] * 4, 0.5, GeneFactory(random_generator.random),
+                          random_generator=Random(0))
+    stranger_generator = stranger.random_generator
+    child = engine.mutate(engine.crossover(stranger, engine.fittest))
+    assert stranger.random_generator is stranger_generator
+    assert child.random_generator is random_generator
+
+
+def test_tournament_selection_returns_references(random_generator: Random) -> None:
+    population = Individual.create(10, 2, GeneFactory(random_generator.random))
+    for individual in population:
+        individual.fitness = random_generator.random()
+    winner = tournament_selection(population, random_generator)
+    assert any(winner is individual for individual in population)
+
+
+@pytest.mark.parametrize("sort_population", [True, False])
+def test_steady_state_engine(sort_population: bool, ascii_gene_factory: GeneFactory[str],
+                             random_word: str, random_generator: Random, seed: int) -> None:
+    engine = GenyalEngine(random_generator, match_word_fitness, terminating_function=exact_match)
+    engine.sort_population = sort_population
+    engine.steady_state_size = 4
+    engine.fitness_function_args = (random_word,)
+    ascii_gene_factory.generator_args = (random_generator,)
+    engine.create_population(32, len(random_word), ascii_gene_factory, 0.5)
+    best_fitness = engine.fittest.fitness
+    while not exact_match(engine, random_word):
+        engine.step()
+        assert len(engine.population) == 32
+        assert engine.fittest.fitness >= best_fitness, f"Test failed with seed: {seed}"
+        assert list(engine.fitness) == [member.fitness for member in engine.population]
+        best_fitness = engine.fittest.fitness
+    if sort_population:
+        assert list(engine.fitness) == sorted(engine.fitness)
+
+
+def test_steady_state_evolve_matches_steps(seed: int) -> None:
+    def run(evolve: bool) -> GenyalEngine:
+        rng = Random(seed)
+        engine = GenyalEngine(rng, lambda genes: sum(genes), evaluator=SerialEvaluator())
+        engine.steady_state_size = 3
+        engine.create_population(16, 5, GeneFactory(rng.random), 0.5)
+        if evolve:
+            engine.evolve(10)
+        else:
+            for _ in range(0, 10):
+                engine.step()
+        return engine
+
+    continuous, stepped = run(True), run(False)
+    assert continuous.generation == stepped.generation == 10
+    assert [member.genes for member in continuous.population] == [
+        member.genes for member in stepped.population], f"Test failed with seed: {seed}"
+
+
+def test_steady_state_with_workers(ascii_gene_factory: GeneFactory[str], random_word: str,
+                                   random_generator: Random, seed: int) -> None:
+    with ThreadPoolEvaluator(4) as evaluator:
+        engine = GenyalEngine(random_generator, match_word_fitness,
+                              terminating_function=exact_match, evaluator=evaluator)
+        engine.steady_state_size = 8
+        engine.fitness_function_args = (random_word,)
+        ascii_gene_factory.generator_args = (random_generator,)
+        engine.create_population(32, len(random_word), ascii_gene_factory, 0.5)
+        engine.evolve(random_word)
+    assert "".join(engine.fittest.genes) == random_word, f"Test failed with seed: {seed}"
+
+
+@pytest.mark.parametrize("sort_population", [True, False])
+def test_elitism(sort_population: bool, random_generator: Random, seed: int) -> None:
+    evaluated = []
+
+    def counting_fitness(genes: list[float]) -> float:
+        evaluated.append(genes)
+        return sum(genes)
+
+    engine = GenyalEngine(random_generator, counting_fitness)
+    engine.sort_population = sort_population
+    engine.elitism = 3
+    engine.create_population(20, 4, GeneFactory(random_generator.random), 0.5)
+    for _ in range(0, 10):
+        elites = engine.elites(3)
+        engine.step()
+        assert len(engine.population) == 20
+        for elite in elites:
+            assert any(elite is member for member in engine.population), \
+                f"Test failed with seed: {seed}"
+        assert engine.fittest.fitness >= elites[0].fitness
+    assert len(evaluated) == 20 + 10 * 17
+
+
+@pytest.mark.parametrize("strategy", [plus_selection, comma_selection])
+@pytest.mark.parametrize("dtype", [None, "float64"])
+def test_survivor_selection(strategy, dtype, random_generator: Random, seed: int) -> None:
+    if dtype is not None:
+        pytest.importorskip("numpy")
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.survivor_selection = strategy
+    engine.offspring_size = 30
+    engine.create_population(10, 4, GeneFactory(random_generator.random), 0.5, dtype=dtype)
+    best_fitness = engine.fittest.fitness
+    for _ in range(0, 10):
+        engine.step()
+        assert len(engine.population) == 10
+        if strategy is plus_selection:
+            assert engine.fittest.fitness >= best_fitness, f"Test failed with seed: {seed}"
+        best_fitness = engine.fittest.fitness
+    assert list(engine.fitness) == sorted(engine.fitness)
+
+
 @pytest.fixture
 def match_word_engine(random_generator: Random) -> GenyalEngine:
     return GenyalEngine(random_generator, match_word_fitness, terminating_function=exact_match)
@@ -76,15 +250,5 @@ def mutation_rate(random_generator: Random) -> float:
     return random_generator.random()
 
 
-@pytest.fixture()
-def random_generator(seed: int) -> Random:
-    return Random(seed)
-
-
-@pytest.fixture()
-def seed() -> int:
-    return randrange(-sys.maxsize, sys.maxsize)
-
-
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import string
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.evaluation import (BatchFitness, Evaluator, ProcessPoolEvaluator, SerialEvaluator,
+                               ThreadPoolEvaluator, batch_fitness)
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from helpers import TARGET, match_word_fitness
+
+
+@pytest.mark.parametrize("evaluator", [SerialEvaluator(), ThreadPoolEvaluator(4),
+                                       ProcessPoolEvaluator(2, chunk_size=3)])
+def test_evaluators_match_serial_run(evaluator: Evaluator, seed: int) -> None:
+    expected = run_engine(SerialEvaluator(), seed)
+    with evaluator:
+        actual = run_engine(evaluator, seed)
+    assert [(i.fitness, i.genes) for i in actual.population] == [
+        (i.fitness, i.genes) for i in expected.population], f"Test failed with seed: {seed}"
+    assert actual.fittest.genes == expected.fittest.genes, f"Test failed with seed: {seed}"
+
+
+@pytest.mark.parametrize("evaluator", [ThreadPoolEvaluator(2), ProcessPoolEvaluator(2)])
+def test_already_evaluated_are_skipped(evaluator: Evaluator,
+                                       ascii_gene_factory: GeneFactory[str]) -> None:
+    individuals = Individual.create(8, len(TARGET), ascii_gene_factory)
+    individuals[0].fitness = -1
+    with evaluator:
+        evaluator.evaluate(individuals, match_word_fitness, TARGET)
+    assert individuals[0].fitness == -1
+    for individual in individuals[1:]:
+        assert individual.fitness == match_word_fitness(individual.genes, TARGET)
+
+
+def test_individuals_without_genes() -> None:
+    with ProcessPoolEvaluator(1) as evaluator, pytest.raises(GeneticsError):
+        evaluator.evaluate([Individual()], match_word_fitness, TARGET)
+
+
+def test_incomplete_evaluators_cant_be_created() -> None:
+    class NoEvaluation(Evaluator):
+        pass
+
+    with pytest.raises(TypeError):
+        NoEvaluation()
+
+
+@pytest.mark.parametrize("evaluator", [SerialEvaluator(), ThreadPoolEvaluator(2)])
+def test_batch_fitness_is_called_once_per_generation(evaluator: Evaluator, seed: int) -> None:
+    calls = []
+
+    @batch_fitness
+    def batch_match_word_fitness(genomes: List[List[str]], target: str) -> List[float]:
+        calls.append(len(genomes))
+        return [match_word_fitness(genes, target) for genes in genomes]
+
+    expected = run_engine(SerialEvaluator(), seed)
+    actual = run_engine(evaluator, seed, batch_match_word_fitness)
+    assert calls == [16] * 6
+    assert [(i.fitness, i.genes) for i in actual.population] == [
+        (i.fitness, i.genes) for i in expected.population], f"Test failed with seed: {seed}"
+
+
+def test_array_batch_fitness(random_generator: Random) -> None:
+    numpy = pytest.importorskip("numpy")
+    fitness_function = batch_fitness(lambda genomes: genomes.sum(axis=1), as_array=True,
+                                     dtype=numpy.float64)
+    individuals = Individual.create(10, 4, GeneFactory(random_generator.random))
+    SerialEvaluator().evaluate(individuals, fitness_function)
+    for individual in individuals:
+        assert individual.fitness == pytest.approx(sum(individual.genes))
+
+
+def test_batch_fitness_size_mismatch(ascii_gene_factory: GeneFactory[str]) -> None:
+    individuals = Individual.create(4, len(TARGET), ascii_gene_factory)
+    with pytest.raises(GeneticsError):
+        SerialEvaluator().evaluate(individuals, BatchFitness(lambda genomes: [0]))
+
+
+def run_engine(evaluator: Evaluator, seed: int, fitness_function=match_word_fitness) \
+        -> GenyalEngine:
+    rng = Random(seed)
+    factory = GeneFactory(generator=lambda r: r.choice(string.ascii_lowercase))
+    engine = GenyalEngine(rng, fitness_function, evaluator=evaluator)
+    engine.factory_generator_args = (rng,)
+    factory.generator_args = (rng,)
+    engine.fitness_function_args = (TARGET,)
+    engine.create_population(16, len(TARGET), factory, 0.5)
+    engine.evolve(5)
+    return engine
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,8 @@ from random import Random, randrange
 
 import pytest
 
-from genyal.genotype import GeneFactory
+from genyal.genotype import (AlphabetFactory, BooleanFactory, FloatFactory, GeneFactory,
+                             IntegerFactory, _NumpyFactory)
 
 
 @pytest.mark.repeat(8)
@@ -41,6 +42,65 @@ def test_ascii_factory(seed: int) -> None:
     assert factory.make() == gene, f"Test failed with seed: {seed}"
 
 
+@pytest.mark.repeat(8)
+def test_make_many(seed: int) -> None:
+    factory = GeneFactory(lambda rng: rng.choice(string.ascii_lowercase), Random(seed))
+    expected = GeneFactory(lambda rng: rng.choice(string.ascii_lowercase), Random(seed))
+    assert factory.make_many(16) == [expected.make() for _ in range(0, 16)], \
+        f"Test failed with seed: {seed}"
+    assert factory.make_many(0) == []
+    factory.batch_generator = lambda count, rng: "x" * count
+    assert factory.make_many(3) == ["x", "x", "x"]
+
+
+def test_make_array() -> None:
+    numpy = pytest.importorskip("numpy")
+    factory = GeneFactory(lambda: 1, batch_generator=lambda count: numpy.ones(count))
+    genes = factory.make_array(5, numpy.int8)
+    assert genes.dtype == numpy.int8 and genes.tolist() == [1] * 5
+    assert factory.make_many(2) == [1.0, 1.0]
+    assert type(factory.make_many(1)[0]) is float
+    assert GeneFactory(lambda: "a").make_array(3, "<U1").tolist() == ["a", "a", "a"]
+
+
+@pytest.mark.repeat(8)
+def test_numpy_factories(seed: int) -> None:
+    numpy = pytest.importorskip("numpy")
+    seed = abs(seed)
+    integers = IntegerFactory(-3, 3, seed).make_array(1000)
+    assert integers.min() == -3 and integers.max() == 3, f"Test failed with seed: {seed}"
+    floats = FloatFactory(-1, 1, seed).make_array(1000)
+    assert floats.dtype == numpy.float64 and -1 <= floats.min() and floats.max() < 1
+    booleans = BooleanFactory(0.25, seed).make_many(1000)
+    assert all(type(gene) is bool for gene in booleans)
+    assert 150 < sum(booleans) < 350, f"Test failed with seed: {seed}"
+    letters = AlphabetFactory("ab", seed).make_many(100)
+    assert set(letters) == {"a", "b"}, f"Test failed with seed: {seed}"
+
+
+@pytest.mark.repeat(8)
+def test_numpy_factories_are_reproducible(seed: int) -> None:
+    pytest.importorskip("numpy")
+    seed = abs(seed)
+    factory = AlphabetFactory(random_generator=seed)
+    genes = [factory.make() for _ in range(0, AlphabetFactory.BUFFER_SIZE)]
+    assert genes == AlphabetFactory(random_generator=seed).make_many(len(genes)), \
+        f"Test failed with seed: {seed}"
+    assert IntegerFactory(0, 9, seed).make_many(10) == IntegerFactory(0, 9, seed).make_many(10)
+    assert isinstance(factory, GeneFactory)
+    assert factory.generator() in string.ascii_lowercase
+
+
+def test_numpy_factories_must_draw() -> None:
+    pytest.importorskip("numpy")
+
+    class NoDraw(_NumpyFactory[int]):
+        pass
+
+    with pytest.raises(TypeError):
+        NoDraw()
+
+
 @pytest.fixture()
 def seed() -> int:
     return randrange(-sys.maxsize, sys.maxsize)
@@ -13,8 +13,9 @@ from typing import List, Tuple
 
 import pytest
 
+from genyal.core import GeneticsError
 from genyal.genotype import GeneFactory
-from genyal.individuals import Individual
+from genyal.individuals import Individual, fitness_key
 
 
 def test_creation_with_characters(str_gene_factory: GeneFactory[str]):
@@ -27,6 +28,18 @@ def test_creation_with_characters(str_gene_factory: GeneFactory[str]):
             assert gene in string.ascii_lowercase
 
 
+def test_creation_with_seeds(str_gene_factory: GeneFactory[str]):
+    seeds = ["cat", list("dog"), "bat"]
+    individuals = Individual.create(4, 3, str_gene_factory, 0.2, "arg", seeds=iter(seeds))
+    assert [individual.genes for individual in individuals[:3]] == [list(seed) for seed in seeds]
+    assert len(individuals) == 4 and len(individuals[3].genes) == 3
+    assert all(individual.mutation_rate == 0.2 for individual in individuals)
+    assert all(individual.factory_args == ("arg",) for individual in individuals)
+    assert len(Individual.create(2, 3, str_gene_factory, seeds=seeds)) == 2
+    with pytest.raises(GeneticsError):
+        Individual.create(2, 4, str_gene_factory, seeds=seeds)
+
+
 def test_word_guess(str_gene_factory: GeneFactory[str]):
     individuals = Individual.create(number_of_individuals=100000, number_of_genes=3,
                                     gene_factory=str_gene_factory)
@@ -60,6 +73,24 @@ def test_mutation():
     assert mutated_i.genes == list("sbsd")
 
 
+def test_individuals_are_slotted():
+    individual = Individual[str](list("abc"))
+    assert not hasattr(individual, "__dict__")
+    with pytest.raises(AttributeError):
+        individual.unknown_attribute = 1
+
+
+def test_sorting_by_fitness(rng: Random):
+    individuals = [Individual([gene]) for gene in range(0, 50)]
+    for individual in individuals:
+        individual.fitness = rng.random()
+    by_key = sorted(individuals, key=fitness_key)
+    assert by_key == sorted(individuals)
+    assert [i.fitness for i in by_key] == sorted(i.fitness for i in individuals)
+    assert by_key[0] < by_key[-1] and by_key[-1] >= by_key[0]
+    assert not by_key[0] < "not an individual"
+
+
 @pytest.fixture()
 def couple() -> Tuple[Individual, Individual]:
     c = (Individual(), Individual())
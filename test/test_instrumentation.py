@@ -0,0 +1,79 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import io
+import json
+import unittest
+from random import Random
+from typing import Optional
+
+import pytest
+
+from genyal.cache import FitnessCache
+from genyal.engine import GenyalEngine
+from genyal.evaluation import batch_fitness
+from genyal.genotype import GeneFactory
+from genyal.instrumentation import COUNTERS, PHASES, Instrumentation
+
+
+@pytest.mark.parametrize("steady_state_size", [None, 3])
+def test_hooks_and_counters(steady_state_size: Optional[int], random_generator: Random) -> None:
+    events = []
+    stream = io.StringIO()
+    instrumentation = Instrumentation(
+        on_generation_start=lambda engine: events.append(("start", engine.generation)),
+        on_generation_end=lambda engine, record: events.append(("end", record["generation"])),
+        on_evaluate=lambda engine, individuals: events.append(("evaluate", len(individuals))),
+        json_lines=stream)
+    engine = GenyalEngine(random_generator, lambda genes: round(sum(genes)))
+    engine.fitness_cache = FitnessCache()
+    engine.copy_parents = True
+    engine.steady_state_size = steady_state_size
+    engine.create_population(12, 2, GeneFactory(lambda: random_generator.randint(0, 2)), 0.5)
+    engine.instrumentation = instrumentation
+    initial_evaluations = engine.evaluations
+    engine.evolve(4)
+
+    starts = [event for event in events if event[0] == "start"]
+    ends = [event for event in events if event[0] == "end"]
+    assert starts == [("start", generation) for generation in range(0, 4)]
+    assert ends == [("end", generation) for generation in range(1, 5)]
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["generation"] for record in records] == [1, 2, 3, 4]
+    assert records[-1] == instrumentation.last_generation
+    offspring = 12 if steady_state_size is None else steady_state_size
+    totals = instrumentation.as_dict()
+    assert totals["generations"] == 4
+    assert set(totals["phases"]) == set(PHASES) and set(totals["counters"]) == set(COUNTERS)
+    assert totals["counters"]["offspring"] == 4 * offspring
+    assert totals["counters"]["copies"] == 2 * 4 * offspring
+    assert totals["counters"]["evaluations"] + totals["counters"]["cache_hits"] == 4 * offspring
+    assert totals["counters"]["evaluations"] == engine.evaluations - initial_evaluations
+    assert all(seconds >= 0 for seconds in totals["phases"].values())
+    assert totals["phases"]["crossover"] > 0 and totals["phases"]["evaluation"] > 0
+    assert sum(record["counters"]["offspring"] for record in records) == 4 * offspring
+    instrumentation.reset()
+    assert instrumentation.as_dict()["generations"] == 0
+
+
+def test_pool_phases(random_generator: Random) -> None:
+    numpy = pytest.importorskip("numpy")
+    instrumentation = Instrumentation()
+    engine = GenyalEngine(random_generator,
+                          batch_fitness(lambda genomes: genomes.sum(axis=1), as_array=True))
+    engine.instrumentation = instrumentation
+    engine.create_population(16, 4, GeneFactory(random_generator.random), 0.5,
+                             dtype=numpy.float64)
+    engine.evolve(3)
+    totals = instrumentation.as_dict()
+    assert totals["counters"]["offspring"] == totals["counters"]["evaluations"] == 3 * 16
+    for phase in ("selection", "crossover", "mutation", "evaluation", "sorting"):
+        assert totals["phases"][phase] > 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.islands import IslandModel, complete_topology, ring_topology
+
+
+def one_max(genes: List[int]) -> float:
+    return sum(genes)
+
+
+def one_max_engine(random_generator: Random) -> GenyalEngine:
+    engine = GenyalEngine(random_generator, one_max)
+    factory = GeneFactory(random_generator.randint, 0, 1)
+    engine.create_population(20, 16, factory, 0.9)
+    return engine
+
+
+def failing_engine(random_generator: Random) -> GenyalEngine:
+    raise GeneticsError("This island can't be created.")
+
+
+def test_topologies() -> None:
+    assert ring_topology(3) == [[2], [0], [1]]
+    assert ring_topology(1) == [[]]
+    assert complete_topology(3) == [[1, 2], [0, 2], [0, 1]]
+
+
+@pytest.mark.repeat(2)
+def test_runs_are_reproducible(seed: int) -> None:
+    with IslandModel(one_max_engine, islands=3, migration_interval=4, seed=seed,
+                     topology=complete_topology, processes=False) as serial_model:
+        serial_model.evolve(12)
+    with IslandModel(one_max_engine, islands=3, migration_interval=4, seed=seed,
+                     topology=complete_topology) as parallel_model:
+        parallel_model.evolve(12)
+    assert serial_model.generation == parallel_model.generation == 12
+    assert serial_model.fittest.genes == parallel_model.fittest.genes
+    assert [i.genes for i in serial_model.islands_fittest] == [
+        i.genes for i in parallel_model.islands_fittest], f"Test failed with seed: {seed}"
+    assert serial_model.fittest.fitness == max(i.fitness for i in serial_model.islands_fittest)
+
+
+def test_migrants_reach_neighbours(seed: int) -> None:
+    with IslandModel(one_max_engine, islands=2, migration_interval=1, migrants=3, seed=seed,
+                     processes=False) as model:
+        model.step()
+        assert model.generation == 1
+        assert len(model.islands_fittest) == 2 and len(model.seeds) == 2
+        assert model.fittest.fitness == one_max(model.fittest.genes)
+
+
+def test_island_errors() -> None:
+    with pytest.raises(GeneticsError):
+        IslandModel(failing_engine, islands=2)
+    with pytest.raises(GeneticsError):
+        IslandModel(one_max_engine, islands=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
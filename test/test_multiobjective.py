@@ -0,0 +1,159 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+import unittest
+from pathlib import Path
+from random import Random
+from typing import List, Tuple
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.evaluation import AsyncEvaluator, SerialEvaluator, batch_fitness
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from genyal.islands import IslandModel
+from genyal.multiobjective import (MultiObjective, crowding_distance, dominates,
+                                   fast_non_dominated_sort, non_dominated_sort_2d, pareto_front,
+                                   rank_fitness)
+
+
+def schaffer(genes: List[float]) -> Tuple[float, float]:
+    """Schaffer's problem N.1 (negated): the Pareto front is every x in [0, 2]."""
+    x = genes[0]
+    return -x * x, -(x - 2) ** 2
+
+
+def nsga2_engine(random_generator: Random) -> GenyalEngine:
+    engine = GenyalEngine(random_generator, schaffer)
+    engine.multi_objective = MultiObjective()
+    engine.survivor_selection = engine.multi_objective.survivors
+    engine.selection_args = [2]
+    engine.create_population(40, 1, GeneFactory(lambda: random_generator.uniform(-10, 10)), 0.5)
+    return engine
+
+
+def test_dominates() -> None:
+    assert dominates((1, 2), (1, 1)) and dominates((2, 2), (1, 1))
+    assert not dominates((1, 1), (1, 1)) and not dominates((2, 0), (1, 1))
+
+
+def test_fast_non_dominated_sort() -> None:
+    objectives = [(1, 5), (2, 4), (0, 0), (1, 3), (3, 1), (1, 5), (0, 4)]
+    assert fast_non_dominated_sort(objectives) == [[0, 1, 4, 5], [3, 6], [2]]
+    assert fast_non_dominated_sort([(1, 1, 1), (0, 2, 0), (0, 0, 0)]) == [[0, 1], [2]]
+    assert fast_non_dominated_sort([]) == []
+
+
+@pytest.mark.repeat(16)
+def test_2d_sort_matches_fast_sort(seed: int) -> None:
+    random_generator = Random(seed)
+    objectives = [(random_generator.randint(0, 6), random_generator.randint(0, 6))
+                  for _ in range(0, 60)]
+    assert non_dominated_sort_2d(objectives) == fast_non_dominated_sort(objectives), \
+        f"Test failed with seed: {seed}"
+
+
+def test_crowding_distance() -> None:
+    objectives = [(0, 4), (1, 3), (3, 1), (4, 0), (9, 9)]
+    distances = crowding_distance(objectives, [0, 1, 2, 3])
+    assert distances[0] == distances[3] == math.inf
+    assert distances[1] == pytest.approx(3 / 4 + 3 / 4)
+    assert distances[2] == pytest.approx(3 / 4 + 3 / 4)
+    assert crowding_distance(objectives, [4]) == [math.inf]
+    assert pareto_front(objectives) == [4]
+    assert rank_fitness(0, 0) < rank_fitness(0, 1) < rank_fitness(0, math.inf) == 0.5
+    assert rank_fitness(1, math.inf) < rank_fitness(0, 0)
+
+
+@pytest.mark.repeat(4)
+def test_nsga2_engine(seed: int) -> None:
+    engine = nsga2_engine(Random(seed))
+    assert all(member.objectives == schaffer(member.genes) for member in engine.population)
+    engine.evolve(30)
+    front = engine.pareto_front
+    assert len(front) == 40, f"Test failed with seed: {seed}"
+    assert all(-0.1 <= member.genes[0] <= 2.1 for member in front), f"Test failed with seed: {seed}"
+    assert max(member.genes[0] for member in front) - min(
+        member.genes[0] for member in front) > 1.5, f"Test failed with seed: {seed}"
+
+
+@pytest.mark.parametrize("evaluator", [SerialEvaluator(), AsyncEvaluator()])
+@pytest.mark.parametrize("as_array", [False, True])
+def test_batch_multi_objective_engine(evaluator, as_array: bool, seed: int) -> None:
+    numpy = pytest.importorskip("numpy") if as_array else None
+    random_generator = Random(seed)
+
+    @batch_fitness(as_array=as_array)
+    def batch_schaffer(genomes):
+        if as_array:
+            # One row of objectives per genome.
+            return -(genomes - numpy.array([0, 2])) ** 2
+        return [schaffer(genes) for genes in genomes]
+
+    engine = GenyalEngine(random_generator, batch_schaffer, evaluator=evaluator)
+    engine.multi_objective = MultiObjective()
+    engine.survivor_selection = engine.multi_objective.survivors
+    engine.create_population(20, 1, GeneFactory(lambda: random_generator.uniform(-10, 10)), 0.5)
+    engine.evolve(3)
+    assert all(member.objectives == pytest.approx(schaffer(member.genes))
+               for member in engine.population), f"Test failed with seed: {seed}"
+
+
+def test_resume_multi_objective_engine(tmp_path: Path, seed: int) -> None:
+    path = tmp_path / "engine.ckpt"
+    original = nsga2_engine(Random(seed))
+    original.evolve(5)
+    original.save_checkpoint(path)
+    original.evolve(10)
+
+    resumed = GenyalEngine(Random(), schaffer)
+    resumed.multi_objective = MultiObjective()
+    resumed.survivor_selection = resumed.multi_objective.survivors
+    resumed.selection_args = [2]
+    resumed.resume(path, GeneFactory(lambda: resumed.random_generator.uniform(-10, 10)))
+    assert all(member.objectives == schaffer(member.genes) for member in resumed.population)
+    resumed.evolve(10)
+    assert [(member.fitness, member.genes) for member in resumed.population] == [
+        (member.fitness, member.genes) for member in original.population], \
+        f"Test failed with seed: {seed}"
+
+
+def test_multi_objective_migration(seed: int) -> None:
+    engine, source = nsga2_engine(Random(seed)), nsga2_engine(Random(seed + 1))
+    engine.immigrate(source.elites(4))
+    assert all(member.objectives == schaffer(member.genes) for member in engine.population)
+    stranger = Individual([1.0])
+    stranger.fitness = -0.5
+    with pytest.raises(GeneticsError):
+        engine.immigrate([stranger])
+    with IslandModel(nsga2_engine, islands=2, migration_interval=2, seed=seed,
+                     processes=False) as model:
+        model.evolve(6)
+    assert model.generation == 6
+    assert model.fittest.objectives == schaffer(model.fittest.genes)
+
+
+def test_invalid_multi_objective_engines() -> None:
+    engine = GenyalEngine(fitness_function=lambda genes: 1.0)
+    engine.multi_objective = MultiObjective()
+    with pytest.raises(GeneticsError):
+        engine.create_population(4, 2, GeneFactory(lambda: 0))
+    engine = GenyalEngine(fitness_function=schaffer)
+    with pytest.raises(GeneticsError):
+        assert engine.pareto_front
+    engine.multi_objective = MultiObjective()
+    engine.create_population(4, 1, GeneFactory(lambda: 0.0))
+    engine.steady_state_size = 2
+    with pytest.raises(GeneticsError):
+        engine.step()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import string
+import unittest
+from copy import copy
+from random import Random
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.evaluation import (AsyncEvaluator, Evaluator, ProcessPoolEvaluator, SerialEvaluator,
+                               ThreadPoolEvaluator, batch_fitness)
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+from genyal.population import GenePool, PooledIndividual
+from helpers import exact_match, match_word_fitness
+
+numpy = pytest.importorskip("numpy")
+
+
+def row_sum(genes) -> float:
+    assert isinstance(genes, numpy.ndarray)
+    return float(genes.sum())
+
+
+def test_pool_creation(float_gene_factory: GeneFactory[float]) -> None:
+    pool = GenePool.create(10, 4, float_gene_factory, numpy.float32, 0.1)
+    assert len(pool) == 10 and pool.number_of_genes == 4
+    assert pool.genes.shape == (10, 4) and pool.genes.dtype == numpy.float32
+    assert pool.genes.flags.c_contiguous
+    members = pool.individuals()
+    assert all(isinstance(member, PooledIndividual) for member in members)
+    assert [member.row for member in members] == list(range(0, 10))
+    for member in members:
+        assert len(member) == 4
+        assert member.fitness is None
+        assert member.mutation_rate == 0.1
+        assert member.genes == pool.genes[member.row].tolist()
+
+
+def test_pool_creation_with_seeds(float_gene_factory: GeneFactory[float]) -> None:
+    seeds = [[0.5, 0.25], [1.0, 2.0]]
+    pool = GenePool.create(5, 2, float_gene_factory, numpy.float64, seeds=seeds)
+    assert pool.genes[:2].tolist() == seeds
+    assert ((-1 <= pool.genes[2:]) & (pool.genes[2:] <= 1)).all()
+    assert GenePool.create(1, 2, float_gene_factory, numpy.float64, seeds=seeds).genes.tolist() \
+        == seeds[:1]
+
+
+def test_members_are_views(float_gene_factory: GeneFactory[float]) -> None:
+    pool = GenePool.create(3, 2, float_gene_factory, numpy.float64)
+    member = pool[1]
+    member.genes = [1.0, 2.0]
+    member.fitness = 5
+    assert pool.genes[1].tolist() == [1.0, 2.0]
+    assert pool.fitness[1] == 5 and pool[1].fitness == 5.0
+    with pytest.raises(ValueError):
+        member.gene_view[0] = 3.0
+    offspring = copy(member)
+    assert type(offspring) is Individual
+    offspring.genes = [7.0, 7.0]
+    assert pool.genes[1].tolist() == [1.0, 2.0]
+
+
+def test_sort_and_pack() -> None:
+    pool = GenePool([[3, 3], [1, 1], [2, 2]], fitness=[3, 1, 2])
+    assert pool.sorted().genes.tolist() == [[1, 1], [2, 2], [3, 3]]
+    assert pool.sorted().fitness.tolist() == [1, 2, 3]
+    packed = pool.from_individuals([Individual([5, 6]), pool[0]])
+    assert packed.genes.tolist() == [[5, 6], [3, 3]]
+    assert packed[0].fitness is None and packed[1].fitness == 3
+    offspring = pool.like([[7, 7], [8, 8]])
+    offspring[1].fitness = 8
+    mixed = pool.from_individuals([offspring[1], pool[2], Individual([5, 6]), offspring[0],
+                                   pool[0]])
+    assert mixed.genes.tolist() == [[8, 8], [2, 2], [5, 6], [7, 7], [3, 3]]
+    assert numpy.array_equal(mixed.fitness, [8, 2, numpy.nan, numpy.nan, 3], equal_nan=True)
+    with pytest.raises(GeneticsError):
+        GenePool([1, 2, 3])
+
+
+@pytest.mark.repeat(8)
+def test_word_match_with_pool(random_generator: Random, seed: int) -> None:
+    target = "owo"
+    factory = GeneFactory(lambda: random_generator.choice(string.ascii_lowercase))
+    engine = GenyalEngine(random_generator, match_word_fitness, terminating_function=exact_match)
+    engine.fitness_function_args = (target,)
+    engine.create_population(16, len(target), factory, 0.9, dtype="<U1")
+    assert engine.gene_pool is not None
+    if seed % 2 == 0:
+        engine.batch_crossover_strategy = None
+    engine.evolve(target)
+    assert "".join(engine.fittest.genes) == target, f"Test failed with seed: {seed}"
+    assert engine.population[-1].pool is engine.gene_pool
+
+
+def test_array_batch_fitness_on_pool(float_gene_factory: GeneFactory[float]) -> None:
+    received = []
+
+    @batch_fitness(as_array=True)
+    def sphere(genomes):
+        received.append(genomes)
+        return -(genomes ** 2).sum(axis=1)
+
+    engine = GenyalEngine(fitness_function=sphere)
+    engine.create_population(20, 5, float_gene_factory, dtype=numpy.float64)
+    engine.evolve(3)
+    assert [genomes.shape for genomes in received] == [(20, 5)] * 4
+    assert engine.gene_pool.fitness.tolist() == sorted(engine.gene_pool.fitness.tolist())
+    assert engine.fittest.fitness == engine.gene_pool.fitness.max()
+
+
+@pytest.mark.parametrize("evaluator", [SerialEvaluator(), ThreadPoolEvaluator(2),
+                                       ProcessPoolEvaluator(2), AsyncEvaluator()])
+def test_pool_fitness_gets_rows_on_every_evaluator(evaluator: Evaluator,
+                                                   random_generator: Random) -> None:
+    pool = GenePool.create(12, 6, GeneFactory(lambda: random_generator.randint(0, 1)),
+                           numpy.int64, 0.1)
+    members = pool.individuals()
+    with evaluator:
+        evaluator.evaluate(members[:8], row_sum)
+        submitted = [evaluator.submit(member, row_sum).result() for member in members[8:]]
+    expected = pool.genes.sum(axis=1).tolist()
+    assert [member.fitness for member in members[:8]] == expected[:8]
+    assert submitted == expected[8:]
+
+
+@pytest.mark.repeat(4)
+def test_pool_evolution_is_reproducible(seed: int) -> None:
+    def run() -> GenyalEngine:
+        rng = Random(seed)
+        engine = GenyalEngine(rng, batch_fitness(lambda genomes: genomes.sum(axis=1),
+                                                 as_array=True))
+        engine.create_population(32, 8, GeneFactory(lambda: rng.randint(0, 9)), 0.9,
+                                 dtype=numpy.int64)
+        engine.evolve(10)
+        return engine
+
+    first, second = run(), run()
+    assert numpy.array_equal(first.gene_pool.genes, second.gene_pool.genes)
+    assert numpy.array_equal(first.gene_pool.fitness, second.gene_pool.fitness)
+
+
+@pytest.fixture
+def float_gene_factory(random_generator: Random) -> GeneFactory[float]:
+    return GeneFactory(lambda: random_generator.uniform(-1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.ranking import best_index, is_sorted, ranking_order, top_indices
+
+
+@pytest.mark.repeat(8)
+def test_ranking_functions(fitness: List[float], seed: int) -> None:
+    expected_order = sorted(range(0, len(fitness)), key=lambda idx: (fitness[idx], idx))
+    assert best_index(fitness) == expected_order[-1], f"Test failed with seed: {seed}"
+    assert top_indices(fitness, 5) == expected_order[:-6:-1], f"Test failed with seed: {seed}"
+    assert [fitness[idx] for idx in ranking_order(fitness)] == sorted(fitness)
+    assert is_sorted(sorted(fitness)) and ranking_order(sorted(fitness)) == list(
+        range(0, len(fitness)))
+    assert top_indices(fitness, 0) == [] and len(top_indices(fitness, 1000)) == len(fitness)
+
+
+@pytest.mark.repeat(8)
+def test_ranking_functions_on_arrays(fitness: List[float], seed: int) -> None:
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array(fitness)
+    assert best_index(array) == best_index(fitness), f"Test failed with seed: {seed}"
+    assert top_indices(array, 5) == top_indices(fitness, 5), f"Test failed with seed: {seed}"
+    assert [fitness[idx] for idx in ranking_order(array)] == sorted(fitness)
+    assert is_sorted(numpy.sort(array)) and not is_sorted(numpy.array([2.0, 1.0]))
+
+
+@pytest.mark.repeat(4)
+def test_unsorted_engine(seed: int) -> None:
+    def run(sort_population: bool) -> GenyalEngine:
+        rng = Random(seed)
+        engine = GenyalEngine(rng, lambda genes: sum(genes))
+        engine.sort_population = sort_population
+        engine.create_population(30, 6, GeneFactory(lambda: rng.randint(0, 9)), 0.8)
+        engine.evolve(5)
+        return engine
+
+    unsorted_engine, sorted_engine = run(False), run(True)
+    assert unsorted_engine.fitness == [member.fitness for member in unsorted_engine.population]
+    assert unsorted_engine.fittest.fitness == max(unsorted_engine.fitness)
+    assert sorted_engine.fitness == sorted(sorted_engine.fitness)
+    elites = unsorted_engine.elites(3)
+    assert [elite.fitness for elite in elites] == sorted(unsorted_engine.fitness)[:-4:-1]
+    assert sorted_engine.elites(3) == sorted_engine.population[:-4:-1]
+
+
+@pytest.fixture
+def fitness(seed: int) -> List[float]:
+    rng = Random(seed)
+    return [float(rng.randint(0, 20)) for _ in range(0, rng.randint(1, 50))]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import unittest
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.streams import RandomStreams
+
+
+@pytest.mark.repeat(8)
+def test_streams_are_reproducible(seed: int) -> None:
+    streams = RandomStreams(seed)
+    first = [streams.random("worker", idx).random() for idx in range(0, 8)]
+    # The stream of a worker doesn't depend on the number of workers or the order of the requests.
+    second = [RandomStreams(seed).random("worker", idx).random() for idx in reversed(range(0, 4))]
+    assert first[:4] == list(reversed(second)), f"Test failed with seed: {seed}"
+    assert len(set(first)) == 8, f"Test failed with seed: {seed}"
+    assert streams.seed("worker", 1) != RandomStreams(seed + 1).seed("worker", 1)
+    assert streams.seed("worker", 1) != streams.seed("island", 1)
+
+
+def test_spawn(seed: int) -> None:
+    streams = RandomStreams(seed)
+    batch = streams.spawn("batch", 3)
+    assert batch.key == ("batch", 3) and batch.entropy == seed
+    assert batch.seed(7) == streams.seed("batch", 3, 7)
+    assert [child.key for child in streams.spawn_many(3, "island")] == [
+        ("island", 0), ("island", 1), ("island", 2)]
+    assert RandomStreams().entropy != RandomStreams().entropy
+    with pytest.raises(GeneticsError):
+        streams.seed(1.5)
+
+
+def test_numpy_streams(seed: int) -> None:
+    pytest.importorskip("numpy")
+    streams = RandomStreams(seed)
+    assert streams.numpy("batch", 0).random() == RandomStreams(seed).numpy("batch", 0).random()
+    assert streams.numpy("batch", 0).random() != streams.numpy("batch", 1).random()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+import statistics
+import unittest
+from itertools import islice
+from random import Random
+
+import pytest
+
+import genyal.engine as engine_module
+import genyal.summary as summary_module
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.summary import GenerationSummary, fitness_statistics
+
+
+@pytest.mark.repeat(16)
+def test_summary_statistics(random_generator: Random, seed: int) -> None:
+    fitness = [random_generator.uniform(-100, 100) for _ in range(0, 50)]
+    summary = GenerationSummary.of(3, fitness, 10, 20, 0.5, 1.5)
+    assert summary.best == max(fitness), f"Test failed with seed: {seed}"
+    assert math.isclose(summary.mean, statistics.fmean(fitness))
+    assert math.isclose(summary.std, statistics.pstdev(fitness))
+    assert summary[4:] == (10, 20, 0.5, 1.5)
+    numpy = pytest.importorskip("numpy")
+    array_summary = GenerationSummary.of(3, numpy.array(fitness), 10, 20, 0.5, 1.5)
+    assert array_summary.best == summary.best
+    assert math.isclose(array_summary.mean, summary.mean)
+    assert math.isclose(array_summary.std, summary.std)
+
+
+@pytest.mark.parametrize("steady_state_size", [None, 4])
+def test_engine_generations(steady_state_size, random_generator: Random, seed: int) -> None:
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes))
+    engine.steady_state_size = steady_state_size
+    engine.create_population(16, 4, GeneFactory(random_generator.random), 0.5)
+    assert engine.evaluations == 16
+    summaries = list(islice(engine.generations(100), 0, 10))
+    assert engine.generation == 10
+    assert [summary.generation for summary in summaries] == list(range(1, 11))
+    assert summaries[-1].best == engine.fittest.fitness, f"Test failed with seed: {seed}"
+    assert math.isclose(summaries[-1].mean, statistics.fmean(engine.fitness))
+    offspring = 16 if steady_state_size is None else steady_state_size
+    assert all(summary.evaluations == offspring for summary in summaries)
+    assert summaries[-1].total_evaluations == engine.evaluations == 16 + 10 * offspring
+    assert all(0 <= summary.seconds <= summary.elapsed for summary in summaries)
+
+
+def test_summaries_reuse_the_cached_statistics(random_generator: Random, monkeypatch) -> None:
+    calls = []
+
+    def counting_statistics(fitness):
+        calls.append(len(fitness))
+        return fitness_statistics(fitness)
+
+    monkeypatch.setattr(engine_module, "fitness_statistics", counting_statistics)
+    monkeypatch.setattr(summary_module, "fitness_statistics", counting_statistics)
+    engine = GenyalEngine(random_generator, lambda genes: sum(genes),
+                          terminating_function=lambda e: e.fitness_std < 0)
+    engine.create_population(16, 4, GeneFactory(random_generator.random), 0.5)
+    summaries = list(islice(engine.generations(), 0, 5))
+    assert summaries[-1].std == engine.fitness_std
+    # Once per generation, shared by the terminating function and the summary.
+    assert len(calls) == 6
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+"Genyal" (c) by Ignacio Slater M.
+"Genyal" is licensed under a
+Creative Commons Attribution 4.0 International License.
+You should have received a copy of the license along with this
+work. If not, see <http://creativecommons.org/licenses/by/4.0/>.
+"""
+import math
+import unittest
+from random import Random
+from typing import List
+
+import pytest
+
+from genyal.core import GeneticsError
+from genyal.engine import GenyalEngine
+from genyal.genotype import GeneFactory
+from genyal.individuals import Individual
+
+numpy = pytest.importorskip("numpy")
+
+from genyal.surrogate import KNNSurrogate, RidgeSurrogate, Surrogate  # noqa: E402
+
+
+def linear_fitness(genes: List[float]) -> float:
+    return 3 * genes[0] - 2 * genes[1] + 1
+
+
+def sphere_fitness(genes: List[float]) -> float:
+    return -sum(gene * gene for gene in genes)
+
+
+@pytest.mark.repeat(4)
+def test_ridge_surrogate(random_generator: Random, seed: int) -> None:
+    surrogate = RidgeSurrogate(alpha=1e-6, min_samples=10)
+    training = random_individuals(random_generator, 20, 2)
+    for individual in training:
+        individual.fitness = linear_fitness(individual.genes)
+    assert not surrogate.trained
+    surrogate.learn(training)
+    assert surrogate.trained and surrogate.samples == 20
+    tests = random_individuals(random_generator, 5, 2)
+    assert surrogate.predict(tests) == pytest.approx(
+        [linear_fitness(individual.genes) for individual in tests], abs=1e-4), \
+        f"Test failed with seed: {seed}"
+
+
+def test_knn_surrogate(random_generator: Random) -> None:
+    surrogate = KNNSurrogate(neighbours=3, min_samples=4, max_samples=8)
+    training = random_individuals(random_generator, 12, 3)
+    for individual in training:
+        individual.fitness = sphere_fitness(individual.genes)
+    surrogate.learn(training)
+    assert surrogate.samples == 8
+    # Only the 8 most recent samples are kept, and a known genome is predicted exactly.
+    assert surrogate.predict(training[-2:]) == pytest.approx(
+        [individual.fitness for individual in training[-2:]])
+    with pytest.raises(GeneticsError):
+        surrogate.predict([Individual(list("abc"))])
+    with pytest.raises(GeneticsError):
+        KNNSurrogate(fraction=0)
+
+
+def test_surrogates_must_implement_the_model() -> None:
+    class Untrainable(Surrogate):
+        def _predict(self, genomes):
+            return numpy.zeros(len(genomes))
+
+    with pytest.raises(TypeError):
+        Surrogate()
+    with pytest.raises(TypeError):
+        Untrainable()
+
+
+def test_screening(random_generator: Random) -> None:
+    surrogate = RidgeSurrogate(alpha=1e-6, fraction=0.25, min_samples=10)
+    training = random_individuals(random_generator, 20, 2)
+    for individual in training:
+        individual.fitness = linear_fitness(individual.genes)
+    surrogate.learn(training)
+    offspring = random_individuals(random_generator, 8, 2)
+    screening = surrogate.screen(offspring + training[:2])
+    assert len(screening.selected) == 2 and len(screening.deferred) == 6
+    assert min(screening.predictions) >= max(screening.estimates)
+    for individual in screening.selected:
+        individual.fitness = linear_fitness(individual.genes)
+    surrogate.update(screening)
+    floor = min(individual.fitness for individual in screening.selected)
+    assert all(individual.fitness <= floor for individual in screening.deferred)
+    assert surrogate.evaluations_saved == 6 and surrogate.predictions == 2
+    assert surrogate.mean_absolute_error < 1e-3
+    surrogate.reset_statistics()
+    assert math.isnan(surrogate.mean_absolute_error) and math.isnan(surrogate.correlation)
+
+
+@pytest.mark.parametrize("dtype", [None, numpy.float64])
+def test_engine_with_surrogate(dtype, random_generator: Random, seed: int) -> None:
+    engine = GenyalEngine(random_generator, sphere_fitness)
+    engine.surrogate = KNNSurrogate(fraction=0.5, min_samples=32)
+    engine.create_population(32, 4, GeneFactory(lambda: random_generator.uniform(-5, 5)), 0.8,
+                             dtype=dtype)
+    assert engine.evaluations == 32 and engine.surrogate.trained
+    engine.evolve(10)
+    assert engine.evaluations == 32 + 10 * 16
+    assert engine.surrogate.evaluations_saved == 10 * 16
+    assert engine.surrogate.predictions == 10 * 16
+    assert engine.surrogate.correlation > 0, f"Test failed with seed: {seed}"
+    assert engine.fittest.fitness == sphere_fitness(engine.fittest.genes)
+
+
+def random_individuals(random_generator: Random, count: int, genes: int) -> List[Individual]:
+    return [Individual([random_generator.uniform(-5, 5) for _ in range(0, genes)])
+            for _ in range(0, count)]
+
+
+if __name__ == '__main__':
+    unittest.main()